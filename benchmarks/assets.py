@@ -0,0 +1,57 @@
+"""Benchmark the size of the quiz assets added to pages, with and without minification.
+
+Prints the size of the bundled CSS, JavaScript and confetti library as shipped,
+minified, and gzip-compressed as a web server would send them, together with
+the time it takes to minify them. The minified assets are made once per build.
+
+Usage:
+    python benchmarks/assets.py [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import timeit
+
+from mkdocs_quiz.minify import minify_css, minify_js
+from mkdocs_quiz.plugin import confetti_content, js_content, style_content
+
+
+def main() -> None:
+    """Run the benchmark and print sizes and timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    assets = {
+        "quiz.css": (style_content, minify_css(style_content)),
+        "quiz.js": (js_content, minify_js(js_content)),
+        "js-confetti.browser.js": (confetti_content, confetti_content),
+    }
+    assets["total per page (inline)"] = (
+        "".join(original for original, _minified in assets.values()),
+        "".join(minified for _original, minified in assets.values()),
+    )
+
+    print(f"  {'':<26} {'original':>10} {'minified':>10} {'gzip':>8} {'min+gzip':>9}")
+    for name, (original, minified) in assets.items():
+        sizes = [
+            len(original.encode("utf-8")),
+            len(minified.encode("utf-8")),
+            len(gzip.compress(original.encode("utf-8"))),
+            len(gzip.compress(minified.encode("utf-8"))),
+        ]
+        print(f"  {name:<26} {sizes[0]:>10,} {sizes[1]:>10,} {sizes[2]:>8,} {sizes[3]:>9,}")
+
+    timings = {
+        "minify quiz.css": lambda: minify_css(style_content),
+        "minify quiz.js": lambda: minify_js(js_content),
+    }
+    for name, func in timings.items():
+        best = min(timeit.repeat(func, number=5, repeat=args.repeat)) / 5
+        print(f"  {name:<26} {best * 1e3:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
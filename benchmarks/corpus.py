@@ -0,0 +1,185 @@
+"""Generate synthetic documentation trees for benchmarking mkdocs-quiz.
+
+The generated site mixes prose, headings, links, fenced code blocks (some of
+them showing quiz syntax as examples) and quizzes. Page count, quizzes per page,
+the share of fill-in-the-blank quizzes, code fence density and per-answer
+feedback usage can all be tuned. Output is deterministic for a given spec.
+
+Usage:
+    python benchmarks/corpus.py OUTPUT_DIR [--pages 100] [--quizzes-per-page 10] ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+
+MKDOCS_YML = """\
+site_name: mkdocs-quiz benchmark
+use_directory_urls: true
+plugins:
+  - mkdocs_quiz:
+      cache: false
+      manifest: true
+markdown_extensions:
+  - admonition
+  - attr_list
+  - md_in_html
+  - tables
+  - toc:
+      permalink: true
+  - pymdownx.superfences
+  - pymdownx.highlight
+  - pymdownx.inlinehilite
+"""
+
+WORDS = [
+    "quiz",
+    "answer",
+    "question",
+    "module",
+    "function",
+    "value",
+    "result",
+    "page",
+    "build",
+    "plugin",
+    "markdown",
+    "config",
+    "theme",
+    "site",
+    "index",
+    "cache",
+    "render",
+    "string",
+    "list",
+    "option",
+    "test",
+    "example",
+]
+
+
+@dataclass
+class CorpusSpec:
+    """Shape of a synthetic documentation tree."""
+
+    pages: int = 100
+    quizzes_per_page: int = 10
+    fill_blank_ratio: float = 0.25
+    fences_per_page: int = 5
+    feedback_ratio: float = 0.3
+    seed: int = 42
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _multiple_choice_quiz(rng: random.Random, n: int, feedback: bool) -> str:
+    lines = ["<quiz>", f"Question {n}: {_sentence(rng, 8)[:-1]}?"]
+    correct = rng.sample(range(4), k=rng.choice((1, 1, 2)))
+    for i in range(4):
+        mark = "x" if i in correct else " "
+        lines.append(f"- [{mark}] Answer `{i}` with **{rng.choice(WORDS)}**")
+        if feedback:
+            lines.append(f"  > {_sentence(rng, 6)}")
+    lines += ["", _sentence(rng), "", f"See [page {n}](page-{n % 7}.md).", "</quiz>"]
+    return "\n".join(lines)
+
+
+def _fill_blank_quiz(rng: random.Random, n: int) -> str:
+    blanks = " and ".join(f"[[{rng.choice(WORDS)}]]" for _ in range(rng.randint(1, 3)))
+    return "\n".join(
+        [
+            "<quiz>",
+            f"Question {n}: the {rng.choice(WORDS)} is {blanks}.",
+            "",
+            "---",
+            "",
+            _sentence(rng),
+            "</quiz>",
+        ]
+    )
+
+
+def _fence(rng: random.Random, n: int) -> str:
+    if n % 3 == 0:
+        # Quiz syntax shown as an example must not be treated as a quiz
+        body = "<quiz>\nExample question?\n- [x] Yes\n- [ ] No\n</quiz>"
+        return f"```markdown\n{body}\n```"
+    body = "\n".join(f"value_{i} = {rng.randint(0, 999)}  # {rng.choice(WORDS)}" for i in range(6))
+    return f"```python\n{body}\n```"
+
+
+def generate_page(spec: CorpusSpec, index: int) -> str:
+    """Generate the markdown of one page."""
+    rng = random.Random(spec.seed * 100_003 + index)
+    blocks = [f"# Page {index}", _sentence(rng, 30)]
+    quizzes = spec.quizzes_per_page
+    fences = spec.fences_per_page
+    for i in range(max(quizzes, fences)):
+        blocks.append(f"## Section {i}\n\n{_sentence(rng, 40)}\n\n{_sentence(rng, 25)}")
+        if i < fences:
+            blocks.append(_fence(rng, i))
+        if i < quizzes:
+            n = index * quizzes + i
+            if rng.random() < spec.fill_blank_ratio:
+                blocks.append(_fill_blank_quiz(rng, n))
+            else:
+                blocks.append(_multiple_choice_quiz(rng, n, rng.random() < spec.feedback_ratio))
+    if quizzes:
+        blocks.append("<!-- mkdocs-quiz results -->")
+    return "\n\n".join(blocks) + "\n"
+
+
+def generate_corpus(root: Path, spec: CorpusSpec) -> Path:
+    """Write a documentation tree with an `mkdocs.yml` to a directory.
+
+    Args:
+        root: Output directory, created if needed.
+        spec: Shape of the corpus.
+
+    Returns:
+        Path of the generated `mkdocs.yml`.
+    """
+    docs = root / "docs"
+    docs.mkdir(parents=True, exist_ok=True)
+    (docs / "index.md").write_text("# Benchmark corpus\n\n" + _sentence(random.Random(0)) + "\n")
+    for index in range(spec.pages):
+        (docs / f"page-{index}.md").write_text(generate_page(spec, index), encoding="utf-8")
+    config_file = root / "mkdocs.yml"
+    config_file.write_text(MKDOCS_YML, encoding="utf-8")
+    return config_file
+
+
+def add_spec_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add a command line option for every `CorpusSpec` field."""
+    for spec_field in fields(CorpusSpec):
+        parser.add_argument(
+            f"--{spec_field.name.replace('_', '-')}",
+            type=type(spec_field.default),
+            default=spec_field.default,
+        )
+
+
+def spec_from_arguments(args: argparse.Namespace) -> CorpusSpec:
+    """Build a `CorpusSpec` from parsed command line options."""
+    return CorpusSpec(**{f.name: getattr(args, f.name) for f in fields(CorpusSpec)})
+
+
+def main() -> None:
+    """Generate a corpus from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output", type=Path)
+    add_spec_arguments(parser)
+    args = parser.parse_args()
+    spec = spec_from_arguments(args)
+    config_file = generate_corpus(args.output, spec)
+    print(f"Generated {config_file} with {asdict(spec)}")
+
+
+if __name__ == "__main__":
+    main()
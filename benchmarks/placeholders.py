@@ -0,0 +1,111 @@
+"""Benchmark placeholder substitution on a page with many quizzes and code blocks.
+
+Builds a single page holding 500 quizzes (a quarter of them fill-in-the-blank)
+and 200 fenced code blocks, then times the plugin's `on_page_markdown` and
+`on_page_content` hooks together with the substitution steps on their own.
+
+Usage:
+    python benchmarks/placeholders.py [--quizzes 500] [--fences 200] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.structure.files import File, Files
+from mkdocs.structure.pages import Page
+
+from mkdocs_quiz.parsing import (
+    QUIZ_PLACEHOLDER_REGEX,
+    mask_code_blocks,
+    substitute_placeholders,
+    unmask_code_blocks,
+)
+from mkdocs_quiz.plugin import MkDocsQuizPlugin
+
+
+def make_page_markdown(quizzes: int, fences: int) -> str:
+    """Generate a page with the given number of quizzes and code fences."""
+    parts = ["# Benchmark page\n"]
+    fence_every = max(1, quizzes // fences) if fences else 0
+    written_fences = 0
+    for i in range(quizzes):
+        if i % 4 == 3:
+            parts.append(f"<quiz>\nThe answer to {i} is [[{i}]] and [[{i + 1}]].\n</quiz>\n")
+        else:
+            parts.append(
+                f"<quiz>\nQuestion {i} with **bold** text?\n- [x] Right\n- [ ] Wrong\n\n"
+                f"Explanation for question {i}.\n</quiz>\n"
+            )
+        if fence_every and i % fence_every == 0 and written_fences < fences:
+            parts.append(f"```python\nprint({i})  # example code\n```\n")
+            written_fences += 1
+    while written_fences < fences:
+        parts.append(f"```text\nextra block {written_fences}\n```\n")
+        written_fences += 1
+    return "\n".join(parts)
+
+
+def naive_substitute(text: str, replacements: dict[str, str]) -> str:
+    """Previous approach: one full-text `str.replace` per placeholder."""
+    for placeholder, replacement in replacements.items():
+        text = text.replace(placeholder, replacement)
+    return text
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quizzes", type=int, default=500)
+    parser.add_argument("--fences", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    markdown = make_page_markdown(args.quizzes, args.fences)
+    config = MkDocsConfig()
+    files = Files([])
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {"cache": False, "embed_source": True}
+
+    def build() -> str:
+        file = File(path="bench.md", src_dir="docs", dest_dir="site", use_directory_urls=True)
+        page = Page(None, file, config)
+        page.meta = {}
+        result = plugin.on_page_markdown(markdown, page, config)
+        html = plugin.on_page_content(result, page=page, config=config, files=files)
+        assert html is not None
+        return html
+
+    # Substitution steps in isolation, on realistic inputs
+    masked, code_blocks = mask_code_blocks(markdown)
+    quiz_placeholders = {
+        f"<!-- MKDOCS_QUIZ_PLACEHOLDER_{i} -->": f"<div class='quiz'>{i}</div>"
+        for i in range(args.quizzes)
+    }
+    file = File(path="bench.md", src_dir="docs", dest_dir="site", use_directory_urls=True)
+    page_html = plugin.on_page_markdown(markdown, Page(None, file, config), config)
+    plugin._quiz_storage.clear()
+
+    timings = {
+        "unmask code blocks (single scan)": lambda: unmask_code_blocks(masked, code_blocks),
+        "unmask code blocks (str.replace loop)": lambda: naive_substitute(masked, code_blocks),
+        "quiz placeholders (single scan)": lambda: substitute_placeholders(
+            page_html, QUIZ_PLACEHOLDER_REGEX, quiz_placeholders
+        ),
+        "quiz placeholders (str.replace loop)": lambda: naive_substitute(
+            page_html, quiz_placeholders
+        ),
+        "full page hooks": build,
+    }
+
+    print(f"Page: {args.quizzes} quizzes, {args.fences} code fences, {len(markdown):,} chars")
+    for name, func in timings.items():
+        number = 1 if name == "full page hooks" else 20
+        best = min(timeit.repeat(func, number=number, repeat=args.repeat)) / number
+        print(f"  {name:<40} {best * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
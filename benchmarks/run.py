@@ -0,0 +1,192 @@
+"""Run the mkdocs-quiz benchmark suite on a synthetic corpus.
+
+Scenarios:
+
+- `build`: a full `mkdocs build` of the corpus through `MkDocsQuizPlugin`
+- `scan`: `find_quizzes` and `mask_code_blocks` over every page
+- `extract`: `extract_quizzes_from_directory` on the docs directory
+- `lint`: `mkdocs-quiz lint` checks of every page, without the results cache
+- `qti12` / `qti21`: exporting the extracted quizzes to a QTI zip in memory
+- `fetch`: `extract_quiz_sources_from_html` over every built page
+- `manifest`: loading every quiz of the built site from `quizzes.json`
+- `startup`: running `mkdocs-quiz --version` in a new interpreter
+- `import`: importing MkDocs and the plugin module in a new interpreter
+
+Results are printed and can be saved as JSON with `--output`. Passing a
+previous results file with `--baseline` compares median timings and exits
+with status 1 when any scenario is slower than `--threshold`.
+
+Usage:
+    python benchmarks/run.py [--pages 100 ...] [--repeat 5] [--output results.json]
+    python benchmarks/run.py --baseline results.json [--threshold 0.1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from corpus import add_spec_arguments, generate_corpus, spec_from_arguments
+from mkdocs.commands.build import build
+from mkdocs.config import load_config
+
+from mkdocs_quiz import __version__
+from mkdocs_quiz.cli.fetcher import (
+    extract_quiz_sources_from_html,
+    fetch_quizzes_from_manifest_file,
+)
+from mkdocs_quiz.lint import find_markdown_files, lint_files
+from mkdocs_quiz.parsing import find_quizzes, mask_code_blocks
+from mkdocs_quiz.qti import extract_quizzes_from_directory
+from mkdocs_quiz.qti.qti12 import QTI12Exporter
+from mkdocs_quiz.qti.qti21 import QTI21Exporter
+
+# Code run in a new interpreter by the start-up scenarios
+STARTUP_SCENARIOS = {
+    "startup": (
+        "import sys; sys.argv = ['mkdocs-quiz', '--version']; "
+        "from mkdocs_quiz.cli import main; main()"
+    ),
+    "import": "import mkdocs.config.defaults, mkdocs.plugins, mkdocs_quiz.plugin",
+}
+
+
+def time_scenario(func: Callable[[], object], repeat: int) -> dict[str, float]:
+    """Run a scenario `repeat` times and return timing statistics in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "max": max(timings),
+    }
+
+
+def run_suite(root: Path, config_file: Path, repeat: int) -> dict[str, dict[str, float]]:
+    """Run all scenarios on a generated corpus."""
+    docs_dir = root / "docs"
+    site_dir = root / "site"
+    pages = [p.read_text(encoding="utf-8") for p in sorted(docs_dir.glob("*.md"))]
+
+    def run_build() -> None:
+        config = load_config(str(config_file), site_dir=str(site_dir))
+        config.plugins.on_startup(command="build", dirty=False)
+        try:
+            build(config)
+        finally:
+            config.plugins.on_shutdown()
+
+    def run_scan() -> None:
+        for markdown in pages:
+            find_quizzes(markdown)
+            mask_code_blocks(markdown)
+
+    results = {
+        "build": time_scenario(run_build, repeat),
+        "scan": time_scenario(run_scan, repeat),
+        "extract": time_scenario(lambda: extract_quizzes_from_directory(docs_dir), repeat),
+        "lint": time_scenario(lambda: lint_files(find_markdown_files([docs_dir])), repeat),
+    }
+
+    collection = extract_quizzes_from_directory(docs_dir)
+    results["qti12"] = time_scenario(lambda: QTI12Exporter(collection).export_to_bytes(), repeat)
+    results["qti21"] = time_scenario(lambda: QTI21Exporter(collection).export_to_bytes(), repeat)
+
+    built = [p.read_text(encoding="utf-8") for p in site_dir.rglob("index.html")]
+    results["fetch"] = time_scenario(
+        lambda: [extract_quiz_sources_from_html(html) for html in built], repeat
+    )
+    results["manifest"] = time_scenario(
+        lambda: fetch_quizzes_from_manifest_file(site_dir / "quizzes.json"), repeat
+    )
+
+    # Start-up costs, including the interpreter itself
+    for name, code in STARTUP_SCENARIOS.items():
+        command = [sys.executable, "-c", code]
+        results[name] = time_scenario(
+            lambda command=command: subprocess.run(command, check=True, stdout=subprocess.DEVNULL),
+            repeat,
+        )
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Print a comparison against a baseline and return the regressed scenarios."""
+    regressions = []
+    print(f"\n{'scenario':<10} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, timing in results.items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<10} {'-':>10} {timing['median']:>9.3f}s {'new':>8}")
+            continue
+        change = timing["median"] / base["median"] - 1 if base["median"] else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<10} {base['median']:>9.3f}s {timing['median']:>9.3f}s {change:>+7.1%}{flag}")
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmark suite from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_spec_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per scenario")
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    parser.add_argument("--baseline", type=Path, help="Compare against a previous results file")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="Allowed slowdown before failing (0.1 = 10%%)"
+    )
+    args = parser.parse_args()
+    spec = spec_from_arguments(args)
+
+    baseline = None
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if baseline["corpus"] != asdict(spec):
+            print(f"Warning: baseline corpus differs: {baseline['corpus']}", file=sys.stderr)
+
+    with tempfile.TemporaryDirectory(prefix="mkdocs-quiz-bench-") as tmp:
+        root = Path(tmp)
+        config_file = generate_corpus(root, spec)
+        results = run_suite(root, config_file, args.repeat)
+
+    print(f"mkdocs-quiz {__version__}, corpus {asdict(spec)}, {args.repeat} runs")
+    print(f"{'scenario':<10} {'min':>10} {'median':>10} {'max':>10}")
+    for name, timing in results.items():
+        print(f"{name:<10} {timing['min']:>9.3f}s {timing['median']:>9.3f}s {timing['max']:>9.3f}s")
+
+    if args.output:
+        data = {
+            "version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "corpus": asdict(spec),
+            "repeat": args.repeat,
+            "results": results,
+        }
+        args.output.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+    if baseline is not None and compare(results, baseline, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
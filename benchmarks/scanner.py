@@ -0,0 +1,125 @@
+"""Benchmark the markdown scanner on pages of increasing size.
+
+Generates pages of 0.5 to 8 MB made of prose, quizzes and fenced code blocks
+(one third of them showing quiz syntax as an example) and times `scan_markdown`
+and the plugin's `on_page_markdown` hook. Time per megabyte stays flat when
+scanning is linear. The previous approach (a quiz regex pass, a fence regex pass
+checking every fence against every quiz, then another quiz pass) is timed for
+comparison.
+
+Usage:
+    python benchmarks/scanner.py [--max-mb 8] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import timeit
+from collections.abc import Callable
+from functools import partial
+
+from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.structure.files import File
+from mkdocs.structure.pages import Page
+
+from mkdocs_quiz.parsing import OLD_SYNTAX_PATTERNS, QUIZ_REGEX, scan_markdown
+from mkdocs_quiz.plugin import MkDocsQuizPlugin
+
+BLOCK = """
+## Section {i}
+
+Some prose about topic {i}, with `inline code` and a [link](other.md).
+
+<quiz>
+Question {i}?
+- [x] Right
+- [ ] Wrong
+
+Explanation for question {i}.
+</quiz>
+
+```{lang}
+{code}
+```
+"""
+
+
+def make_page_markdown(size: int) -> str:
+    """Generate a page of roughly `size` characters."""
+    parts = []
+    total = 0
+    i = 0
+    while total < size:
+        code = "<quiz>\nExample\n- [x] Yes\n</quiz>" if i % 3 == 0 else f"print({i})"
+        part = BLOCK.format(i=i, lang="markdown" if i % 3 == 0 else "python", code=code)
+        parts.append(part)
+        total += len(part)
+        i += 1
+    return "".join(parts)
+
+
+def legacy_scan(markdown: str) -> list[re.Match[str]]:
+    """Previous approach: quiz ranges, fences checked against every quiz, quizzes again."""
+    quiz_ranges = [(m.start(), m.end()) for m in re.finditer(QUIZ_REGEX, markdown, re.DOTALL)]
+    placeholders: dict[str, str] = {}
+
+    def replace_fenced(match: re.Match[str]) -> str:
+        for quiz_start, quiz_end in quiz_ranges:
+            if quiz_start < match.start() < quiz_end or quiz_start < match.end() < quiz_end:
+                return match.group(0)
+        placeholder = f"__CODEBLOCK_{len(placeholders)}__"
+        placeholders[placeholder] = match.group(0)
+        return placeholder
+
+    masked = re.sub(
+        r"^[ \t]*`{3,}.*?\n.*?^[ \t]*`{3,}|^[ \t]*~{3,}.*?\n.*?^[ \t]*~{3,}",
+        replace_fenced,
+        markdown,
+        flags=re.MULTILINE | re.DOTALL,
+    )
+    for pattern in OLD_SYNTAX_PATTERNS:
+        re.search(pattern, masked)
+    return list(re.finditer(QUIZ_REGEX, masked, re.DOTALL))
+
+
+def ms_per_mb(func: Callable[[], object], size_mb: float, repeat: int) -> float:
+    """Return the best time of `func` in milliseconds per megabyte of input."""
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000 / size_mb
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-mb", type=float, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    config = MkDocsConfig()
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {}
+    file = File(path="bench.md", src_dir="docs", dest_dir="site", use_directory_urls=True)
+    page = Page(None, file, config)
+    page.meta = {}
+
+    print(f"{'size':>8} {'quizzes':>8} {'scan ms/MB':>11} {'hook ms/MB':>11} {'legacy ms/MB':>13}")
+    size_mb = 0.5
+    while size_mb <= args.max_mb:
+        markdown = make_page_markdown(int(size_mb * 1024 * 1024))
+        timings = [
+            ms_per_mb(partial(scan_markdown, markdown), size_mb, args.repeat),
+            ms_per_mb(
+                partial(plugin.on_page_markdown, markdown, page, config), size_mb, args.repeat
+            ),
+            # The legacy approach is quadratic, so larger pages take minutes
+            ms_per_mb(partial(legacy_scan, markdown), size_mb, 1) if size_mb <= 2 else float("nan"),
+        ]
+        quizzes = len(scan_markdown(markdown).quizzes)
+        print(
+            f"{size_mb:>6} MB {quizzes:>8} {timings[0]:>11.1f} {timings[1]:>11.1f} {timings[2]:>13.1f}"
+        )
+        size_mb *= 2
+
+
+if __name__ == "__main__":
+    main()
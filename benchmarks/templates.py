@@ -0,0 +1,111 @@
+"""Benchmark building the HTML markup of a quiz from its rendered parts.
+
+Times the string building that happens after Markdown conversion: answer
+markup, the quiz container, and the per-page results, intro and sidebar
+markup. The previous approach, an f-string dedented for every quiz, is
+compared with the templates compiled once per build.
+
+Usage:
+    python benchmarks/templates.py [--answers 4] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from textwrap import dedent
+
+from mkdocs_quiz.plugin import MkDocsQuizPlugin
+from mkdocs_quiz.templates import compile_templates
+from mkdocs_quiz.translations import TranslationManager
+
+QUESTION = "<p>What does <code>sorted()</code> return for an <strong>empty</strong> list?</p>"
+CONTENT = "<p>See the <a href='../builtins/'>built-in functions</a> for details.</p>"
+ATTRS = 'data-show-correct="true" data-auto-submit="true" data-disable-after-submit="true"'
+
+
+def dedent_quiz(answers: list[str]) -> str:
+    """Previous approach: f-strings, with the container dedented for every quiz."""
+    answer_html = []
+    for i, answer in enumerate(answers):
+        input_id = f"quiz-3-{i}"
+        correct_attr = 'data-correct="true"' if i == 0 else ""
+        feedback_html = f'<div class="answer-feedback hidden">{answer}</div>' if i % 2 else ""
+        answer_html.append(
+            f'<div><input type="radio" name="answer" value="{i}" '
+            f'id="{input_id}" {correct_attr}>'
+            f'<label for="{input_id}">{answer}</label>'
+            f"{feedback_html}</div>"
+        )
+    answers_html = "".join(answer_html)
+    question_header = submit_button = ""
+    return dedent(f"""
+            <div class="quiz" {ATTRS} id="quiz-3">
+                <a href="#quiz-3" class="quiz-header-link">#</a>
+                {question_header}
+                <div class="quiz-question" id="quiz-3-question">
+                    {QUESTION}
+                </div>
+                <form action="javascript:void(0);" onsubmit="return false;">
+                    <fieldset aria-labelledby="quiz-3-question">{answers_html}</fieldset>
+                    <div class="quiz-feedback hidden"></div>
+                    {submit_button}
+                </form>
+                <section class="content hidden">{CONTENT}</section>
+            </div>
+        """).strip()
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--answers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    answers = [f"Answer <code>{i}</code>" for i in range(args.answers)]
+    templates = compile_templates()
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {}
+    t = TranslationManager("en")
+
+    def template_quiz() -> str:
+        answer_html = [
+            templates["answer"].render(
+                input_type="radio",
+                value=i,
+                id=f"quiz-3-{i}",
+                correct_attr='data-correct="true"' if i == 0 else "",
+                label=answer,
+                feedback=templates["answer_feedback"].render(feedback=answer) if i % 2 else "",
+            )
+            for i, answer in enumerate(answers)
+        ]
+        return templates["quiz"].render(
+            attrs=ATTRS,
+            id="quiz-3",
+            question_header="",
+            question=QUESTION,
+            answers="".join(answer_html),
+            submit_button="",
+            content=CONTENT,
+        )
+
+    def page_markup() -> None:
+        plugin._generate_results_html(t)
+        plugin._generate_intro_html(t)
+        plugin._get_quiz_progress_sidebar_html(t)
+
+    timings = {
+        "quiz markup (dedented f-strings)": lambda: dedent_quiz(answers),
+        "quiz markup (compiled templates)": template_quiz,
+        "compile all templates": compile_templates,
+        "results, intro and sidebar": page_markup,
+    }
+    for name, func in timings.items():
+        best = min(timeit.repeat(func, number=2000, repeat=args.repeat)) / 2000
+        print(f"  {name:<40} {best * 1e6:9.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
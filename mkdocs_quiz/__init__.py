@@ -1,9 +1,22 @@
 """MkDocs Quiz Plugin - Create interactive quizzes in your MkDocs documentation."""
 
+from __future__ import annotations
+
 from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
 
 __version__ = version("mkdocs_quiz")
 
-from mkdocs_quiz.plugin import MkDocsQuizPlugin
+if TYPE_CHECKING:
+    from mkdocs_quiz.plugin import MkDocsQuizPlugin
 
 __all__ = ["MkDocsQuizPlugin"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the plugin on first access, so that the CLI doesn't load MkDocs
+    if name == "MkDocsQuizPlugin":
+        from mkdocs_quiz.plugin import MkDocsQuizPlugin
+
+        return MkDocsQuizPlugin
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,197 @@
+"""Persistent, content-addressed cache of rendered quiz HTML.
+
+Each rendered quiz is stored as its own file named after a hash of everything
+that can influence its HTML (see `MkDocsQuizPlugin._quiz_cache_key`). Entries are
+never invalidated explicitly: a change to any input produces a new key, and stale
+entries age out through least-recently-used eviction once the cache grows beyond
+its size cap. File modification times record when an entry was last used.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+log = logging.getLogger("mkdocs.plugins.mkdocs_quiz")
+
+# Bump when the stored HTML format changes in a way the cache key doesn't capture
+CACHE_FORMAT_VERSION = "1"
+
+# Quiz source that resolves links against other documentation files. Rendering these
+# depends on which files exist in the build, not only on the quiz and page.
+LINK_HINT_REGEX = re.compile(r"\]\(|\]\[|^\s{0,3}\[[^\]]+\]:|<(?:a|img)\b", re.MULTILINE | re.I)
+
+# Quiz source pulling in external files (pymdownx.snippets) can't be content-addressed
+SNIPPET_MARKER = "--8<--"
+
+_MEMORY_ADDRESS_REGEX = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def _stable_repr(value: Any) -> str:
+    """Return a representation of a non-JSON value that is stable across processes."""
+    if callable(value) and hasattr(value, "__qualname__"):
+        return f"{getattr(value, '__module__', '')}.{value.__qualname__}"
+    return _MEMORY_ADDRESS_REGEX.sub("", repr(value))
+
+
+def fingerprint(value: Any) -> str:
+    """Hash an arbitrary config value into a stable hex digest.
+
+    Args:
+        value: Any JSON-like value. Callables and other objects (e.g. the
+            `emoji_index` functions in `mdx_configs`) are represented by name.
+
+    Returns:
+        A SHA-256 hex digest.
+    """
+    encoded = json.dumps(value, sort_keys=True, default=_stable_repr)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@contextmanager
+def capture_warnings() -> Iterator[list[logging.LogRecord]]:
+    """Collect warnings logged by MkDocs (and its plugins) inside the block.
+
+    Rendering that produced a warning (e.g. a broken link) must not be cached,
+    otherwise the warning would silently disappear on the next build, and with it
+    the failure of a `--strict` build.
+
+    Yields:
+        The list that captured warning records are appended to.
+    """
+    records: list[logging.LogRecord] = []
+
+    class _Collector(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            records.append(record)
+
+    handler = _Collector(level=logging.WARNING)
+    logger = logging.getLogger("mkdocs")
+    logger.addHandler(handler)
+    try:
+        yield records
+    finally:
+        logger.removeHandler(handler)
+
+
+class QuizCache:
+    """On-disk store of rendered quiz HTML with a size cap and LRU eviction."""
+
+    def __init__(self, cache_dir: Path, max_size: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache entries. Created on first write.
+            max_size: Maximum total size of all entries in bytes.
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from the inputs that determine a quiz's HTML.
+
+        Args:
+            *parts: Strings that together identify the rendered output.
+
+        Returns:
+            A SHA-256 hex digest.
+        """
+        digest = hashlib.sha256(CACHE_FORMAT_VERSION.encode("utf-8"))
+        for part in parts:
+            digest.update(b"\0")
+            digest.update(part.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.html"
+
+    def __contains__(self, key: str) -> bool:
+        """Check for an entry without counting a hit or miss or marking it as used."""
+        return self._entry_path(key).exists()
+
+    def get(self, key: str) -> str | None:
+        """Return cached HTML for a key and mark it as recently used.
+
+        Args:
+            key: A key from `make_key`.
+
+        Returns:
+            The cached HTML, or None on a cache miss.
+        """
+        path = self._entry_path(key)
+        try:
+            html = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return html
+
+    def set(self, key: str, html: str) -> None:
+        """Store rendered HTML under a key.
+
+        Writes are atomic, so concurrent builds sharing a cache never read a
+        partially written entry. Failures are logged and otherwise ignored.
+
+        Args:
+            key: A key from `make_key`.
+            html: The rendered quiz HTML.
+        """
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(html)
+            os.replace(tmp_name, path)
+        except OSError as e:
+            log.debug(f"Failed to write quiz cache entry {path}: {e}")
+
+    def prune(self) -> int:
+        """Evict least recently used entries until the cache fits its size cap.
+
+        Returns:
+            The number of entries removed.
+        """
+        entries: list[tuple[float, int, Path]] = []
+        total = 0
+        try:
+            for bucket in self.cache_dir.iterdir():
+                if not bucket.is_dir():
+                    continue
+                for entry in os.scandir(bucket):
+                    stat = entry.stat()
+                    # Leftovers of interrupted writes are always removed once stale
+                    if entry.name.endswith(".tmp") and stat.st_mtime < time.time() - 3600:
+                        os.unlink(entry.path)
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+                    total += stat.st_size
+        except OSError:
+            return 0
+
+        removed = 0
+        if total > self.max_size:
+            for _mtime, size, path in sorted(entries, key=lambda e: e[0]):
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                removed += 1
+                total -= size
+                if total <= self.max_size:
+                    break
+        return removed
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
-from .discovery import interactive_quiz_selection
-from .fetcher import fetch_quizzes, is_url
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from .console import console
 from .main import main
-from .runner import console, display_final_results, get_score_color, run_quiz_session
+
+if TYPE_CHECKING:
+    from .discovery import interactive_quiz_selection
+    from .fetcher import fetch_quizzes, is_url
+    from .runner import display_final_results, get_score_color, run_quiz_session
 
 __all__ = [
     "console",
@@ -17,3 +23,20 @@ __all__ = [
     "main",
     "run_quiz_session",
 ]
+
+# Module of the other exports, imported on first access so that starting the
+# CLI doesn't load the quiz runner, the fetcher and their dependencies
+_LAZY_EXPORTS = {
+    "display_final_results": ".runner",
+    "fetch_quizzes": ".fetcher",
+    "get_score_color": ".runner",
+    "interactive_quiz_selection": ".discovery",
+    "is_url": ".fetcher",
+    "run_quiz_session": ".runner",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
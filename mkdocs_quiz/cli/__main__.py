@@ -0,0 +1,5 @@
+"""Run the CLI with `python -m mkdocs_quiz.cli`."""
+
+from .main import main
+
+main()
@@ -0,0 +1,11 @@
+"""Rich console shared by the CLI commands.
+
+Kept in its own module so that commands can print without importing the quiz
+runner and its interactive prompt dependencies.
+"""
+
+from __future__ import annotations
+
+from rich.console import Console
+
+console = Console()
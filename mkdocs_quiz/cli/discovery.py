@@ -9,7 +9,7 @@ from pathlib import Path
 import questionary
 import yaml  # type: ignore[import-untyped]
 
-from .runner import console
+from .console import console
 
 logger = logging.getLogger(__name__)
 
@@ -0,0 +1,127 @@
+"""The `export` commands: export quizzes for learning management systems."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import rich_click as click
+
+from .console import console
+
+
+@click.group()
+def export() -> None:
+    """Export quizzes to various formats."""
+    pass
+
+
+@export.command("qti")
+@click.argument("path", default="docs", type=click.Path(exists=True))
+@click.option(
+    "-o",
+    "--output",
+    help="Output ZIP file path (default: quizzes.zip).",
+)
+@click.option(
+    "-q",
+    "--qti-version",
+    default="1.2",
+    type=click.Choice(["1.2", "2.1"]),
+    help="QTI version to export (default: 1.2 for widest compatibility).",
+)
+@click.option(
+    "-t",
+    "--title",
+    help="Title for the quiz package.",
+)
+@click.option(
+    "--no-recursive",
+    is_flag=True,
+    help="Don't search directories recursively.",
+)
+def export_qti(
+    path: str,
+    output: str | None,
+    qti_version: str,
+    title: str | None,
+    no_recursive: bool,
+) -> None:
+    """Export quizzes to QTI format for LMS import (Canvas, Blackboard, Moodle)."""
+    from ..qti import (
+        QTIExporter,
+        QTIVersion,
+        extract_quizzes_from_directory,
+        extract_quizzes_from_file,
+    )
+    from ..qti.models import QuizCollection
+
+    # Validate and parse QTI version
+    try:
+        qti_ver = QTIVersion.from_string(qti_version)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
+
+    # Convert path to Path object
+    source_path = Path(path)
+
+    console.print(f"[bold]MkDocs Quiz QTI Export (version {qti_ver})[/bold]")
+    console.print(f"Source: {source_path}")
+    console.print()
+
+    # Extract quizzes
+    if source_path.is_file():
+        if source_path.suffix.lower() != ".md":
+            console.print(f"[red]Error: File must be a markdown file (.md): {source_path}[/red]")
+            sys.exit(1)
+
+        quizzes = extract_quizzes_from_file(source_path)
+        collection = QuizCollection(
+            title=title or source_path.stem,
+            quizzes=quizzes,
+            description=f"Exported from {source_path.name}",
+        )
+    else:
+        collection = extract_quizzes_from_directory(
+            source_path,
+            recursive=not no_recursive,
+        )
+        if title:
+            collection.title = title
+
+    # Check if we found any quizzes
+    if not collection.quizzes:
+        console.print("No quizzes found in the specified path")
+        sys.exit(0)
+
+    # Validate quizzes
+    errors = collection.validate()
+    if errors:
+        console.print("[yellow]Warning: Some quizzes have validation errors:[/yellow]")
+        for quiz_id, quiz_errors in errors.items():
+            for error in quiz_errors:
+                console.print(f"  - {quiz_id}: {error}")
+        console.print()
+
+    # Determine output path
+    if output is None:
+        output = "quizzes.zip"
+    output_path = Path(output)
+
+    # Ensure .zip extension
+    if output_path.suffix.lower() != ".zip":
+        output_path = output_path.with_suffix(".zip")
+
+    # Export
+    console.print(f"Found {collection.total_questions} quiz question(s):")
+    console.print(f"  - Single choice: {collection.single_choice_count}")
+    console.print(f"  - Multiple choice: {collection.multiple_choice_count}")
+    console.print()
+
+    exporter = QTIExporter.create(collection, qti_ver)
+    result_path = exporter.export_to_zip(output_path)
+
+    console.print(f"[green]Exported to: {result_path}[/green]")
+    console.print()
+    console.print("Import this ZIP file into your LMS (Canvas, Blackboard, Moodle, etc.)")
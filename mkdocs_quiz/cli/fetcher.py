@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import re
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Any
+from urllib.parse import urljoin, urlparse
 
 import requests  # type: ignore[import-untyped]
 
+from ..manifest import read_manifest_quizzes
 from ..qti.extractor import extract_quizzes_from_directory, extract_quizzes_from_file
 from ..qti.models import Quiz
+from ..sidecar import SIDECAR_LINK_REGEX, decode_sources
 
 logger = logging.getLogger(__name__)
 
@@ -207,11 +211,80 @@ def _parse_multiple_choice_quiz(content: str, identifier: str, source_url: str)
     )
 
 
+def is_manifest(path: str) -> bool:
+    """Check if the given path or URL points to a quiz manifest (`quizzes.json`).
+
+    Args:
+        path: The path or URL to check.
+
+    Returns:
+        True if the path is a JSON file, False otherwise.
+    """
+    return urlparse(path).path.endswith(".json")
+
+
+def fetch_quizzes_from_manifest_url(url: str, timeout: int = 30) -> list[Quiz]:
+    """Fetch all quizzes of a site from its quiz manifest.
+
+    Sites built with the `manifest` option publish every quiz in `quizzes.json`,
+    so the whole quiz bank is loaded without fetching every page.
+
+    Args:
+        url: The URL of the manifest, e.g. `https://example.com/quizzes.json`.
+        timeout: Request timeout in seconds.
+
+    Returns:
+        List of Quiz objects in the manifest.
+
+    Raises:
+        requests.RequestException: If an HTTP request fails.
+        ValueError: If the response isn't a readable manifest or has no quizzes.
+    """
+
+    def load(manifest_url: str) -> Any:
+        response = requests.get(manifest_url, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    quizzes = read_manifest_quizzes(load(url), lambda path: load(urljoin(url, path)))
+    if not quizzes:
+        raise ValueError(f"No quizzes found in {url}")
+    return quizzes
+
+
+def fetch_quizzes_from_manifest_file(path: Path) -> list[Quiz]:
+    """Load all quizzes of a built site from its quiz manifest on disk.
+
+    Args:
+        path: Path to `quizzes.json` in a built site directory.
+
+    Returns:
+        List of Quiz objects in the manifest.
+
+    Raises:
+        ValueError: If the file isn't a readable manifest or has no quizzes.
+    """
+
+    def load(manifest_path: Path) -> Any:
+        try:
+            return json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"Failed to read quiz manifest {manifest_path}: {e}") from e
+
+    quizzes = read_manifest_quizzes(load(path), lambda page_path: load(path.parent / page_path))
+    if not quizzes:
+        raise ValueError(f"No quizzes found in {path}")
+    return quizzes
+
+
 def fetch_quizzes_from_url(url: str, timeout: int = 30) -> list[Quiz]:
     """Fetch and parse quizzes from a remote URL.
 
     The URL should point to a page rendered by mkdocs-quiz with
-    embed_source enabled. The quiz source is extracted from HTML comments.
+    embed_source enabled. The quiz source is extracted from HTML comments,
+    or from the quiz source file the page links to (`source_storage: sidecar`).
+    URLs of a quiz manifest (`quizzes.json`) are loaded with
+    `fetch_quizzes_from_manifest_url` instead.
 
     Args:
         url: The URL to fetch quizzes from.
@@ -224,14 +297,21 @@ def fetch_quizzes_from_url(url: str, timeout: int = 30) -> list[Quiz]:
         requests.RequestException: If the HTTP request fails.
         ValueError: If no quizzes are found on the page.
     """
+    if is_manifest(url):
+        return fetch_quizzes_from_manifest_url(url, timeout)
+
     # Fetch the page
     response = requests.get(url, timeout=timeout)
     response.raise_for_status()
 
     html = response.text
 
-    # Extract quiz sources from HTML comments
+    # Extract quiz sources from HTML comments, or the linked quiz source file
     sources = extract_quiz_sources_from_html(html)
+    if not sources and (link := SIDECAR_LINK_REGEX.search(html)):
+        sidecar_response = requests.get(urljoin(url, link.group(1)), timeout=timeout)
+        sidecar_response.raise_for_status()
+        sources = decode_sources(sidecar_response.content)
 
     if not sources:
         raise ValueError(
@@ -277,6 +357,8 @@ def fetch_quizzes(path: str) -> list[Quiz]:
         raise FileNotFoundError(f"Path not found: {path}")
 
     if local_path.is_file():
+        if is_manifest(path):
+            return fetch_quizzes_from_manifest_file(local_path)
         return extract_quizzes_from_file(local_path)
 
     collection = extract_quizzes_from_directory(local_path)
@@ -0,0 +1,85 @@
+"""The `lint` command: check quizzes without building the site."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import rich_click as click
+from rich.markup import escape
+
+from ..lint import DEFAULT_CACHE_FILE, find_markdown_files, lint_files, read_config
+from .console import console
+
+
+@click.command()
+@click.argument("paths", nargs=-1, type=click.Path(exists=True, path_type=Path))
+@click.option(
+    "-f",
+    "--config-file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default="mkdocs.yml",
+    show_default=True,
+    help="MkDocs config file to read `docs_dir` and the plugin options from.",
+)
+@click.option(
+    "--strict",
+    is_flag=True,
+    help="Fail on warnings too, like `mkdocs build --strict`.",
+)
+@click.option(
+    "--cache-file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=DEFAULT_CACHE_FILE,
+    show_default=True,
+    help="File to cache results in, so unchanged files aren't checked again.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Check every file, without reading or writing the cache.",
+)
+def lint(
+    paths: tuple[Path, ...], config_file: Path, strict: bool, cache_file: Path, no_cache: bool
+) -> None:
+    """Check the quizzes in markdown files for errors, without building the site.
+
+    PATHS are markdown files or directories to search for them (default: the
+    `docs_dir` of mkdocs.yml). Pages with quizzes disabled are skipped, like when
+    building. Reports every invalid quiz with its file and line, and exits with
+    status 1 if any quiz would fail the build.
+    """
+    try:
+        config = read_config(config_file)
+    except ValueError as e:
+        console.print(f"[red]Error: {escape(str(e))}[/red]")
+        sys.exit(1)
+    if not paths:
+        if not config.docs_dir.is_dir():
+            console.print(f"[red]Error: '{escape(str(config.docs_dir))}' is not a directory[/red]")
+            sys.exit(1)
+        paths = (config.docs_dir,)
+
+    files = find_markdown_files(paths)
+    results = lint_files(files, None if no_cache else cache_file, config.enabled_by_default)
+
+    errors = warnings = 0
+    for path, issues in results.items():
+        for issue in issues:
+            if issue.error:
+                errors += 1
+                kind = "[red]error[/red]"
+            else:
+                warnings += 1
+                kind = "[yellow]warning[/yellow]"
+            # One line per issue, for editors and CI logs to parse
+            console.print(
+                f"{escape(str(path))}:{issue.line}: {kind}: {escape(issue.message)}",
+                soft_wrap=True,
+            )
+
+    failed = errors > 0 or (strict and warnings > 0)
+    summary = f"{len(files)} file(s) checked, {errors} error(s), {warnings} warning(s)"
+    console.print(f"[red]{summary}[/red]" if failed else f"[green]{summary}[/green]")
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,169 @@
+"""The `migrate` command: convert quizzes from the old syntax."""
+
+from __future__ import annotations
+
+import re
+import sys
+from pathlib import Path
+
+import rich_click as click
+
+from .console import console
+
+
+def convert_quiz_block(quiz_content: str) -> str:
+    """Convert old quiz syntax to new markdown-style syntax.
+
+    Args:
+        quiz_content: The content inside <?quiz?> tags in old format.
+
+    Returns:
+        The converted quiz content in new format.
+    """
+    question = None
+    answers: list[tuple[bool, str]] = []  # (is_correct, text)
+    content_lines: list[str] = []
+    options: list[str] = []
+    in_content = False
+
+    # Map of line prefixes to their handlers
+    preserved_options = ("show-correct:", "auto-submit:", "disable-after-submit:")
+
+    for line in quiz_content.strip().split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+
+        if line.startswith("question:"):
+            question = line.split(":", 1)[1].strip()
+        elif line.startswith(preserved_options):
+            options.append(line)
+        elif line == "content:":
+            in_content = True
+        elif line.startswith("answer-correct:"):
+            answers.append((True, line.split(":", 1)[1].strip()))
+        elif line.startswith("answer:"):
+            answers.append((False, line.split(":", 1)[1].strip()))
+        elif in_content:
+            content_lines.append(line)
+
+    # Build new quiz format
+    result = ["<quiz>"]
+    if question:
+        result.append(question)
+    result.extend(options)
+    result.extend(f"- [{'x' if is_correct else ' '}] {text}" for is_correct, text in answers)
+    if content_lines:
+        result.append("")
+        result.extend(content_lines)
+    result.append("</quiz>")
+
+    return "\n".join(result)
+
+
+def migrate_file(file_path: Path, dry_run: bool = False) -> tuple[int, bool]:
+    """Migrate quiz blocks in a single file.
+
+    Args:
+        file_path: Path to the markdown file.
+        dry_run: If True, don't write changes to disk.
+
+    Returns:
+        Tuple of (number of quizzes converted, whether file was modified).
+    """
+    try:
+        content = file_path.read_text(encoding="utf-8")
+    except OSError as e:
+        console.print(f"  [red]Error reading {file_path}: {e}[/red]")
+        return 0, False
+
+    # Pattern to match quiz blocks
+    quiz_pattern = r"<\?quiz\?>(.*?)<\?/quiz\?>"
+
+    def replace_quiz(match: re.Match[str]) -> str:
+        return convert_quiz_block(match.group(1))
+
+    # Count how many quizzes will be converted
+    quiz_count = len(re.findall(quiz_pattern, content, re.DOTALL))
+
+    if quiz_count == 0:
+        return 0, False
+
+    # Replace all quiz blocks
+    new_content = re.sub(quiz_pattern, replace_quiz, content, flags=re.DOTALL)
+
+    if new_content == content:
+        return 0, False
+
+    if not dry_run:
+        # Write new content
+        file_path.write_text(new_content, encoding="utf-8")
+
+    return quiz_count, True
+
+
+@click.command()
+@click.argument("directory", default="docs", type=click.Path(exists=True))
+@click.option(
+    "-n",
+    "--dry-run",
+    is_flag=True,
+    help="Show what would be changed without modifying files.",
+)
+def migrate(directory: str, dry_run: bool) -> None:
+    """Migrate quiz blocks from old syntax to new markdown-style syntax.
+
+    Converts old question:/answer:/content: syntax to the new cleaner
+    markdown checkbox syntax (- [x] / - [ ]).
+    """
+    dir_path = Path(directory)
+
+    if not dir_path.is_dir():
+        console.print(f"[red]Error: '{directory}' is not a directory[/red]")
+        sys.exit(1)
+
+    console.print("[bold]MkDocs Quiz Syntax Migration[/bold]")
+    console.print(f"Searching for quiz blocks in: {dir_path}")
+    if dry_run:
+        console.print("[yellow]DRY RUN MODE - No files will be modified[/yellow]")
+    console.print()
+
+    # Find all markdown files
+    md_files = list(dir_path.rglob("*.md"))
+
+    if not md_files:
+        console.print("No markdown files found")
+        sys.exit(0)
+
+    total_files_modified = 0
+    total_quizzes = 0
+
+    for file_path in md_files:
+        quiz_count, modified = migrate_file(file_path, dry_run=dry_run)
+
+        if modified:
+            total_files_modified += 1
+            total_quizzes += quiz_count
+            quiz_text = "quiz" if quiz_count == 1 else "quizzes"
+            if dry_run:
+                console.print(
+                    f"  Would convert {quiz_count} {quiz_text} in: "
+                    f"{file_path.relative_to(dir_path)}"
+                )
+            else:
+                console.print(
+                    f"  Converted {quiz_count} {quiz_text} in: {file_path.relative_to(dir_path)}"
+                )
+
+    console.print()
+    if total_files_modified == 0:
+        console.print("No quiz blocks found to migrate")
+    else:
+        console.print("[green]Migration complete![/green]")
+        action = "would be" if dry_run else "were"
+        console.print(f"  Files {action} modified: {total_files_modified}")
+        console.print(f"  Quizzes {action} converted: {total_quizzes}")
+
+        if dry_run:
+            console.print()
+            console.print("Run without --dry-run to apply changes")
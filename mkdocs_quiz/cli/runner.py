@@ -16,11 +16,11 @@ from rich.rule import Rule
 from rich.segment import Segment
 from rich.style import StyleType
 
+from .console import console
+
 if TYPE_CHECKING:
     from ..qti.models import Quiz
 
-console = Console()
-
 
 def get_score_color(percentage: float) -> str:
     """Get the Rich color style for a score percentage.
@@ -0,0 +1,394 @@
+"""The `translations` commands: create, update, compile and check translation files."""
+
+from __future__ import annotations
+
+import re
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import polib
+import rich_click as click
+
+from mkdocs_quiz import __version__
+
+from ..translations import LOCALES_DIR, load_compiled_catalog, write_compiled_catalog
+from .console import console
+
+# Source directory of the strings to translate
+PACKAGE_DIR = LOCALES_DIR.parent
+
+
+@click.group()
+def translations() -> None:
+    """Manage translation files."""
+    pass
+
+
+@translations.command("init")
+@click.argument("language")
+@click.option("-o", "--output", help="Output file path (default: {language}.po).")
+def init_translation(language: str, output: str | None) -> None:
+    """Initialize a new translation file from the template."""
+    # Don't create en translation files - English is the fallback
+    if language.lower() == "en":
+        console.print("[red]Error: 'en' translation file is not needed[/red]")
+        console.print("English strings in the source code are used as the fallback.")
+        console.print("No translation file is required for English.")
+        sys.exit(1)
+
+    # Get path to built-in template
+    template_path = LOCALES_DIR / "mkdocs_quiz.pot"
+
+    # Determine output path
+    if output is None:
+        output = f"{language}.po"
+    output_path = Path(output)
+
+    # Check if file already exists
+    if output_path.exists():
+        console.print(f"[red]Error: File {output_path} already exists.[/red]")
+        sys.exit(1)
+
+    # Load template
+    pot = polib.pofile(str(template_path))
+
+    # Update metadata
+    pot.metadata = {
+        "Project-Id-Version": "mkdocs-quiz",
+        "Report-Msgid-Bugs-To": "https://github.com/ewels/mkdocs-quiz/issues",
+        "Language": language,
+        "MIME-Version": "1.0",
+        "Content-Type": "text/plain; charset=UTF-8",
+        "Content-Transfer-Encoding": "8bit",
+    }
+
+    # Save as new .po file
+    pot.save(str(output_path))
+
+    console.print(f"[green]Created {output_path}[/green]")
+    console.print("Edit the file to add translations, then configure in mkdocs.yml")
+
+
+def _get_translator_info() -> str | None:
+    """Get translator info from git config.
+
+    Returns:
+        Translator name and email in format "Name <email@example.com>", or None if not available.
+    """
+    import subprocess
+
+    try:
+        # Get git user name and email
+        name = subprocess.run(
+            ["git", "config", "user.name"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=5,
+        ).stdout.strip()
+
+        email = subprocess.run(
+            ["git", "config", "user.email"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=5,
+        ).stdout.strip()
+
+        if name and email:
+            return f"{name} <{email}>"
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+        pass
+
+    return None
+
+
+def _extract_python_strings(py_file: Path, catalog: Any) -> int:
+    """Extract translatable strings from Python files.
+
+    Looks for t.get() patterns in Python code (not docstrings/comments).
+
+    Args:
+        py_file: Path to Python file.
+        catalog: Babel catalog to add strings to.
+
+    Returns:
+        Number of strings extracted.
+    """
+    content = py_file.read_text(encoding="utf-8")
+
+    # Remove triple-quoted docstrings to avoid extracting example code
+    content_no_docstrings = re.sub(r'""".*?"""', "", content, flags=re.DOTALL)
+    content_no_docstrings = re.sub(r"'''.*?'''", "", content_no_docstrings, flags=re.DOTALL)
+    # Remove line comments
+    content_no_docstrings = re.sub(r"#.*?$", "", content_no_docstrings, flags=re.MULTILINE)
+
+    # Pattern to match t.get() - must be t.get() specifically
+    pattern = r't\.get\(\s*(["\'])((?:[^\1\\]|\\.)*?)\1'
+
+    count = 0
+    search_start = 0
+
+    for match in re.finditer(pattern, content_no_docstrings):
+        match_text = match.group(0)
+        # Find in original content starting from last found position
+        pos = content.find(match_text, search_start)
+        if pos == -1:
+            continue  # Was in a docstring/comment
+
+        # Calculate line number from start of file
+        line_number = content[:pos].count("\n") + 1
+        search_start = pos + len(match_text)
+
+        # Extract and unescape the string content
+        string_content = match.group(2)
+        string_content = string_content.replace(r"\"", '"').replace(r"\'", "'").replace(r"\\", "\\")
+
+        relative_path = py_file.relative_to(PACKAGE_DIR)
+        catalog.add(string_content, locations=[(str(relative_path), line_number)])
+        count += 1
+
+    return count
+
+
+def _extract_js_strings(js_file: Path, catalog: Any) -> int:
+    """Extract translatable strings from JavaScript files.
+
+    Looks for t() patterns in JavaScript code (not comments).
+
+    Args:
+        js_file: Path to JavaScript file.
+        catalog: Babel catalog to add strings to.
+
+    Returns:
+        Number of strings extracted.
+    """
+    content = js_file.read_text(encoding="utf-8")
+
+    # Remove comments
+    content_no_comments = re.sub(r"/\*.*?\*/", "", content, flags=re.DOTALL)
+    content_no_comments = re.sub(r"//.*?$", "", content_no_comments, flags=re.MULTILINE)
+
+    # Pattern to match t("...") or t('...')
+    pattern = r'(?<![a-zA-Z_])t\((["\'])(?:(?=(\\?))\2.)*?\1\)'
+
+    count = 0
+    search_start = 0
+
+    for match in re.finditer(pattern, content_no_comments):
+        matched_text = match.group(0)
+        pos = content.find(matched_text, search_start)
+        if pos == -1:
+            continue
+
+        line_number = content[:pos].count("\n") + 1
+        search_start = pos + len(matched_text)
+
+        # Extract string content (quote char is after 't(')
+        quote_char = matched_text[2]
+        string_match = re.search(
+            rf"{quote_char}((?:[^{quote_char}\\]|\\.)*){quote_char}", matched_text
+        )
+        if string_match:
+            string_content = string_match.group(1)
+            string_content = (
+                string_content.replace(r"\"", '"').replace(r"\'", "'").replace(r"\\", "\\")
+            )
+
+            relative_path = js_file.relative_to(PACKAGE_DIR)
+            catalog.add(string_content, locations=[(str(relative_path), line_number)])
+            count += 1
+
+    return count
+
+
+@translations.command("update")
+def update_translations() -> None:
+    """Extract strings from source and update all translation files.
+
+    This combines extraction and updating into a single command.
+    Uses babel to extract strings from source code and sync all .po files.
+
+    Requires: babel (install with `pip install babel`)
+    """
+    # Lazy import babel (it's only in dev dependencies)
+    try:
+        from babel.messages.catalog import Catalog
+        from babel.messages.pofile import write_po
+    except ImportError:
+        console.print("[red]Error: babel is required for updating translations[/red]")
+        console.print("Install with: pip install babel")
+        sys.exit(1)
+
+    # Get paths
+    module_dir = PACKAGE_DIR
+    locales_dir = LOCALES_DIR
+    pot_file = locales_dir / "mkdocs_quiz.pot"
+
+    # Step 1: Extract strings from Python source code
+    console.print("Extracting strings from source code...")
+    catalog = Catalog(project="mkdocs-quiz", version=__version__)
+
+    # Extract from Python files using custom pattern
+    py_files = list(module_dir.rglob("*.py"))
+    count = 0
+    for py_file in py_files:
+        count += _extract_python_strings(py_file, catalog)
+
+    console.print(f"[green]Extracted {count} strings from Python files[/green]")
+
+    # Step 2: Extract strings from JavaScript files
+    js_count = 0
+    js_files = list(module_dir.glob("js/**/*.js"))
+    if js_files:
+        console.print("Extracting strings from JavaScript files...")
+        for js_file in js_files:
+            js_count += _extract_js_strings(js_file, catalog)
+        console.print(f"[green]Extracted {js_count} strings from JavaScript files[/green]")
+
+    total_count = count + js_count
+
+    # Update catalog metadata
+    now = datetime.now(timezone.utc)
+    catalog.revision_date = now
+    catalog.msgid_bugs_address = "Phil Ewels <phil.ewels@seqera.io>"
+    catalog.last_translator = "Phil Ewels <phil.ewels@seqera.io>"
+
+    # Write catalog to .pot file
+    with open(pot_file, "wb") as f:
+        write_po(f, catalog, width=120)
+
+    # Remove Language-Team from .pot file using polib
+    pot = polib.pofile(str(pot_file))
+    if "Language-Team" in pot.metadata:
+        del pot.metadata["Language-Team"]
+    pot.save(str(pot_file))
+
+    console.print(f"[green]Total: {total_count} strings extracted to template[/green]")
+
+    # Step 4: Update all .po files
+    po_files = list(locales_dir.glob("*.po"))
+    console.print(f"Updating {len(po_files)} translation file(s)...")
+    for po_file in po_files:
+        # Use polib directly instead of babel for updating
+        po = polib.pofile(str(po_file))
+
+        # Merge new strings from catalog
+        for entry in catalog:
+            if entry.id:
+                existing = po.find(str(entry.id))
+                if not existing:
+                    po.append(
+                        polib.POEntry(msgid=str(entry.id), msgstr="", occurrences=entry.locations)
+                    )
+
+        # Update revision date
+        now = datetime.now(timezone.utc)
+        po.metadata["PO-Revision-Date"] = now.strftime("%Y-%m-%d %H:%M%z")
+
+        # Update Last-Translator from git config if available
+        translator = _get_translator_info()
+        if translator:
+            po.metadata["Last-Translator"] = translator
+
+        # Remove Language-Team placeholder (not needed for most projects)
+        if "Language-Team" in po.metadata:
+            del po.metadata["Language-Team"]
+
+        po.save(str(po_file))
+        write_compiled_catalog(po_file)
+
+    console.print(f"[green]Updated {len(po_files)} file(s) and their compiled catalogs[/green]")
+    console.print("Translate new strings and run 'mkdocs-quiz translations check' to verify")
+
+
+@translations.command("compile")
+def compile_translations() -> None:
+    """Compile the built-in .po files into the catalogs loaded when building sites.
+
+    Run this after editing a .po file. The .po files are the source of truth;
+    the compiled `.json` catalogs next to them are generated and committed.
+    """
+    po_files = sorted(LOCALES_DIR.glob("*.po"))
+    for po_file in po_files:
+        catalog_file = write_compiled_catalog(po_file)
+        console.print(f"  Compiled {po_file.name} to {catalog_file.name}")
+    console.print(f"[green]Compiled {len(po_files)} catalog(s)[/green]")
+
+
+@translations.command("check")
+def check_translations() -> None:
+    """Check translation completeness and validity."""
+    locales_dir = LOCALES_DIR
+    pot_file = locales_dir / "mkdocs_quiz.pot"
+
+    # Load template to get expected strings
+    pot = polib.pofile(str(pot_file))
+    expected_strings = {entry.msgid for entry in pot if entry.msgid}
+
+    # Find all .po files (excluding en if it exists)
+    po_files = [f for f in locales_dir.glob("*.po") if f.stem.lower() != "en"]
+
+    console.print("[bold]Checking translation files...[/bold]\n")
+
+    all_valid = True
+    for po_file in po_files:
+        po = polib.pofile(str(po_file))
+        language = po_file.stem
+
+        # Get strings present in .po file (non-obsolete)
+        po_strings = {entry.msgid for entry in po if entry.msgid and not entry.obsolete}
+
+        # Find missing strings (in template but not in .po)
+        missing_strings = expected_strings - po_strings
+
+        # Standard polib checks
+        total = len(po)
+        translated = len(po.translated_entries())
+        untranslated = len(po.untranslated_entries())
+        fuzzy = len(po.fuzzy_entries())
+        obsolete = len(po.obsolete_entries())
+
+        percentage = (translated / total * 100) if total > 0 else 0
+
+        console.print(f"[bold]Language: {language}[/bold]")
+        console.print(f"  File: {po_file.name}")
+        console.print(f"  Total strings: {total}")
+        console.print(f"  Translated: {translated} ({percentage:.1f}%)")
+        console.print(f"  Untranslated: {untranslated}")
+        console.print(f"  Fuzzy: {fuzzy}")
+        console.print(f"  Obsolete: {obsolete}")
+
+        if missing_strings:
+            console.print(f"  Missing: {len(missing_strings)} (not in .po file)")
+            all_valid = False
+
+        if untranslated > 0 or fuzzy > 0 or obsolete > 0 or missing_strings:
+            all_valid = False
+            if missing_strings:
+                console.print("  Status: [yellow]Missing strings from source code[/yellow]")
+                console.print("  Fix: Run 'mkdocs-quiz translations update' to sync")
+            elif obsolete > 0:
+                console.print(
+                    "  Status: [yellow]Has obsolete entries (orphaned translation keys)[/yellow]"
+                )
+                console.print("  Fix: Remove obsolete entries marked with #~ prefix")
+            else:
+                console.print("  Status: [yellow]Incomplete[/yellow]")
+        else:
+            console.print("  Status: [green]Complete[/green]")
+
+        if load_compiled_catalog(po_file) is None:
+            all_valid = False
+            console.print("  Compiled catalog: [yellow]Out of date[/yellow]")
+            console.print("  Fix: Run 'mkdocs-quiz translations compile'")
+
+        console.print()
+
+    if not all_valid:
+        console.print("[red]Some translation files are incomplete or have errors[/red]")
+        sys.exit(1)
+    else:
+        console.print("[green]All translation files are complete![/green]")
@@ -0,0 +1,387 @@
+"""Batched Markdown conversion of the fragments of a quiz.
+
+A quiz is rendered from several independent Markdown fragments: the question,
+every answer, per-answer feedback and the content section. Running the Markdown
+pipeline once per fragment dominates quiz rendering, so fragments are joined with
+HTML comment sentinels, converted in one pass and split again.
+
+Batching is only used when the result is guaranteed to match converting each
+fragment on its own. Fragments using document-wide Markdown state (headings and
+their ids, footnotes, abbreviations, reference definitions, content tabs and
+code blocks with numbered line ids), raw HTML blocks or
+block syntax that could swallow a sentinel (like an unclosed code fence) are
+converted one by one, and so is a batch whose sentinels don't come out of the
+conversion intact.
+
+Answers and feedback are mostly short labels like "True" or "`list.sort()`".
+When only extensions known to leave such text alone are configured, fragments
+without any Markdown syntax are just HTML-escaped, and single-line fragments
+with inline syntax only skip the preprocessors and block parser.
+
+Identical fragments ("True", "None of the above", standard feedback) recur
+across a site, so rendered fragments are memoized for the whole build in a
+size-bounded `FragmentMemo`.
+"""
+
+from __future__ import annotations
+
+import html
+import logging
+import re
+import sys
+import xml.etree.ElementTree as etree
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from .cache import LINK_HINT_REGEX, SNIPPET_MARKER
+
+if TYPE_CHECKING:
+    import markdown as md
+
+SENTINEL_TEMPLATE = "<!-- mkdocs-quiz-fragment-{} -->"
+
+_SENTINEL_REGEX = re.compile(r"<!-- mkdocs-quiz-fragment-(\d+) -->")
+
+# Markdown whose meaning depends on the rest of the document (including ids
+# numbered per document, like `pymdownx.tabbed` tabs), or that can open a block
+# extending past the end of the fragment
+_UNBATCHABLE_REGEX = re.compile(
+    r"^ {0,3}(?:#|<|///|:::|===|\[[^\]]+\]:|\*\[|(?:=+|-+)[ \t]*$)|\[\^|\[TOC\]",
+    re.MULTILINE,
+)
+
+# Lines with a code fence, and anything before it on the line
+_FENCE_REGEX = re.compile(
+    r"^(?P<prefix>[ \t>*+\-\d.)]*)(?P<fence>`{3,}|~{3,})(?P<rest>.*)$", re.MULTILINE
+)
+
+# Extensions that treat the start of the document specially
+_UNBATCHABLE_EXTENSIONS = frozenset({"meta", "markdown.extensions.meta"})
+
+# `pymdownx.highlight` options numbering the code blocks of a document in their ids
+_NUMBERED_CODE_OPTIONS = ("anchor_linenums", "line_anchors", "line_spans")
+
+# Approximate memory used by a memo entry besides its strings (key tuple, dict node)
+_MEMO_ENTRY_OVERHEAD = 200
+
+# Extensions that don't change text without Markdown syntax, and don't preprocess
+# single lines without block syntax. Others (e.g. `smarty`, `pymdownx.magiclink`
+# or `pymdownx.smartsymbols`) disable the fast paths.
+FAST_PATH_EXTENSIONS = frozenset(
+    {
+        "admonition",
+        "attr_list",
+        "def_list",
+        "fenced_code",
+        "footnotes",
+        "md_in_html",
+        "sane_lists",
+        "tables",
+        "toc",
+        "pymdownx.arithmatex",
+        "pymdownx.betterem",
+        "pymdownx.caret",
+        "pymdownx.details",
+        "pymdownx.emoji",
+        "pymdownx.highlight",
+        "pymdownx.inlinehilite",
+        "pymdownx.keys",
+        "pymdownx.mark",
+        "pymdownx.snippets",
+        "pymdownx.superfences",
+        "pymdownx.tabbed",
+        "pymdownx.tasklist",
+        "pymdownx.tilde",
+    }
+)
+
+# Words, spaces and punctuation that no allowed extension gives a meaning to
+_PLAIN_TEXT_REGEX = re.compile(r"(?:[^\W_]|[ ,.?!%/;()&>'\"-])+")
+
+# Character and entity references, which Markdown's HTML preprocessor rewrites
+_REFERENCE_REGEX = re.compile(r"&#?[a-zA-Z0-9]")
+
+# Syntax only recognised by the preprocessors or block parser
+_BLOCK_SYNTAX_REGEX = re.compile(
+    r"^(?:\s|[#>:<=|]|[-+*][ \t]|\d+\.[ \t]|```|~~~|!!!|\?\?\?|///|\[\^?[^\]]*\]:|\*\[)"
+    r"|^([-*_])(?:\s*\1){2,}\s*$|--8<--|\s$|[\n\r\t\x02\x03]"
+)
+
+
+def _has_unbalanced_fence(fragment: str) -> bool:
+    """Check whether a fragment leaves a code fence open, or may do so.
+
+    An open fence doesn't end with its fragment when batched: fence parsers like
+    `pymdownx.superfences` can match it with a fence of a later fragment, turning
+    fenced code in between into text.
+
+    Args:
+        fragment: A Markdown fragment.
+
+    Returns:
+        True if a fence is left open, or a fence is nested in a list, blockquote
+        or indented code block, where it isn't tracked.
+    """
+    open_fence = None
+    for match in _FENCE_REGEX.finditer(fragment):
+        prefix, fence, rest = match.group("prefix", "fence", "rest")
+        if len(prefix) > 3 or prefix.strip(" "):
+            return True
+        if open_fence is None:
+            # A backtick in the info string makes it inline code, not a fence
+            if not (fence[0] == "`" and "`" in rest):
+                open_fence = fence
+        elif fence[0] == open_fence[0] and len(fence) >= len(open_fence) and not rest.strip():
+            open_fence = None
+    return open_fence is not None
+
+
+def _numbers_code_blocks(mdx_configs: Mapping[str, Any]) -> bool:
+    """Check whether code blocks get ids numbered per document, like `__codelineno-0-1`."""
+    highlight = mdx_configs.get("pymdownx.highlight") or {}
+    return any(highlight.get(option) for option in _NUMBERED_CODE_OPTIONS)
+
+
+def can_batch(
+    fragments: Sequence[str],
+    extensions: Sequence[object],
+    mdx_configs: Mapping[str, Any] | None = None,
+) -> bool:
+    """Check whether fragments can be converted in a single Markdown pass.
+
+    Args:
+        fragments: The Markdown fragments of a quiz.
+        extensions: The configured `markdown_extensions`.
+        mdx_configs: The configured extension options.
+
+    Returns:
+        True if batched conversion gives the same output as converting each
+        fragment on its own.
+    """
+    if len(fragments) < 2:
+        return False
+    if any(ext in _UNBATCHABLE_EXTENSIONS for ext in extensions if isinstance(ext, str)):
+        return False
+    numbered_code = _numbers_code_blocks(mdx_configs or {})
+    return not any(
+        SNIPPET_MARKER in fragment
+        or _SENTINEL_REGEX.search(fragment)
+        or _UNBATCHABLE_REGEX.search(fragment)
+        or _has_unbalanced_fence(fragment)
+        or (numbered_code and _FENCE_REGEX.search(fragment))
+        for fragment in fragments
+    )
+
+
+def fast_paths_enabled(extensions: Sequence[object]) -> bool:
+    """Check whether the configured extensions allow the inline fast paths.
+
+    Args:
+        extensions: The configured `markdown_extensions`.
+
+    Returns:
+        True if every extension is in `FAST_PATH_EXTENSIONS`.
+    """
+    return all(
+        isinstance(ext, str) and ext.rsplit("markdown.extensions.", 1)[-1] in FAST_PATH_EXTENSIONS
+        for ext in extensions
+    )
+
+
+def render_plain_text(text: str) -> str | None:
+    """Render a fragment without any Markdown syntax.
+
+    Args:
+        text: A single line of Markdown.
+
+    Returns:
+        The HTML-escaped text, or None if the fragment contains Markdown syntax.
+    """
+    if (
+        not _PLAIN_TEXT_REGEX.fullmatch(text)
+        or _BLOCK_SYNTAX_REGEX.search(text)
+        or _REFERENCE_REGEX.search(text)
+    ):
+        return None
+    return html.escape(text, quote=False)
+
+
+def is_inline_only(text: str) -> bool:
+    """Check whether a fragment is a single line without block-level syntax."""
+    return bool(text) and not (
+        _BLOCK_SYNTAX_REGEX.search(text) or _REFERENCE_REGEX.search(text) or "[^" in text
+    )
+
+
+def render_inline(md_inst: md.Markdown, fragments: Sequence[str]) -> list[str] | None:
+    """Render single-line fragments with inline syntax only, without their paragraphs.
+
+    Each fragment is put into a paragraph element directly, as the block parser
+    would, and only the tree processors (inline patterns, link resolution,
+    attribute lists, ...), serializer and postprocessors are run, once for all
+    fragments.
+
+    Args:
+        md_inst: Markdown instance bound to the page.
+        fragments: Fragments for which `is_inline_only()` is true.
+
+    Returns:
+        The HTML of each fragment, without the enclosing `<p>`, or None if a tree
+        processor replaced a paragraph (e.g. the `toc` extension's `[TOC]` marker).
+    """
+    md_inst.reset()
+    root = etree.Element(md_inst.doc_tag)
+    paragraphs = []
+    for text in fragments:
+        paragraph = etree.SubElement(root, "p")
+        paragraph.text = text
+        paragraphs.append(paragraph)
+    for treeprocessor in md_inst.treeprocessors:
+        new_root = treeprocessor.run(root)
+        if new_root is not None:
+            root = new_root
+    if list(root) != paragraphs:
+        return None
+
+    rendered = []
+    for paragraph in paragraphs:
+        # Serialize and postprocess like `Markdown.convert()`
+        output = md_inst.serializer(paragraph).strip()
+        for postprocessor in md_inst.postprocessors:
+            output = postprocessor.run(output)
+        output = output.strip()
+        if output.startswith("<p>") and output.endswith("</p>"):
+            output = output[3:-4]
+        rendered.append(output)
+    return rendered
+
+
+def join_fragments(fragments: Sequence[str]) -> str:
+    """Join fragments into one Markdown document, separated by sentinel comments."""
+    parts = [fragments[0]]
+    for i, fragment in enumerate(fragments[1:]):
+        parts.append(SENTINEL_TEMPLATE.format(i))
+        parts.append(fragment)
+    return "\n\n".join(parts)
+
+
+def split_fragments(output: str, count: int) -> list[str] | None:
+    """Split the HTML of a batched conversion back into per-fragment HTML.
+
+    Args:
+        output: The converted output of `join_fragments()`.
+        count: The number of fragments that were joined.
+
+    Returns:
+        The HTML of each fragment, or None if the sentinels didn't survive the
+        conversion unchanged and in order.
+    """
+    sentinels = list(_SENTINEL_REGEX.finditer(output))
+    if [int(m.group(1)) for m in sentinels] != list(range(count - 1)):
+        return None
+    bounds = [0]
+    for m in sentinels:
+        bounds += [m.start(), m.end()]
+    bounds.append(len(output))
+    return [output[bounds[i] : bounds[i + 1]].strip() for i in range(0, len(bounds), 2)]
+
+
+@contextmanager
+def held_logs() -> Iterator[list[logging.LogRecord]]:
+    """Hold back records logged to MkDocs loggers inside the block.
+
+    A batched conversion that has to be redone fragment by fragment must not
+    log its warnings (e.g. for broken links) twice. Records are collected
+    instead of emitted, and can be released with `release_logs()`.
+
+    Yields:
+        The list that held records are appended to.
+    """
+    records: list[logging.LogRecord] = []
+
+    class _Holder(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            records.append(record)
+
+    logger = logging.getLogger("mkdocs")
+    handlers, propagate = logger.handlers, logger.propagate
+    logger.handlers = [_Holder()]
+    logger.propagate = False
+    try:
+        yield records
+    finally:
+        logger.handlers = handlers
+        logger.propagate = propagate
+
+
+def release_logs(records: list[logging.LogRecord]) -> None:
+    """Emit records held back by `held_logs()` through their original loggers."""
+    for record in records:
+        logging.getLogger(record.name).handle(record)
+
+
+class FragmentMemo:
+    """In-memory LRU memo of rendered fragments with a memory budget."""
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize an empty memo.
+
+        Args:
+            max_size: Maximum approximate memory used by all entries, in bytes.
+        """
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+
+    @staticmethod
+    def make_key(kind: str, text: str, src_uri: str) -> tuple[str, str, str] | None:
+        """Build the memo key of a fragment.
+
+        Relative links and images are rewritten for the page they are on, so the
+        page is only part of the key for fragments that may contain them. All
+        other fragments are shared across pages.
+
+        Args:
+            kind: How the fragment is rendered (e.g. inline or full conversion).
+            text: The fragment's Markdown.
+            src_uri: The source path of the page.
+
+        Returns:
+            The key, or None if the fragment can't be memoized.
+        """
+        if SNIPPET_MARKER in text:
+            return None
+        return (kind, text, src_uri if LINK_HINT_REGEX.search(text) else "")
+
+    def get(self, key: tuple[str, str, str]) -> str | None:
+        """Return a memoized fragment and mark it as recently used."""
+        fragment_html = self._entries.get(key)
+        if fragment_html is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return fragment_html
+
+    def set(self, key: tuple[str, str, str], fragment_html: str) -> None:
+        """Store a fragment, evicting the least recently used ones to stay in budget."""
+        entry_size = self._entry_size(key, fragment_html)
+        if key in self._entries or entry_size > self.max_size:
+            return
+        self._entries[key] = fragment_html
+        self.size += entry_size
+        while self.size > self.max_size:
+            old_key, old_html = self._entries.popitem(last=False)
+            self.size -= self._entry_size(old_key, old_html)
+
+    def __len__(self) -> int:
+        """Return the number of memoized fragments."""
+        return len(self._entries)
+
+    @staticmethod
+    def _entry_size(key: tuple[str, str, str], fragment_html: str) -> int:
+        return sys.getsizeof(key[1]) + sys.getsizeof(fragment_html) + _MEMO_ENTRY_OVERHEAD
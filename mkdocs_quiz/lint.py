@@ -0,0 +1,331 @@
+"""Checking quizzes in markdown files without building the site.
+
+`mkdocs-quiz lint` applies the rules the plugin fails or warns on while
+building: invalid checkboxes, missing questions or correct answers, feedback
+separated from its answer, and old v0.x quiz syntax. Unlike a build, which stops
+at the first invalid quiz, every issue of every file is reported. Pages are
+skipped when the build would skip them, according to their `quiz: {enabled: ...}`
+front matter and the `enabled_by_default` option read from `mkdocs.yml`.
+
+Many files are checked in forked worker processes. Results are cached by path,
+size and modification time, so runs from a pre-commit hook only check changed
+files.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import multiprocessing
+import os
+import re
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from . import __version__
+from .parsing import (
+    OLD_SYNTAX_TAGS,
+    QUIZ_START_TAG,
+    quiz_enabled,
+    scan_markdown,
+    validate_quiz,
+)
+
+# Default location of the lint results cache, next to the plugin's build cache
+DEFAULT_CACHE_FILE = ".cache/plugin/mkdocs-quiz/lint.json"
+
+# Anything the checks look at; files without any of these have nothing to report
+_MARKERS = (QUIZ_START_TAG, *OLD_SYNTAX_TAGS)
+
+# Files to check per worker process; fewer are checked faster than a worker starts
+_FILES_PER_WORKER = 100
+
+# YAML front matter, matched like MkDocs does
+_FRONT_MATTER_REGEX = re.compile(r"^-{3}[ \t]*\n(.*?\n)(?:\.{3}|-{3})[ \t]*\n", re.DOTALL)
+
+# Name of the plugin in the `plugins` list of mkdocs.yml
+_PLUGIN_NAME = "mkdocs_quiz"
+
+
+@dataclass(frozen=True)
+class LintIssue:
+    """A problem found in a markdown file."""
+
+    line: int
+    """Line number of the quiz (or old syntax tag), starting at 1."""
+    message: str
+    """Description of the problem."""
+    error: bool = True
+    """Whether the build fails on it. Otherwise the build logs it as a warning."""
+
+
+@dataclass(frozen=True)
+class LintConfig:
+    """Site settings that change which quizzes are checked."""
+
+    docs_dir: Path = Path("docs")
+    """Directory checked when no paths are given."""
+    enabled_by_default: bool = True
+    """The plugin `enabled_by_default` option."""
+
+
+def read_config(config_file: Path) -> LintConfig:
+    """Read the lint settings from a MkDocs configuration file.
+
+    Args:
+        config_file: Path to `mkdocs.yml`. A missing file gives the defaults.
+
+    Returns:
+        The settings, with `docs_dir` resolved relative to the configuration file.
+
+    Raises:
+        ValueError: If the file isn't valid YAML.
+    """
+    import yaml  # type: ignore[import-untyped]
+
+    try:
+        text = config_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return LintConfig(docs_dir=config_file.parent / "docs")
+
+    # Ignore tags like !!python/name and !ENV, which MkDocs configs often use
+    class _SafeLoaderIgnoreUnknown(yaml.SafeLoader):
+        pass
+
+    _SafeLoaderIgnoreUnknown.add_multi_constructor("", lambda loader, suffix, node: None)
+    try:
+        data = yaml.load(text, Loader=_SafeLoaderIgnoreUnknown)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Failed to parse {config_file}: {e}") from e
+    if not isinstance(data, dict):
+        data = {}
+
+    plugins = data.get("plugins") or []
+    if isinstance(plugins, dict):
+        plugins = [plugins]
+    plugin_config: dict[str, Any] = {}
+    for plugin in plugins:
+        if isinstance(plugin, dict) and isinstance(plugin.get(_PLUGIN_NAME), dict):
+            plugin_config = plugin[_PLUGIN_NAME]
+
+    docs_dir = data.get("docs_dir")
+    return LintConfig(
+        docs_dir=config_file.parent / (docs_dir if isinstance(docs_dir, str) else "docs"),
+        enabled_by_default=bool(plugin_config.get("enabled_by_default", True)),
+    )
+
+
+def read_front_matter(markdown: str) -> dict[str, Any]:
+    """Read the YAML front matter of a markdown document.
+
+    Args:
+        markdown: The markdown source.
+
+    Returns:
+        The front matter, or an empty dict if there is none or it isn't valid.
+    """
+    match = _FRONT_MATTER_REGEX.match(markdown)
+    if match is None:
+        return {}
+
+    import yaml  # type: ignore[import-untyped]
+
+    try:
+        meta = yaml.safe_load(match.group(1))
+    except yaml.YAMLError:
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def lint_markdown(markdown: str, enabled_by_default: bool = True) -> list[LintIssue]:
+    """Check all quizzes in a markdown document.
+
+    Quizzes in fenced code blocks and pages with quizzes disabled are ignored,
+    like when building.
+
+    Args:
+        markdown: The markdown source, including any front matter.
+        enabled_by_default: The plugin `enabled_by_default` option.
+
+    Returns:
+        The issues found, in the order they appear.
+    """
+    if not any(marker in markdown for marker in _MARKERS):
+        return []
+    meta = read_front_matter(markdown) if markdown.startswith("---") else {}
+    if not quiz_enabled(meta, enabled_by_default):
+        return []
+
+    scan = scan_markdown(markdown)
+    issues = []
+    if scan.old_syntax:
+        issues.append(
+            LintIssue(
+                markdown.count("\n", 0, scan.old_syntax[0]) + 1,
+                "Old mkdocs-quiz syntax, run 'mkdocs-quiz migrate' to update it",
+            )
+        )
+
+    line, offset = 1, 0
+    for quiz_id, match in enumerate(scan.quizzes):
+        line += markdown.count("\n", offset, match.start())
+        offset = match.start()
+        warnings: list[str] = []
+        try:
+            validate_quiz(match.group(1), warnings.append)
+        except ValueError as e:
+            # Any warning is about the same problem, which the error describes
+            issues.append(LintIssue(line, f"Quiz #{quiz_id + 1}: {e}"))
+        else:
+            issues.extend(
+                LintIssue(line, f"Quiz #{quiz_id + 1}: {warning}", error=False)
+                for warning in warnings
+            )
+    return sorted(issues, key=lambda issue: issue.line)
+
+
+def lint_file(path: Path, enabled_by_default: bool = True) -> list[LintIssue]:
+    """Check all quizzes in a markdown file.
+
+    Args:
+        path: Path to the markdown file.
+        enabled_by_default: The plugin `enabled_by_default` option.
+
+    Returns:
+        The issues found. An unreadable file is reported as an error on line 1.
+    """
+    try:
+        markdown = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        return [LintIssue(1, f"Could not read file: {e}")]
+    return lint_markdown(markdown, enabled_by_default)
+
+
+def find_markdown_files(paths: Iterable[Path]) -> list[Path]:
+    """Expand directories into the markdown files they contain.
+
+    Args:
+        paths: Markdown files and directories.
+
+    Returns:
+        The files, and the `*.md` files found recursively in each directory, sorted.
+    """
+    files: set[Path] = set()
+    for path in paths:
+        if path.is_dir():
+            files.update(path.rglob("*.md"))
+        else:
+            files.add(path)
+    return sorted(files)
+
+
+class LintCache:
+    """Lint results of files, by path, size and modification time, stored as JSON."""
+
+    def __init__(self, path: Path | None, settings: dict[str, Any] | None = None) -> None:
+        """Load the cached results.
+
+        Results stored by another version of mkdocs-quiz, whose rules may differ,
+        or with other settings, are discarded.
+
+        Args:
+            path: The cache file, or None to keep nothing between runs.
+            settings: The settings the results depend on.
+        """
+        self.path = path
+        self.settings = settings or {}
+        self._entries: dict[str, list[Any]] = {}
+        if path is None:
+            return
+        try:
+            data = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return
+        if (
+            isinstance(data, dict)
+            and data.get("version") == __version__
+            and data.get("settings", {}) == self.settings
+        ):
+            self._entries = data.get("files", {})
+
+    def get(self, path: Path, stat: os.stat_result) -> list[LintIssue] | None:
+        """Return the cached issues of a file, unless it changed since it was checked."""
+        entry = self._entries.get(os.path.abspath(path))
+        if entry is None or entry[:2] != [stat.st_size, stat.st_mtime_ns]:
+            return None
+        return [LintIssue(**issue) for issue in entry[2]]
+
+    def set(self, path: Path, stat: os.stat_result, issues: list[LintIssue]) -> None:
+        """Store the issues of a file."""
+        self._entries[os.path.abspath(path)] = [
+            stat.st_size,
+            stat.st_mtime_ns,
+            [asdict(issue) for issue in issues],
+        ]
+
+    def save(self) -> None:
+        """Write the cache file, if any. Failing to write it only costs the next run time."""
+        if self.path is None:
+            return
+        data = {"version": __version__, "settings": self.settings, "files": self._entries}
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+
+def lint_files(
+    files: list[Path], cache_file: Path | None = None, enabled_by_default: bool = True
+) -> dict[Path, list[LintIssue]]:
+    """Check the quizzes of many markdown files.
+
+    Files that changed since they were cached are checked, in worker processes
+    when there are enough of them and more than one CPU core.
+
+    Args:
+        files: The markdown files.
+        cache_file: File to cache results in between runs, or None.
+        enabled_by_default: The plugin `enabled_by_default` option.
+
+    Returns:
+        The issues found in each file, for the files with issues.
+    """
+    cache = LintCache(cache_file, {"enabled_by_default": enabled_by_default})
+    results: dict[Path, list[LintIssue]] = {}
+    to_check: list[tuple[Path, os.stat_result | None]] = []
+    for path in files:
+        try:
+            stat = path.stat()
+        except OSError:
+            to_check.append((path, None))
+            continue
+        cached = cache.get(path, stat)
+        if cached is None:
+            to_check.append((path, stat))
+        else:
+            results[path] = cached
+
+    if to_check:
+        paths = [path for path, _stat in to_check]
+        check = functools.partial(lint_file, enabled_by_default=enabled_by_default)
+        workers = min(os.cpu_count() or 1, len(paths) // _FILES_PER_WORKER)
+        if workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(workers, mp_context=context) as executor:
+                chunksize = -(-len(paths) // (workers * 4))
+                checked = list(executor.map(check, paths, chunksize=chunksize))
+        else:
+            checked = [check(path) for path in paths]
+        for (path, checked_stat), issues in zip(to_check, checked):
+            results[path] = issues
+            if checked_stat is not None:
+                cache.set(path, checked_stat, issues)
+        cache.save()
+
+    return {path: results[path] for path in files if results[path]}
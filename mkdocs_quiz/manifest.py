@@ -0,0 +1,253 @@
+"""Site-wide quiz manifest written at the end of a build.
+
+With the `manifest` option, the plugin writes `quizzes.json` to the site
+directory, describing every quiz of the site: a stable id, the page it is on, its
+anchor, type, question, answers or blanks and the line in the source file. Tools such as
+the CLI can load a site's whole quiz bank from this one file instead of fetching
+every page and extracting the quiz sources embedded in the HTML.
+
+With `manifest_split`, `quizzes.json` only lists the pages with quizzes, and the
+quizzes of each page are written to their own file under `quizzes/`.
+
+The format is versioned with `MANIFEST_VERSION`, which is increased whenever a
+change would break existing readers.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import posixpath
+import re
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from .qti.extractor import parse_quiz_content
+from .qti.models import Answer, Blank, Quiz
+
+MANIFEST_VERSION = 1
+
+MANIFEST_FILENAME = "quizzes.json"
+
+# Directory of the per-page manifests written with `manifest_split`
+PAGE_MANIFEST_DIR = "quizzes"
+
+# Hex digits of the hash used as quiz id
+_ID_LENGTH = 12
+
+
+def quiz_id(src_uri: str, source: str, seen: dict[str, int]) -> str:
+    """Return the stable id of a quiz.
+
+    Unlike the `quiz-N` anchor, which changes when a quiz is added above it, the
+    id only depends on the page source path and the quiz source, so tools can
+    track a quiz (e.g. its results) across rebuilds.
+
+    Args:
+        src_uri: Source path of the page, relative to the docs directory.
+        source: The content inside the quiz tags.
+        seen: Ids already given to quizzes of the page, with their counts.
+            Identical quizzes on a page get a `-2`, `-3`... suffix.
+
+    Returns:
+        The quiz id, e.g. `3f2a9c0d1b7e`.
+    """
+    digest = hashlib.sha256(f"{src_uri}\n{source.strip()}".encode()).hexdigest()
+    base = digest[:_ID_LENGTH]
+    seen[base] = seen.get(base, 0) + 1
+    return base if seen[base] == 1 else f"{base}-{seen[base]}"
+
+
+def quiz_entries(
+    quizzes: Iterable[re.Match[str]], page_url: str, src_uri: str, markdown: str, line_offset: int
+) -> list[dict[str, Any]]:
+    """Describe the quizzes of a page as manifest entries.
+
+    Args:
+        quizzes: Quiz matches in the page markdown, in page order (see `find_quizzes`).
+        page_url: URL of the page, relative to the site root.
+        src_uri: Source path of the page, relative to the docs directory.
+        markdown: The page markdown the quizzes were found in.
+        line_offset: Number of source file lines before the markdown (front matter).
+
+    Returns:
+        One entry per quiz. Quizzes that can't be parsed are left out; the build
+        reports them when the page is rendered.
+    """
+    entries = []
+    seen: dict[str, int] = {}
+    line = line_offset + 1
+    last_start = 0
+    for index, match in enumerate(quizzes):
+        line += markdown.count("\n", last_start, match.start())
+        last_start = match.start()
+        quiz = parse_quiz_content(match.group(1))
+        if quiz is None:
+            continue
+
+        if quiz.is_fill_in_blank:
+            quiz_type = "fill-blank"
+        else:
+            quiz_type = "multiple" if quiz.is_multiple_choice else "single"
+        entry: dict[str, Any] = {
+            "id": quiz_id(src_uri, match.group(1), seen),
+            "page": page_url,
+            "anchor": f"quiz-{index}",
+            "src": src_uri,
+            "line": line,
+            "type": quiz_type,
+            "question": quiz.question,
+        }
+        if quiz.is_fill_in_blank:
+            entry["blanks"] = [blank.correct_answer for blank in quiz.blanks]
+        else:
+            entry["answers"] = [_answer_entry(answer) for answer in quiz.answers]
+        if quiz.content:
+            entry["content"] = quiz.content
+        entries.append(entry)
+    return entries
+
+
+def _answer_entry(answer: Answer) -> dict[str, Any]:
+    entry: dict[str, Any] = {"text": answer.text, "correct": answer.is_correct}
+    if answer.feedback:
+        entry["feedback"] = answer.feedback
+    return entry
+
+
+def page_manifest_uri(src_uri: str) -> str:
+    """Return the site path of the per-page manifest of a page (`manifest_split`).
+
+    Args:
+        src_uri: Source path of the page, e.g. `guide/intro.md`.
+
+    Returns:
+        The manifest path, e.g. `quizzes/guide/intro.json`.
+    """
+    return posixpath.join(PAGE_MANIFEST_DIR, posixpath.splitext(src_uri)[0] + ".json")
+
+
+def write_manifests(
+    site_dir: Path, pages: Mapping[str, list[dict[str, Any]]], generator: str, split: bool
+) -> int:
+    """Write the site manifest, and with `split` one manifest per page.
+
+    Args:
+        site_dir: The built site directory.
+        pages: Manifest entries of each page with quizzes, by source path.
+        generator: Name and version of the plugin, recorded in every manifest.
+        split: Whether to write the quizzes of each page to their own file.
+
+    Returns:
+        The number of quizzes in the manifest.
+    """
+    header = {"version": MANIFEST_VERSION, "generator": generator}
+    pages = {src_uri: entries for src_uri, entries in pages.items() if entries}
+    if split:
+        index = []
+        for src_uri, entries in pages.items():
+            page_uri = page_manifest_uri(src_uri)
+            _write_json(site_dir / page_uri, {**header, "quizzes": entries})
+            index.append(
+                {
+                    "page": entries[0]["page"],
+                    "src": src_uri,
+                    "quizzes": len(entries),
+                    "manifest": page_uri,
+                }
+            )
+        manifest: dict[str, Any] = {**header, "pages": index}
+    else:
+        manifest = {**header, "quizzes": [entry for entries in pages.values() for entry in entries]}
+    _write_json(site_dir / MANIFEST_FILENAME, manifest)
+    return sum(len(entries) for entries in pages.values())
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+
+
+def load_manifest(data: Any) -> dict[str, Any]:
+    """Validate decoded manifest data.
+
+    Args:
+        data: The decoded JSON of a manifest.
+
+    Returns:
+        The manifest.
+
+    Raises:
+        ValueError: If the data isn't a manifest this version can read.
+    """
+    if not isinstance(data, dict) or "version" not in data:
+        raise ValueError("Not a mkdocs-quiz manifest")
+    if data["version"] > MANIFEST_VERSION:
+        raise ValueError(
+            f"Unsupported quiz manifest version {data['version']} "
+            f"(this version of mkdocs-quiz reads up to {MANIFEST_VERSION}), "
+            "try upgrading mkdocs-quiz"
+        )
+    return data
+
+
+def quizzes_from_manifest(manifest: Mapping[str, Any]) -> list[Quiz]:
+    """Build quiz objects from the entries of a (per-page or unsplit) manifest.
+
+    Args:
+        manifest: A manifest with a `quizzes` list.
+
+    Returns:
+        The quizzes, in manifest order.
+    """
+    quizzes = []
+    for entry in manifest.get("quizzes", []):
+        answers = [
+            Answer(
+                text=answer["text"],
+                is_correct=answer["correct"],
+                identifier=f"answer_{i}",
+                feedback=answer.get("feedback"),
+            )
+            for i, answer in enumerate(entry.get("answers", []))
+        ]
+        blanks = [
+            Blank(correct_answer=answer, identifier=f"blank_{i}")
+            for i, answer in enumerate(entry.get("blanks", []))
+        ]
+        quizzes.append(
+            Quiz(
+                question=entry["question"],
+                answers=answers,
+                blanks=blanks,
+                content=entry.get("content"),
+                identifier=f"{entry['page']}#{entry['anchor']}",
+                source_file=Path(entry["src"]),
+                source_line=entry.get("line"),
+            )
+        )
+    return quizzes
+
+
+def read_manifest_quizzes(data: Any, load: Callable[[str], Any]) -> list[Quiz]:
+    """Build quiz objects from a site manifest, loading per-page manifests if split.
+
+    Args:
+        data: The decoded JSON of `quizzes.json` or of a per-page manifest.
+        load: Loads and decodes a per-page manifest, given its path relative to
+            the site manifest.
+
+    Returns:
+        All quizzes of the manifest, in site order.
+
+    Raises:
+        ValueError: If a manifest isn't a manifest this version can read.
+    """
+    manifest = load_manifest(data)
+    if "quizzes" in manifest:
+        return quizzes_from_manifest(manifest)
+    quizzes = []
+    for page in manifest.get("pages", []):
+        quizzes += quizzes_from_manifest(load_manifest(load(page["manifest"])))
+    return quizzes
@@ -0,0 +1,279 @@
+"""Conservative minification of the bundled quiz CSS and JavaScript.
+
+The plugin ships readable `quiz.css` and `quiz.js` files. With `minify_assets`
+enabled, pages get minified copies instead, made on first use: comments are
+dropped and whitespace is removed wherever the code doesn't need it.
+
+The minifiers only ever remove comments and whitespace; every other token is
+kept exactly as written, so the minified code behaves like the original. Line
+breaks in JavaScript are kept where automatic semicolon insertion could depend
+on them.
+"""
+
+from __future__ import annotations
+
+import re
+
+_CSS_TOKEN_REGEX = re.compile(
+    r"""
+    (?P<comment>/\*.*?\*/)
+    | (?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+    | (?P<space>\s+)
+    | (?P<other>[^"'\s/{};,>:]+|.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# Characters that never need whitespace around them in CSS. Parentheses are
+# missing on purpose, `and (` means something else without it, and so does
+# `a :hover`, so `:` only drops the whitespace after it.
+_CSS_SEPARATORS = frozenset("{};,>")
+_CSS_SEPARATORS_BEFORE = _CSS_SEPARATORS | {":"}
+
+_JS_SPACE_REGEX = re.compile(r"[\s\ufeff]+")
+_JS_WORD_REGEX = re.compile(r"[\w$\\]+")
+_JS_NUMBER_REGEX = re.compile(r"\d[\w.]*$")
+_JS_LINE_COMMENT_REGEX = re.compile(r"//[^\n\r\u2028\u2029]*")
+
+# Keywords after which a `/` starts a regular expression instead of a division
+_JS_REGEX_KEYWORDS = frozenset(
+    {
+        "await",
+        "case",
+        "delete",
+        "do",
+        "else",
+        "in",
+        "instanceof",
+        "new",
+        "of",
+        "return",
+        "throw",
+        "typeof",
+        "void",
+        "yield",
+    }
+)
+
+# Line terminators per the ECMAScript spec
+_JS_NEWLINES = ("\n", "\r", "\u2028", "\u2029")
+
+
+def minify_css(source: str) -> str:
+    """Minify a stylesheet by removing comments and unneeded whitespace.
+
+    Args:
+        source: The CSS source.
+
+    Returns:
+        The minified CSS.
+    """
+    out: list[str] = []
+    space = False
+    for match in _CSS_TOKEN_REGEX.finditer(source):
+        kind = match.lastgroup
+        text = match.group()
+        if kind in ("comment", "space"):
+            space = True
+            continue
+        if text == "}" and out and out[-1] == ";":
+            out.pop()
+        if (
+            space
+            and out
+            and out[-1][-1] not in _CSS_SEPARATORS_BEFORE
+            and text[0] not in _CSS_SEPARATORS
+        ):
+            out.append(" ")
+        out.append(text)
+        space = False
+    return "".join(out)
+
+
+def minify_js(source: str) -> str:
+    """Minify a script by removing comments and unneeded whitespace.
+
+    Args:
+        source: The JavaScript source.
+
+    Returns:
+        The minified JavaScript.
+
+    Raises:
+        ValueError: If the source has an unterminated string, template literal,
+            regular expression or comment.
+    """
+    out: list[str] = []
+    # Whitespace seen since the last token: "" for none, " " or "\n"
+    pending = ""
+    for kind, text in js_tokens(source):
+        if kind in ("space", "comment"):
+            if kind == "comment" and text.startswith("//"):
+                # The line break ending the comment is the next space token
+                pending = pending or " "
+            else:
+                pending = "\n" if pending == "\n" or _has_newline(text) else " "
+            continue
+        if pending and out:
+            prev = out[-1]
+            if pending == "\n":
+                # A line break only matters for semicolon insertion, which can't
+                # happen after these characters or before a closing brace
+                if prev[-1] not in "{;," and text[0] != "}":
+                    out.append("\n")
+            elif _js_needs_space(prev, text):
+                out.append(" ")
+        out.append(text)
+        pending = ""
+    return "".join(out)
+
+
+def js_tokens(source: str) -> list[tuple[str, str]]:
+    """Split a script into tokens, enough to minify it safely.
+
+    Identifiers, keywords and numbers are `word` tokens and other characters are
+    single-character `punct` tokens. Strings, template literals and regular
+    expressions are kept whole, as `string`, `template` and `regex` tokens.
+    Whitespace is split into `space` tokens and comments into `comment` tokens.
+
+    Args:
+        source: The JavaScript source.
+
+    Returns:
+        A list of (kind, text) tuples that join back up to `source`.
+
+    Raises:
+        ValueError: If the source has an unterminated string, template literal,
+            regular expression or comment.
+    """
+    tokens: list[tuple[str, str]] = []
+    _scan_js(source, 0, tokens)
+    return tokens
+
+
+def _scan_js(source: str, pos: int, tokens: list[tuple[str, str]], nested: bool = False) -> int:
+    """Tokenize a script from `pos`, up to the `}` closing a template substitution if nested."""
+    depth = 0
+    length = len(source)
+    while pos < length:
+        char = source[pos]
+        if char.isspace() or char == "\ufeff":
+            match = _JS_SPACE_REGEX.match(source, pos)
+            assert match is not None
+            kind, end = "space", match.end()
+        elif source.startswith("//", pos):
+            match = _JS_LINE_COMMENT_REGEX.match(source, pos)
+            assert match is not None
+            kind, end = "comment", match.end()
+        elif source.startswith("/*", pos):
+            end = source.find("*/", pos + 2) + 2
+            if end == 1:
+                raise ValueError(f"Unterminated comment at offset {pos}")
+            kind = "comment"
+        elif char in "'\"":
+            kind, end = "string", _js_string_end(source, pos)
+        elif char == "`":
+            kind, end = "template", _js_template_end(source, pos)
+        elif char == "/" and _js_regex_allowed(tokens):
+            kind, end = "regex", _js_regex_end(source, pos)
+        elif _JS_WORD_REGEX.match(char):
+            match = _JS_WORD_REGEX.match(source, pos)
+            assert match is not None
+            kind, end = "word", match.end()
+        else:
+            if nested and char == "{":
+                depth += 1
+            elif nested and char == "}":
+                if depth == 0:
+                    return pos
+                depth -= 1
+            kind, end = "punct", pos + 1
+        tokens.append((kind, source[pos:end]))
+        pos = end
+    if nested:
+        raise ValueError("Unterminated template literal")
+    return pos
+
+
+def _js_string_end(source: str, pos: int) -> int:
+    start = pos
+    quote = source[pos]
+    pos += 1
+    while pos < len(source):
+        char = source[pos]
+        if char == "\\":
+            pos += 2
+            continue
+        if char == quote:
+            return pos + 1
+        if char in "\n\r":
+            break
+        pos += 1
+    raise ValueError(f"Unterminated string at offset {start}")
+
+
+def _js_template_end(source: str, pos: int) -> int:
+    start = pos
+    pos += 1
+    while pos < len(source):
+        char = source[pos]
+        if char == "\\":
+            pos += 2
+        elif char == "`":
+            return pos + 1
+        elif source.startswith("${", pos):
+            # Substitutions are code, which may hold braces, strings and templates
+            pos = _scan_js(source, pos + 2, [], nested=True) + 1
+        else:
+            pos += 1
+    raise ValueError(f"Unterminated template literal at offset {start}")
+
+
+def _js_regex_end(source: str, pos: int) -> int:
+    start = pos
+    pos += 1
+    in_class = False
+    while pos < len(source):
+        char = source[pos]
+        if char == "\\":
+            pos += 2
+            continue
+        if char in "\n\r":
+            break
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        elif char == "/" and not in_class:
+            match = _JS_WORD_REGEX.match(source, pos + 1)
+            return match.end() if match else pos + 1
+        pos += 1
+    raise ValueError(f"Unterminated regular expression at offset {start}")
+
+
+def _js_regex_allowed(tokens: list[tuple[str, str]]) -> bool:
+    """Check whether a `/` after these tokens starts a regular expression."""
+    for kind, text in reversed(tokens):
+        if kind in ("space", "comment"):
+            continue
+        if kind == "word":
+            return text in _JS_REGEX_KEYWORDS
+        if kind == "punct":
+            return text not in ")]}"
+        return False
+    return True
+
+
+def _js_needs_space(prev: str, text: str) -> bool:
+    """Check whether two tokens separated by spaces would merge without them."""
+    last, first = prev[-1], text[0]
+    if _JS_WORD_REGEX.match(last) and _JS_WORD_REGEX.match(first):
+        return True
+    # `a + +b`, `a - -b`, `a / /re/` and `1 .toString()`
+    if last == first and last in "+-/":
+        return True
+    return (last == "/" and first == "*") or (first == "." and bool(_JS_NUMBER_REGEX.search(prev)))
+
+
+def _has_newline(text: str) -> bool:
+    return any(newline in text for newline in _JS_NEWLINES)
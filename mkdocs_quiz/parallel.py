@@ -0,0 +1,132 @@
+"""Parallel pre-rendering of quizzes in worker processes.
+
+MkDocs runs page hooks one page at a time, so quiz rendering only uses a single
+CPU core. When the `parallel` option is enabled, the plugin renders every quiz
+of the site up front in a pool of forked worker processes, keyed exactly like the
+persistent quiz cache. `on_page_content` then looks up the finished HTML.
+
+Pre-rendering is purely an optimization: any quiz that is missing from the
+results (because it failed to render, logged a warning, or its source was changed
+by another plugin before reaching `on_page_markdown`) is rendered serially as usual.
+Errors and warnings are therefore always reported by the main process, with the
+same context as in a serial build.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.structure.files import Files
+
+if TYPE_CHECKING:
+    from .plugin import MkDocsQuizPlugin
+
+log = logging.getLogger("mkdocs.plugins.mkdocs_quiz")
+
+# Plugin state inherited by forked workers, only set while a pool is running
+_worker_state: tuple[MkDocsQuizPlugin, MkDocsConfig, Files] | None = None
+
+
+def parallel_unavailable_reason() -> str | None:
+    """Check whether quizzes can be pre-rendered in forked worker processes.
+
+    Workers rely on `fork` to inherit the loaded config, Markdown extensions and
+    file collection without pickling them.
+
+    Returns:
+        A short explanation if pre-rendering is not possible, otherwise None.
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return "the 'fork' start method is not available on this platform"
+    # Forking a multi-threaded process (e.g. `mkdocs serve`) can deadlock
+    if threading.active_count() > 1:
+        return "the build process is running other threads"
+    return None
+
+
+def resolve_workers(workers: int | None) -> int:
+    """Return the number of worker processes to use.
+
+    Args:
+        workers: The `parallel_workers` option. None uses all CPU cores.
+
+    Returns:
+        The number of worker processes, at least 1.
+    """
+    return max(1, workers or os.cpu_count() or 1)
+
+
+def prerender_quizzes(
+    plugin: MkDocsQuizPlugin,
+    config: MkDocsConfig,
+    files: Files,
+    src_uris: list[str],
+    workers: int,
+) -> dict[str, str]:
+    """Render the quizzes of documentation pages in worker processes.
+
+    Args:
+        plugin: The plugin instance, configured for this build.
+        config: The MkDocs config object.
+        files: The files of this build.
+        src_uris: The pages to render quizzes for.
+        workers: Number of worker processes.
+
+    Returns:
+        Mapping of quiz cache key to rendered quiz HTML.
+    """
+    global _worker_state
+
+    if not src_uris:
+        return {}
+
+    # Several chunks per worker to even out pages with very different quiz counts
+    chunk_size = max(1, len(src_uris) // (workers * 4))
+    chunks = [src_uris[i : i + chunk_size] for i in range(0, len(src_uris), chunk_size)]
+
+    rendered: dict[str, str] = {}
+    _worker_state = (plugin, config, files)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+        ) as executor:
+            for chunk_result in executor.map(_render_chunk, chunks):
+                rendered.update(chunk_result)
+    finally:
+        _worker_state = None
+    return rendered
+
+
+def _init_worker() -> None:
+    """Silence logging in workers, the main process reports problems when re-rendering."""
+    for name in ("", "mkdocs"):
+        logger = logging.getLogger(name)
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+    logging.getLogger("mkdocs").propagate = False
+
+
+def _render_chunk(src_uris: list[str]) -> dict[str, str]:
+    """Render the quizzes of a chunk of pages inside a worker process."""
+    assert _worker_state is not None
+    plugin, config, files = _worker_state
+
+    rendered: dict[str, str] = {}
+    for src_uri in src_uris:
+        file = files.get_file_from_path(src_uri)
+        if file is None:
+            continue
+        try:
+            rendered.update(plugin._prerender_page(file, config, files))
+        except Exception as e:
+            # The page is rendered serially instead, reporting the error there
+            log.debug(f"Pre-rendering quizzes of {src_uri} failed: {e}")
+    return rendered
@@ -6,7 +6,14 @@ in both the MkDocs plugin and QTI export functionality.
 
 from __future__ import annotations
 
+import logging
 import re
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from textwrap import dedent
+from typing import Any
+
+log = logging.getLogger("mkdocs.plugins.mkdocs_quiz")
 
 # Quiz tag patterns
 QUIZ_START_TAG = "<quiz>"
@@ -25,26 +32,63 @@ ANSWER_PATTERN = re.compile(r"^[-*]\s*\[([xX ]?)\]\s*(.*)$")
 # Example: > This is feedback text
 FEEDBACK_REGEX = re.compile(r"^\s*>\s?(.*)$")
 
-# Old v0.x syntax patterns (no longer supported)
+# Page markers replaced with the results screen and the intro text
+RESULTS_COMMENT = "<!-- mkdocs-quiz results -->"
+INTRO_COMMENT = "<!-- mkdocs-quiz intro -->"
+
+# Old v0.x syntax (no longer supported)
+OLD_SYNTAX_TAGS = ("<?quiz?>", "<?/quiz?>")
 OLD_SYNTAX_PATTERNS = [
     r"<\?quiz\?>",  # Old quiz opening tag
     r"<\?/quiz\?>",  # Old quiz closing tag
 ]
 
+_QUIZ_PATTERN = re.compile(QUIZ_REGEX, re.DOTALL)
+_OLD_SYNTAX_PATTERN = re.compile("|".join(OLD_SYNTAX_PATTERNS))
+
+# Everything the scanner stops at: a fenced code block opener (``` or ~~~, 3 or more,
+# optionally indented, at the start of a line), a quiz opening tag or old syntax
+_TOKEN_PATTERN = re.compile(
+    r"^[ \t]*(?P<fence>`{3,}|~{3,})|(?P<quiz><quiz>)|" + "|".join(OLD_SYNTAX_PATTERNS),
+    re.MULTILINE,
+)
+_FENCE_CLOSE_PATTERNS = {
+    "`": re.compile(r"^[ \t]*`{3,}", re.MULTILINE),
+    "~": re.compile(r"^[ \t]*~{3,}", re.MULTILINE),
+}
+
+# Placeholders standing in for content while the rest of the text is processed
+QUIZ_PLACEHOLDER_REGEX = re.compile(r"<!-- MKDOCS_QUIZ_PLACEHOLDER_\d+ -->")
+BLANK_PLACEHOLDER_REGEX = re.compile(r"<!--BLANK_PLACEHOLDER_\d+-->")
+CODEBLOCK_PLACEHOLDER_REGEX = re.compile(r"__CODEBLOCK_\d+__")
+
 __all__ = [
     "ANSWER_PATTERN",
+    "BLANK_PLACEHOLDER_REGEX",
     "CHECKBOX_REGEX",
+    "CODEBLOCK_PLACEHOLDER_REGEX",
     "FEEDBACK_REGEX",
     "FILL_BLANK_REGEX",
+    "INTRO_COMMENT",
     "OLD_SYNTAX_PATTERNS",
+    "OLD_SYNTAX_TAGS",
     "QUIZ_END_TAG",
+    "QUIZ_PLACEHOLDER_REGEX",
     "QUIZ_REGEX",
     "QUIZ_START_TAG",
+    "RESULTS_COMMENT",
+    "MarkdownScan",
+    "check_quiz_structure",
     "collect_feedback",
     "find_quizzes",
     "mask_code_blocks",
     "parse_answer",
+    "parse_quiz_question_and_answers",
+    "scan_markdown",
+    "split_quiz_lines",
+    "substitute_placeholders",
     "unmask_code_blocks",
+    "validate_quiz",
 ]
 
 
@@ -74,6 +118,270 @@ def collect_feedback(lines: list[str], start_idx: int) -> tuple[str | None, int]
     return feedback, i
 
 
+def parse_quiz_question_and_answers(
+    quiz_lines: list[str], warn: Callable[[str], object] | None = None
+) -> tuple[str, list[str], list[str], list[str], int]:
+    """Parse quiz question and answers from quiz lines.
+
+    The question is everything up to the first checkbox answer.
+    Answers are checkbox items (- [x], - [ ], * [x], or * [ ]).
+    Content is everything after the last answer.
+
+    Args:
+        quiz_lines: The lines of the quiz content.
+        warn: Called with the message of each warning about the quiz format.
+            Defaults to logging them as plugin warnings.
+
+    Returns:
+        A tuple of (question_text, all_answers, correct_answers, answer_feedbacks, content_start_index).
+
+    Raises:
+        ValueError: If a checkbox is invalid, or a feedback line is separated from
+            its answer by a blank line.
+    """
+    warn = warn or log.warning
+    # Find the first answer line and validate checkbox format
+    first_answer_index = None
+    for i, line in enumerate(quiz_lines):
+        # Check if this looks like a checkbox list item (any character in brackets)
+        # Supports both hyphen (-) and asterisk (*) bullets
+        checkbox_check = CHECKBOX_REGEX.match(line)
+        if checkbox_check:
+            checkbox_content = checkbox_check.group(1)
+            # Strictly validate: only accept x, X, space, or empty
+            if checkbox_content not in ["x", "X", " ", ""]:
+                raise ValueError(
+                    f"Invalid checkbox format: '[{checkbox_content}]'. "
+                    f"Only '[x]', '[X]', '[ ]', or '[]' are allowed (with - or * bullet). "
+                    f"Found in line: {line}"
+                )
+            first_answer_index = i
+            break
+
+    if first_answer_index is None:
+        # No answers found - invalid quiz structure
+        question_text = "\n".join(quiz_lines).strip()
+        warn(f"Quiz has no checkbox answers: {question_text[:50]}...")
+        return question_text, [], [], [], len(quiz_lines)
+
+    # Everything before the first answer is the question
+    question_lines = quiz_lines[:first_answer_index]
+    question_text = "\n".join(question_lines).strip()
+
+    # Parse answers starting from first_answer_index
+    all_answers: list[str] = []
+    correct_answers: list[str] = []
+    answer_feedbacks: list[str] = []
+    content_start_index = first_answer_index
+
+    i = first_answer_index
+    length = len(quiz_lines)
+    while i < length:
+        line = quiz_lines[i]
+        checkbox_pattern = CHECKBOX_REGEX.match(line)
+        if checkbox_pattern:
+            checkbox_content = checkbox_pattern.group(1)
+            if checkbox_content not in ["x", "X", " ", ""]:
+                raise ValueError(
+                    f"Invalid checkbox format: '[{checkbox_content}]'. "
+                    f"Only '[x]', '[X]', '[ ]', or '[]' are allowed (with - or * bullet). "
+                    f"Found in line: {line}"
+                )
+            is_correct = checkbox_content.lower() == "x"
+            answer_text = checkbox_pattern.group(2)
+            all_answers.append(answer_text)
+            if is_correct:
+                correct_answers.append(answer_text)
+
+            # Collect optional per-answer feedback lines immediately following the answer.
+            feedback_md, i = collect_feedback(quiz_lines, i + 1)
+            answer_feedbacks.append(feedback_md or "")
+            content_start_index = i
+            continue
+        elif not line.strip():
+            # Empty line, continue
+            i += 1
+            continue
+        elif FEEDBACK_REGEX.match(line):
+            # Feedback line separated from its answer by a blank line.
+            # Check if there are more answers after this line — if so, it's an error.
+            has_more_answers = any(
+                CHECKBOX_REGEX.match(quiz_lines[k]) for k in range(i + 1, length)
+            )
+            if has_more_answers:
+                last_answer = all_answers[-1] if all_answers else "unknown"
+                raise ValueError(
+                    f"Orphaned feedback line found after answer '{last_answer}'. "
+                    f"Feedback blockquotes (> ...) must immediately follow their answer "
+                    f"with no blank lines in between. "
+                    f"Found: {line.strip()}"
+                )
+            # After the last answer — treat as content section.
+            # Warn because this is likely unintentional feedback formatting.
+            last_answer = all_answers[-1] if all_answers else "unknown"
+            warn(
+                f"Blockquote after last answer '{last_answer}' is separated by a blank line. "
+                f"It will be treated as content, not per-answer feedback. "
+                f"Remove the blank line if you intended it as feedback."
+            )
+            break
+        else:
+            # Not a checkbox item and not empty, must be content
+            break
+
+    return question_text, all_answers, correct_answers, answer_feedbacks, content_start_index
+
+
+def split_quiz_lines(quiz_content: str) -> list[str]:
+    """Dedent the content of a quiz and split it into lines.
+
+    Quizzes can be indented, e.g. in content tabs. Leading and trailing empty
+    lines are dropped.
+
+    Args:
+        quiz_content: The content inside the quiz tags.
+
+    Returns:
+        The lines of the quiz.
+
+    Raises:
+        ValueError: If the quiz is empty.
+    """
+    quiz_lines = dedent(quiz_content).splitlines()
+    while quiz_lines and quiz_lines[0] == "":
+        quiz_lines = quiz_lines[1:]
+    while quiz_lines and quiz_lines[-1] == "":
+        quiz_lines = quiz_lines[:-1]
+    if not quiz_lines:
+        raise ValueError("Quiz content is empty")
+    return quiz_lines
+
+
+def check_quiz_structure(
+    question_text: str, all_answers: list[str], correct_answers: list[str]
+) -> None:
+    """Check that a parsed multiple-choice quiz has a question and a correct answer.
+
+    Args:
+        question_text: The question, from `parse_quiz_question_and_answers()`.
+        all_answers: All answers of the quiz.
+        correct_answers: The correct answers of the quiz.
+
+    Raises:
+        ValueError: If the question, the answers or the correct answers are missing.
+    """
+    if not question_text.strip():
+        raise ValueError("Quiz must have a question")
+    if not all_answers:
+        raise ValueError("Quiz must have at least one answer")
+    if not correct_answers:
+        raise ValueError("Quiz must have at least one correct answer")
+
+
+def validate_quiz(quiz_content: str, warn: Callable[[str], object] | None = None) -> None:
+    """Check a quiz with the rules the plugin applies when rendering it.
+
+    Args:
+        quiz_content: The content inside the quiz tags.
+        warn: Called with the message of each warning about the quiz format.
+            Defaults to logging them as plugin warnings.
+
+    Raises:
+        ValueError: If the quiz is invalid, with the message the build would fail with.
+    """
+    # A fill-in-the-blank quiz has a blank by definition, and no answers to check
+    if re.search(FILL_BLANK_REGEX, quiz_content):
+        return
+    question_text, all_answers, correct_answers, _feedbacks, _content_start = (
+        parse_quiz_question_and_answers(split_quiz_lines(quiz_content), warn)
+    )
+    check_quiz_structure(question_text, all_answers, correct_answers)
+
+
+@dataclass
+class MarkdownScan:
+    """Quiz blocks, fenced code blocks and old quiz syntax found in a markdown document."""
+
+    quizzes: list[re.Match[str]] = field(default_factory=list)
+    """Matches of `QUIZ_REGEX` for each quiz, outside fenced code blocks."""
+    fences: list[tuple[int, int]] = field(default_factory=list)
+    """Start and end offsets of fenced code blocks outside quizzes."""
+    old_syntax: list[int] = field(default_factory=list)
+    """Offsets of old v0.x quiz tags outside fenced code blocks."""
+
+
+def quiz_enabled(meta: Mapping[str, Any], enabled_by_default: bool = True) -> bool:
+    """Check whether quizzes are processed on a page.
+
+    Args:
+        meta: The page front matter, where `quiz: {enabled: true/false}` overrides
+            the plugin default.
+        enabled_by_default: The plugin `enabled_by_default` option.
+
+    Returns:
+        True if quizzes should be processed, False otherwise.
+    """
+    quiz_meta = meta.get("quiz")
+    if isinstance(quiz_meta, dict):
+        return bool(quiz_meta.get("enabled", enabled_by_default))
+    return enabled_by_default
+
+
+def scan_markdown(markdown: str) -> MarkdownScan:
+    """Find quizzes, fenced code blocks and old quiz syntax in a single pass.
+
+    The scanner jumps from token to token: a fenced code block outside a quiz is
+    skipped as a whole, so quiz tags shown as examples in code blocks are ignored,
+    and a quiz is consumed up to its closing tag, so code blocks inside quizzes
+    stay part of the quiz. Each character is looked at a constant number of times,
+    so scanning is linear in the size of the document.
+
+    Args:
+        markdown: The markdown content.
+
+    Returns:
+        The quizzes, code blocks and old syntax found, in document order.
+    """
+    scan = MarkdownScan()
+    pos = 0
+    quizzes_closed = True
+    while True:
+        token = _TOKEN_PATTERN.search(markdown, pos)
+        if token is None:
+            return scan
+
+        fence = token.group("fence")
+        if fence:
+            # The opening line must be complete, and the block closed by a later line
+            line_end = markdown.find("\n", token.end())
+            close = (
+                _FENCE_CLOSE_PATTERNS[fence[0]].search(markdown, line_end + 1)
+                if line_end >= 0
+                else None
+            )
+            if close is None:
+                pos = token.end()
+                continue
+            scan.fences.append((token.start(), close.end()))
+            pos = close.end()
+        elif token.group("quiz"):
+            quiz = _QUIZ_PATTERN.match(markdown, token.start()) if quizzes_closed else None
+            if quiz is None:
+                # No closing tag anywhere after this point, so no more quizzes either.
+                # Later opening tags aren't matched, which would search to the end again.
+                quizzes_closed = False
+                pos = token.end()
+                continue
+            scan.quizzes.append(quiz)
+            scan.old_syntax.extend(
+                m.start() for m in _OLD_SYNTAX_PATTERN.finditer(markdown, quiz.start(), quiz.end())
+            )
+            pos = quiz.end()
+        else:
+            scan.old_syntax.append(token.start())
+            pos = token.end()
+
+
 def mask_code_blocks(markdown: str) -> tuple[str, dict[str, str]]:
     """Temporarily mask fenced code blocks to prevent processing quiz tags inside them.
 
@@ -87,40 +395,16 @@ def mask_code_blocks(markdown: str) -> tuple[str, dict[str, str]]:
         A tuple of (masked markdown, dictionary of placeholders to original content).
     """
     placeholders: dict[str, str] = {}
-    counter = 0
-
-    # Find all quiz blocks first
-    quiz_ranges = []
-    for match in re.finditer(QUIZ_REGEX, markdown, re.DOTALL):
-        quiz_ranges.append((match.start(), match.end()))
-
-    # Mask fenced code blocks (```...``` or ~~~...~~~)
-    def replace_fenced(match: re.Match[str]) -> str:
-        nonlocal counter
-        # Check if this code block is inside a quiz
-        match_start = match.start()
-        match_end = match.end()
-        for quiz_start, quiz_end in quiz_ranges:
-            if quiz_start < match_start < quiz_end or quiz_start < match_end < quiz_end:
-                # Code block is inside a quiz, don't mask it
-                return match.group(0)
-
-        # Code block is outside quizzes, mask it
+    segments = []
+    last_end = 0
+    for counter, (start, end) in enumerate(scan_markdown(markdown).fences):
         placeholder = f"__CODEBLOCK_{counter}__"
-        placeholders[placeholder] = match.group(0)
-        counter += 1
-        return placeholder
-
-    # Match fenced code blocks with optional language specifier
-    # Supports ``` and ~~~ delimiters (3 or more), with optional indentation
-    markdown = re.sub(
-        r"^[ \t]*`{3,}.*?\n.*?^[ \t]*`{3,}|^[ \t]*~{3,}.*?\n.*?^[ \t]*~{3,}",
-        replace_fenced,
-        markdown,
-        flags=re.MULTILINE | re.DOTALL,
-    )
-
-    return markdown, placeholders
+        placeholders[placeholder] = markdown[start:end]
+        segments.append(markdown[last_end:start])
+        segments.append(placeholder)
+        last_end = end
+    segments.append(markdown[last_end:])
+    return "".join(segments), placeholders
 
 
 def unmask_code_blocks(markdown: str, placeholders: dict[str, str]) -> str:
@@ -133,21 +417,41 @@ def unmask_code_blocks(markdown: str, placeholders: dict[str, str]) -> str:
     Returns:
         The markdown with code blocks restored.
     """
-    for placeholder, original in placeholders.items():
-        markdown = markdown.replace(placeholder, original)
-    return markdown
+    return substitute_placeholders(markdown, CODEBLOCK_PLACEHOLDER_REGEX, placeholders)
+
+
+def substitute_placeholders(
+    text: str, pattern: re.Pattern[str], replacements: Mapping[str, str]
+) -> str:
+    """Replace all placeholders in a single scan of the text.
+
+    Calling `str.replace` once per placeholder copies the whole text for every
+    placeholder, which is quadratic on pages with many quizzes or code blocks.
+
+    Args:
+        text: The text containing placeholders.
+        pattern: Regex matching a complete placeholder.
+        replacements: Mapping of placeholder to replacement text. Matches of
+            `pattern` without an entry are left unchanged.
+
+    Returns:
+        The text with placeholders replaced.
+    """
+    if not replacements:
+        return text
+    return pattern.sub(lambda m: replacements.get(m.group(0), m.group(0)), text)
 
 
 def find_quizzes(markdown: str) -> list[re.Match[str]]:
-    """Find all quiz blocks in markdown content.
+    """Find all quiz blocks in markdown content, ignoring quiz tags in code blocks.
 
     Args:
-        markdown: The markdown content (should be pre-processed with mask_code_blocks).
+        markdown: The markdown content.
 
     Returns:
         List of regex match objects for each quiz found.
     """
-    return list(re.finditer(QUIZ_REGEX, markdown, re.DOTALL))
+    return scan_markdown(markdown).quizzes
 
 
 def parse_answer(line: str) -> tuple[bool, str] | None:
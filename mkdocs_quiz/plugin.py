@@ -2,77 +2,239 @@
 
 from __future__ import annotations
 
-import fnmatch
+import functools
+import hashlib
 import html
 import json
 import logging
 import re
 import sys
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from pathlib import Path
 from textwrap import dedent
-from typing import Any
+from typing import TYPE_CHECKING, Any, cast
 
-import markdown as md
+from jinja2 import Environment
 from mkdocs.config import config_options
 from mkdocs.config.defaults import MkDocsConfig
 from mkdocs.plugins import BasePlugin
-from mkdocs.structure.files import Files
-from mkdocs.structure.pages import (
-    Page,
-    _ExtractAnchorsTreeprocessor,
-    _ExtractTitleTreeprocessor,
-    _RawHTMLPreprocessor,
-    _RelativePathTreeprocessor,
+from mkdocs.structure.files import File, Files
+from mkdocs.utils import get_relative_url
+
+from .cache import LINK_HINT_REGEX, SNIPPET_MARKER, QuizCache, capture_warnings, fingerprint
+from .fragments import (
+    FragmentMemo,
+    can_batch,
+    fast_paths_enabled,
+    held_logs,
+    is_inline_only,
+    join_fragments,
+    release_logs,
+    render_inline,
+    render_plain_text,
+    split_fragments,
 )
-
 from .parsing import (
-    CHECKBOX_REGEX,
-    FEEDBACK_REGEX,
+    BLANK_PLACEHOLDER_REGEX,
     FILL_BLANK_REGEX,
-    OLD_SYNTAX_PATTERNS,
-    collect_feedback,
-    find_quizzes,
-    mask_code_blocks,
-    unmask_code_blocks,
+    INTRO_COMMENT,
+    QUIZ_PLACEHOLDER_REGEX,
+    RESULTS_COMMENT,
+    MarkdownScan,
+    check_quiz_structure,
+    parse_quiz_question_and_answers,
+    quiz_enabled,
+    scan_markdown,
+    split_quiz_lines,
+    substitute_placeholders,
 )
+from .profiling import BuildProfile, profile_enabled_by_env, profiled
+from .routing import LanguageRoutes
+from .sidecar import encode_sources, sidecar_link, sidecar_uri
+from .templates import QuizTemplate, compile_templates
 from .translations import TranslationManager
+from .triage import has_quiz_markup, triage_pages
+
+if TYPE_CHECKING:
+    import markdown as md
+    from mkdocs.structure.pages import (
+        Page,
+        _ExtractAnchorsTreeprocessor,
+        _RelativePathTreeprocessor,
+    )
 
-# Compatibility import for Python 3.8
-if sys.version_info >= (3, 9):
-    from importlib.resources import files
-else:
-    from importlib_resources import files
-
-from . import css, js
+from . import __version__
 
 log = logging.getLogger("mkdocs.plugins.mkdocs_quiz")
 
-# Load CSS and JS resources at module level
-style: str
-js_script: str
-confetti_lib_script: str
-
-try:
-    inp_file = files(css) / "quiz.css"
-    with inp_file.open("r") as f:
-        style_content = f.read()
-    style = f'<style type="text/css">{style_content}</style>'
-
-    js_file = files(js) / "quiz.js"
-    with js_file.open("r") as f:
-        js_content = f.read()
-    js_script = f'<script type="text/javascript" defer>{js_content}</script>'
-
-    # Load confetti library from vendor directory (v0.12.0)
-    confetti_file = files(js) / "vendor" / "js-confetti.browser.js"
-    with confetti_file.open("r") as f:
-        confetti_content = f.read()
-    confetti_lib_script = f'<script type="text/javascript">{confetti_content}</script>'
-except OSError as e:
-    log.error(f"Failed to load CSS/JS resources: {e}")
-    style = ""
-    js_script = ""
-    confetti_lib_script = ""
+
+@functools.lru_cache(maxsize=None)
+def _read_assets() -> tuple[str, str, str]:
+    """Read the bundled quiz CSS, quiz JS and confetti library, once per process.
+
+    Returns:
+        A tuple of (CSS, quiz JS, confetti JS), empty strings if they can't be read.
+    """
+    # Compatibility import for Python 3.8
+    if sys.version_info >= (3, 9):
+        from importlib.resources import files
+    else:
+        from importlib_resources import files
+
+    from . import css, js
+
+    try:
+        style_content = (files(css) / "quiz.css").read_text(encoding="utf-8")
+        js_content = (files(js) / "quiz.js").read_text(encoding="utf-8")
+        # Load confetti library from vendor directory (v0.12.0)
+        confetti_content = (files(js) / "vendor" / "js-confetti.browser.js").read_text(
+            encoding="utf-8"
+        )
+    except OSError as e:
+        log.error(f"Failed to load CSS/JS resources: {e}")
+        return "", "", ""
+    return style_content, js_content, confetti_content
+
+
+# Site directory (relative to site_dir) for assets written when `assets: external`
+ASSETS_DIR = "assets/mkdocs-quiz"
+
+
+@functools.lru_cache(maxsize=None)
+def _bundled_assets(minified: bool) -> tuple[str, str, str]:
+    """Return the quiz CSS, quiz JS and confetti library content.
+
+    The assets are read, and minified, once per process on first use.
+
+    Args:
+        minified: Whether to return minified CSS and JS (`minify_assets`).
+
+    Returns:
+        A tuple of (CSS, quiz JS, confetti JS). The vendored confetti library is
+        already minified.
+    """
+    style_content, js_content, confetti_content = _read_assets()
+    if not minified:
+        return style_content, js_content, confetti_content
+    from .minify import minify_css, minify_js
+
+    return minify_css(style_content), minify_js(js_content), confetti_content
+
+
+@functools.lru_cache(maxsize=None)
+def _inline_asset_tags(minified: bool) -> tuple[str, str, str]:
+    """Return the tags embedding the quiz CSS, JS and confetti library in a page.
+
+    Args:
+        minified: Whether to embed minified CSS and JS (`minify_assets`).
+
+    Returns:
+        A tuple of (style tag, quiz script tag, confetti script tag).
+    """
+    css_content, quiz_js_content, confetti_js_content = _bundled_assets(minified)
+    return (
+        f'<style type="text/css">{css_content}</style>' if css_content else "",
+        f'<script type="text/javascript" defer>{quiz_js_content}</script>'
+        if quiz_js_content
+        else "",
+        f'<script type="text/javascript">{confetti_js_content}</script>'
+        if confetti_js_content
+        else "",
+    )
+
+
+def __getattr__(name: str) -> str:
+    # Names the assets were read into at import time, before they were loaded lazily
+    contents = ("style_content", "js_content", "confetti_content")
+    tags = ("style", "js_script", "confetti_lib_script")
+    if name in contents:
+        return _read_assets()[contents.index(name)]
+    if name in tags:
+        return _inline_asset_tags(False)[tags.index(name)]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _hashed_asset_path(filename: str, content: str) -> str:
+    """Return the site path of an asset with a content hash in its filename.
+
+    Args:
+        filename: The asset filename, e.g. `quiz.css`.
+        content: The asset content.
+
+    Returns:
+        A path like `assets/mkdocs-quiz/quiz.0123456789.css`.
+    """
+    stem, ext = filename.rsplit(".", 1)
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:10]
+    return f"{ASSETS_DIR}/{stem}.{digest}.{ext}"
+
+
+def _write_asset(site_dir: Path, asset_path: str, content: str) -> None:
+    """Write a hashed asset to the site, with a gzip-compressed copy.
+
+    Args:
+        site_dir: The site directory.
+        asset_path: The site path from `_hashed_asset_path()`.
+        content: The asset content.
+    """
+    dest = site_dir / asset_path
+    # Hashed filenames never change content, so existing files are up to date
+    if dest.exists():
+        return
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    data = content.encode("utf-8")
+    dest.write_bytes(data)
+    import gzip
+
+    # Precompressed copy for servers that serve `.gz` files as they are
+    dest.with_name(dest.name + ".gz").write_bytes(gzip.compress(data, mtime=0))
+
+
+class _FragmentMarkdown:
+    """A pooled fragment Markdown instance and its page-specific MkDocs processors."""
+
+    def __init__(self, config: MkDocsConfig, md_inst: md.Markdown) -> None:
+        """Wrap a Markdown instance created by `_create_fragment_markdown()`.
+
+        Args:
+            config: The MkDocs config the instance was built from.
+            md_inst: The Markdown instance with MkDocs processors registered.
+        """
+        self.config = config
+        self.md = md_inst
+        self._anchors = cast(
+            "_ExtractAnchorsTreeprocessor", md_inst.treeprocessors["mkdocs_extract_anchors"]
+        )
+        self._relpath = cast("_RelativePathTreeprocessor", md_inst.treeprocessors["relpath"])
+
+    def bind(self, page: Page, files: Files) -> md.Markdown:
+        """Rebind the page-specific processors to a page and reset the instance.
+
+        Args:
+            page: The page whose fragments will be converted next.
+            files: MkDocs Files collection for link resolution.
+
+        Returns:
+            The reset Markdown instance.
+        """
+        self._relpath.file = page.file
+        self._relpath.files = files
+        self._relpath.links_to_anchors = {}
+        self._anchors.present_anchor_ids = set()
+        self.md.reset()
+        return self.md
+
+
+@dataclass(frozen=True)
+class _PageRenderContext:
+    """Page settings shared by every quiz and fragment rendered on a page."""
+
+    # Quiz options from the page frontmatter and plugin config
+    options: dict[str, bool]
+    # Translations for the page language
+    t: TranslationManager
+
 
 # Quiz tag format:
 # <quiz>
@@ -111,10 +273,32 @@ class MkDocsQuizPlugin(BasePlugin):
         ("confetti", config_options.Type(bool, default=True)),
         ("progress_sidebar_position", config_options.Type(str, default="top")),
         ("embed_source", config_options.Type(bool, default=True)),
+        ("source_storage", config_options.Choice(("inline", "sidecar"), default="inline")),
+        ("source_compress", config_options.Type(bool, default=False)),
+        ("assets", config_options.Choice(("inline", "external"), default="inline")),
+        ("minify_assets", config_options.Type(bool, default=False)),
+        ("templates", config_options.Type(dict, default={})),
+        # Quiz manifest options
+        ("manifest", config_options.Type(bool, default=False)),
+        ("manifest_split", config_options.Type(bool, default=False)),
         # Translation options
         ("language", config_options.Type((str, type(None)), default=None)),
         ("custom_translations", config_options.Type(dict, default={})),
         ("language_patterns", config_options.Type(list, default=[])),
+        # Build cache options
+        ("cache", config_options.Type(bool, default=True)),
+        ("cache_dir", config_options.Type(str, default=".cache/plugin/mkdocs-quiz")),
+        ("cache_max_size", config_options.Type(int, default=64)),
+        ("fragment_memo_size", config_options.Type(int, default=16)),
+        # Parallel rendering options
+        ("parallel", config_options.Type(bool, default=False)),
+        ("parallel_workers", config_options.Type((int, type(None)), default=None)),
+        # Profiling options
+        ("profile", config_options.Type(bool, default=False)),
+        (
+            "profile_report",
+            config_options.Type(str, default=".cache/plugin/mkdocs-quiz/profile.json"),
+        ),
     )
 
     def __init__(self) -> None:
@@ -126,6 +310,194 @@ class MkDocsQuizPlugin(BasePlugin):
         self._has_results_div: dict[str, bool] = {}
         # Track if intro is present on each page
         self._has_intro: dict[str, bool] = {}
+        # Fragment Markdown instances reused for every quiz in a build, keyed by config
+        self._fragment_md_pool: dict[int, _FragmentMarkdown] = {}
+        # Rendered fragments reused across quizzes and pages (created on first use)
+        self._fragment_memo: FragmentMemo | None = None
+        # Persistent rendered quiz cache (set up in on_config when enabled)
+        self._quiz_cache: QuizCache | None = None
+        # Fingerprints of build inputs used in quiz cache keys, computed once per build
+        self._markdown_fingerprint: tuple[int, str] | None = None
+        self._files_fingerprint: tuple[int, str] | None = None
+        # Site paths and content of CSS/JS assets written to site_dir (`assets: external`)
+        self._asset_files: dict[str, tuple[str, str]] = {}
+        # Site paths and content of translation scripts, by language and custom file
+        self._translation_assets: dict[tuple[str, str | None], tuple[str, str]] = {}
+        # Quiz HTML rendered by worker processes (`parallel`), keyed like the quiz cache
+        self._prerendered: dict[str, str] = {}
+        # Content of quiz source files by site path (`source_storage: sidecar`)
+        self._source_files: dict[str, bytes] = {}
+        # Quiz manifest entries of each page, by src_uri (`manifest`)
+        self._manifest: dict[str, list[dict[str, Any]]] = {}
+        # Whether each page's source contains quiz markup, by src_uri (set in on_files)
+        self._triage: dict[str, bool] = {}
+        # HTML templates compiled with `templates` overrides (in on_config or on first use)
+        self._templates: dict[str, QuizTemplate] | None = None
+        # Language resolution rules (compiled in on_config or on first use)
+        self._language_routes: LanguageRoutes | None = None
+        # Language of each page before frontmatter overrides, by src_path
+        self._page_languages: dict[str, str] = {}
+        self._templates_fingerprint = ""
+        # Build profile (`profile` option or MKDOCS_QUIZ_PROFILE), set up in on_config
+        self._profile: BuildProfile | None = None
+        self._profile_report: Path | None = None
+
+    def on_config(self, config: MkDocsConfig, **kwargs: Any) -> MkDocsConfig | None:
+        """Reset per-build state at the start of each build.
+
+        Args:
+            config: The MkDocs config object.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            None, the config is not modified.
+        """
+        self._fragment_md_pool = {}
+        self._fragment_memo = None
+        self._markdown_fingerprint = None
+        self._files_fingerprint = None
+        self._prerendered = {}
+        self._triage = {}
+        self._manifest = {}
+        self._source_files = {}
+
+        self._templates = None
+        self._get_templates(Path(config.config_file_path or ".").parent)
+
+        self._page_languages = {}
+        self._language_routes = None
+        self._get_language_routes(config)
+
+        self._profile = None
+        if self.config.get("profile", False) or profile_enabled_by_env():
+            self._profile = BuildProfile()
+            report = self.config.get("profile_report", ".cache/plugin/mkdocs-quiz/profile.json")
+            self._profile_report = Path(config.config_file_path or ".").parent / report
+
+        self._quiz_cache = None
+        if self.config.get("cache", True):
+            config_dir = Path(config.config_file_path or ".").parent
+            cache_dir = config_dir / self.config.get("cache_dir", ".cache/plugin/mkdocs-quiz")
+            max_size = self.config.get("cache_max_size", 64) * 1024 * 1024
+            self._quiz_cache = QuizCache(cache_dir, max_size)
+
+        self._asset_files = {}
+        self._translation_assets = {}
+        if self.config.get("assets", "inline") == "external":
+            css_content, quiz_js_content, confetti_js_content = _bundled_assets(
+                self.config.get("minify_assets", False)
+            )
+            for kind, filename, content in (
+                ("style", "quiz.css", css_content),
+                ("js", "quiz.js", quiz_js_content),
+                ("confetti", "js-confetti.browser.js", confetti_js_content),
+            ):
+                if kind == "confetti" and not self.config.get("confetti", True):
+                    continue
+                self._asset_files[kind] = (_hashed_asset_path(filename, content), content)
+        return None
+
+    def on_files(self, files: Files, *, config: MkDocsConfig, **kwargs: Any) -> Files | None:
+        """Index which documentation pages contain quiz markup, for `parallel` rendering.
+
+        Args:
+            files: The files object.
+            config: The MkDocs config object.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            None, the files are not modified.
+        """
+        if self.config.get("parallel", False):
+            self._triage = triage_pages(files)
+        return None
+
+    def on_env(
+        self, env: Environment, *, config: MkDocsConfig, files: Files, **kwargs: Any
+    ) -> Environment | None:
+        """Pre-render all quizzes in worker processes when `parallel` is enabled.
+
+        Runs once the final set of files is known, just before pages are built.
+
+        Args:
+            env: The Jinja environment.
+            config: The MkDocs config object.
+            files: The files object.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            None, the environment is not modified.
+        """
+        self._prerendered = {}
+        if not self.config.get("parallel", False):
+            return None
+
+        from .parallel import parallel_unavailable_reason, prerender_quizzes, resolve_workers
+
+        reason = parallel_unavailable_reason()
+        if reason is not None:
+            log.info(f"Rendering quizzes serially: {reason}")
+            return None
+
+        workers = resolve_workers(self.config.get("parallel_workers"))
+        src_uris = [
+            f.src_uri for f in files.documentation_pages() if self._triage.get(f.src_uri, True)
+        ]
+        self._prerendered = prerender_quizzes(self, config, files, src_uris, workers)
+        log.info(f"Pre-rendered {len(self._prerendered)} quizzes using {workers} processes")
+        return None
+
+    def on_post_build(self, config: MkDocsConfig, **kwargs: Any) -> None:
+        """Write external assets and the quiz manifest, report statistics, evict cache entries.
+
+        Args:
+            config: The MkDocs config object.
+            **kwargs: Additional keyword arguments.
+        """
+        self._prerendered = {}
+
+        if self._asset_files:
+            site_dir = Path(config.site_dir)
+            for asset_path, content in self._asset_files.values():
+                _write_asset(site_dir, asset_path, content)
+            for asset_path, content in self._translation_assets.values():
+                _write_asset(site_dir, asset_path, content)
+
+        for source_path, data in self._source_files.items():
+            dest = Path(config.site_dir) / source_path
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            dest.write_bytes(data)
+
+        if self.config.get("manifest", False):
+            from .manifest import MANIFEST_FILENAME, write_manifests
+
+            count = write_manifests(
+                Path(config.site_dir),
+                self._manifest,
+                f"mkdocs-quiz {__version__}",
+                split=self.config.get("manifest_split", False),
+            )
+            log.info(f"Wrote {MANIFEST_FILENAME} with {count} quizzes")
+
+        if self._profile is not None and self._profile_report is not None:
+            self._profile.write(self._profile_report)
+            log.info(f"{self._profile.summary()}\n  Full report: {self._profile_report}")
+
+        memo = self._fragment_memo
+        if memo is not None and memo.hits + memo.misses:
+            log.debug(
+                f"Fragment memo: {memo.hits} hits, {memo.misses} misses "
+                f"({memo.hits / (memo.hits + memo.misses):.0%} hit rate), "
+                f"{len(memo)} fragments using {memo.size / 1024:.0f} KiB"
+            )
+
+        if self._quiz_cache is not None:
+            cache = self._quiz_cache
+            evicted = cache.prune()
+            log.info(
+                f"Quiz cache: {cache.hits} hits, {cache.misses} misses"
+                + (f", {evicted} old entries evicted" if evicted else "")
+            )
 
     def _get_quiz_progress_sidebar_html(self, t: TranslationManager) -> str:
         """Generate the quiz progress sidebar HTML for Material theme.
@@ -138,71 +510,33 @@ class MkDocsQuizPlugin(BasePlugin):
         Returns:
             HTML string for the quiz progress sidebar.
         """
-        quiz_progress = t.get("Quiz Progress")
-        answered = t.get("Answered:")
-        correct = t.get("Correct:")
-        reset = t.get("Reset")
+        return self._get_templates()["sidebar"].render(
+            quiz_progress=t.get("Quiz Progress"),
+            answered=t.get("Answered:"),
+            correct=t.get("Correct:"),
+            reset=t.get("Reset"),
+        )
 
-        sidebar_html = dedent(
-            f"""
-            <div id="quiz-progress-sidebar" aria-label="{quiz_progress}" style="display: none;">
-              <!-- mkdocs-quiz progress sidebar (desktop) -->
-              <label class="md-nav__title">
-                <span class="md-nav__icon md-icon"></span>
-                {quiz_progress}
-              </label>
-              <ul class="md-nav__list" data-md-component="quiz-progress">
-                <li class="md-nav__item">
-                  <div class="md-nav__link">
-                    <span class="md-ellipsis">
-                      {answered} <span class="quiz-progress-answered">0</span> / <span class="quiz-progress-total">0</span> (<span class="quiz-progress-answered-percentage">0%</span>)
-                    </span>
-                  </div>
-                </li>
-                <li class="md-nav__item">
-                  <div class="md-nav__link">
-                    <div class="quiz-progress-bar">
-                      <div class="quiz-progress-bar-incorrect" style="width: 0%"></div>
-                      <div class="quiz-progress-bar-correct" style="width: 0%"></div>
-                    </div>
-                  </div>
-                </li>
-                <li class="md-nav__item">
-                  <div class="md-nav__link quiz-correct-reset">
-                    <span class="md-ellipsis">
-                      {correct} <span class="quiz-progress-score">0</span> / <span class="quiz-progress-score-total">0</span> (<span class="quiz-progress-score-percentage">0%</span>)
-                    </span>
-                    <a href="#" class="quiz-reset-all-link" style="color: var(--md-primary-fg-color); text-decoration: none;">
-                      {reset}
-                    </a>
-                  </div>
-                </li>
-              </ul>
-            </div>
-            <nav id="quiz-progress-mobile" class="quiz-progress-mobile md-nav" aria-label="{quiz_progress}" style="display: none;">
-              <!-- mkdocs-quiz progress sidebar (mobile) -->
-              <div class="quiz-progress-bar">
-                <div class="quiz-progress-bar-incorrect" style="width: 0%"></div>
-                <div class="quiz-progress-bar-correct" style="width: 0%"></div>
-              </div>
-              <div data-md-component="quiz-progress">
-                <div class="quiz-correct-reset">
-                  <span class="md-ellipsis">
-                    {answered} <span class="quiz-progress-answered">0</span> / <span class="quiz-progress-total">0</span>
-                  </span>
-                  <span class="md-ellipsis">
-                    {correct} <span class="quiz-progress-score">0</span> / <span class="quiz-progress-score-total">0</span>
-                  </span>
-                  <a href="#" class="quiz-reset-all-link" style="color: var(--md-primary-fg-color); text-decoration: none;">
-                    {reset}
-                  </a>
-                </div>
-              </div>
-            </nav>
+    def _get_templates(self, base_dir: Path | None = None) -> dict[str, QuizTemplate]:
+        """Return the compiled HTML templates, compiling them on first use.
+
+        Args:
+            base_dir: Directory that `templates` override paths are relative to.
+
+        Returns:
+            The compiled template for each name in `DEFAULT_TEMPLATES`.
         """
-        ).strip()
+        if self._templates is None:
+            self._templates = compile_templates(self.config.get("templates", {}), base_dir)
+            self._templates_fingerprint = fingerprint(
+                {name: template.source for name, template in self._templates.items()}
+            )
+        return self._templates
 
-        return sidebar_html
+    def _count(self, name: str, n: int = 1) -> None:
+        """Increment a profiling counter when profiling is enabled."""
+        if self._profile is not None and n:
+            self._profile.count(name, n)
 
     def _should_process_page(self, page: Page) -> bool:
         """Check if quizzes should be processed on this page.
@@ -213,15 +547,7 @@ class MkDocsQuizPlugin(BasePlugin):
         Returns:
             True if quizzes should be processed, False otherwise.
         """
-        enabled_by_default = self.config.get("enabled_by_default", True)
-        quiz_meta = page.meta.get("quiz", None)
-
-        # Handle frontmatter: quiz: { enabled: true/false }
-        if isinstance(quiz_meta, dict):
-            return quiz_meta.get("enabled", enabled_by_default)  # type: ignore[no-any-return]
-
-        # No page-level override, use plugin default
-        return enabled_by_default  # type: ignore[no-any-return]
+        return quiz_enabled(page.meta, self.config.get("enabled_by_default", True))
 
     def _get_quiz_options(self, page: Page) -> dict[str, bool]:
         """Get quiz options from page frontmatter or plugin config.
@@ -250,6 +576,31 @@ class MkDocsQuizPlugin(BasePlugin):
 
         return options
 
+    def _get_language_routes(self, config: MkDocsConfig) -> LanguageRoutes:
+        """Return the language resolution rules of the site, compiling them on first use.
+
+        Args:
+            config: The MkDocs config object.
+
+        Returns:
+            The compiled `theme.language`, `extra.alternate`, `language` and
+            `language_patterns` settings.
+        """
+        if self._language_routes is None:
+            default = "en"
+            if hasattr(config, "theme") and "language" in config.theme:
+                default = config.theme["language"] or default
+            alternates = []
+            if hasattr(config, "extra") and "alternate" in config.extra:
+                alternates = config.extra["alternate"]
+            self._language_routes = LanguageRoutes(
+                default,
+                alternates,
+                self.config.get("language"),
+                self.config.get("language_patterns") or [],
+            )
+        return self._language_routes
+
     def _get_translation_manager(self, page: Page, config: MkDocsConfig) -> TranslationManager:
         """Get translation manager for the current page.
 
@@ -261,6 +612,9 @@ class MkDocsQuizPlugin(BasePlugin):
         5. mkdocs_quiz.language_patterns pattern matching
         6. Page frontmatter quiz.language (highest priority)
 
+        Steps 1-5 are resolved with the rules compiled by `_get_language_routes()`
+        and remembered for each page until the next build.
+
         Args:
             page: The current page object.
             config: The MkDocs config object.
@@ -268,51 +622,12 @@ class MkDocsQuizPlugin(BasePlugin):
         Returns:
             TranslationManager instance for the resolved language.
         """
-        # 1. Start with default
-        language = "en"
-
-        # 2. Check theme.language
-        if hasattr(config, "theme") and "language" in config.theme:
-            theme_lang = config.theme["language"]
-            if theme_lang:
-                language = theme_lang
-                log.debug(f"Using theme.language: {language}")
-
-        # 3. Check extra.alternate for multi-language sites (longest prefix match)
-        if hasattr(config, "extra") and "alternate" in config.extra:
-            page_url = page.url or page.file.url
-            best_match = ("", None)  # (normalized_link, lang)
-            for alt in config.extra["alternate"]:
-                link, lang = alt.get("link", ""), alt.get("lang")
-                prefix = link.lstrip("/") if link else ""
-                # Skip root "/" (empty after lstrip) - matches everything
-                if (
-                    prefix
-                    and lang
-                    and page_url.startswith(prefix)
-                    and len(prefix) > len(best_match[0])
-                ):
-                    best_match = (prefix, lang)
-            if best_match[1]:
-                language = best_match[1]
-                log.debug(f"Matched extra.alternate '{best_match[0]}' for {page_url}: {language}")
-
-        # 4. Check mkdocs_quiz.language config (only if explicitly set by user)
-        plugin_language = self.config.get("language")
-        if plugin_language is not None:
-            language = plugin_language
-            log.debug(f"Using mkdocs_quiz.language config: {language}")
-
-        # 5. Check pattern matching
-        if self.config.get("language_patterns"):
-            for pattern_config in self.config["language_patterns"]:
-                pattern = pattern_config.get("pattern", "")
-                if pattern and fnmatch.fnmatch(page.file.src_path, pattern):
-                    language = pattern_config.get("language")
-                    log.debug(
-                        f"Matched pattern '{pattern}' for {page.file.src_path}, using language: {language}"
-                    )
-                    break
+        src_path = page.file.src_path
+        language = self._page_languages.get(src_path)
+        if language is None:
+            routes = self._get_language_routes(config)
+            language = routes.resolve(src_path, page.url or page.file.url)
+            self._page_languages[src_path] = language
 
         # 6. Check page frontmatter for language override (highest priority)
         quiz_meta = page.meta.get("quiz", {})
@@ -328,16 +643,34 @@ class MkDocsQuizPlugin(BasePlugin):
             config_dir = Path(config.config_file_path).parent
             custom_path = config_dir / custom_trans_path
 
-        return TranslationManager(language, custom_path)
+        t = TranslationManager(language, custom_path)
+        if t.catalog_loaded:
+            self._count("translation_catalog_loads")
+        return t
+
+    def _get_page_context(self, page: Page, config: MkDocsConfig) -> _PageRenderContext:
+        """Resolve the quiz options and translations of a page.
+
+        Resolved once per page and shared by all its quizzes and by the results,
+        intro and progress sidebar markup, instead of once for each of them.
+
+        Args:
+            page: The current page object.
+            config: The MkDocs config object.
+
+        Returns:
+            The render context of the page.
+        """
+        return _PageRenderContext(
+            self._get_quiz_options(page), self._get_translation_manager(page, config)
+        )
 
     def _parse_quiz_question_and_answers(
         self, quiz_lines: list[str]
     ) -> tuple[str, list[str], list[str], list[str], int]:
         """Parse quiz question and answers from quiz lines.
 
-        The question is everything up to the first checkbox answer.
-        Answers are checkbox items (- [x], - [ ], * [x], or * [ ]).
-        Content is everything after the last answer.
+        See `parse_quiz_question_and_answers()`, shared with `mkdocs-quiz lint`.
 
         Args:
             quiz_lines: The lines of the quiz content.
@@ -345,96 +678,7 @@ class MkDocsQuizPlugin(BasePlugin):
         Returns:
             A tuple of (question_text, all_answers, correct_answers, answer_feedbacks, content_start_index).
         """
-        # Find the first answer line and validate checkbox format
-        first_answer_index = None
-        for i, line in enumerate(quiz_lines):
-            # Check if this looks like a checkbox list item (any character in brackets)
-            # Supports both hyphen (-) and asterisk (*) bullets
-            checkbox_check = CHECKBOX_REGEX.match(line)
-            if checkbox_check:
-                checkbox_content = checkbox_check.group(1)
-                # Strictly validate: only accept x, X, space, or empty
-                if checkbox_content not in ["x", "X", " ", ""]:
-                    raise ValueError(
-                        f"Invalid checkbox format: '[{checkbox_content}]'. "
-                        f"Only '[x]', '[X]', '[ ]', or '[]' are allowed (with - or * bullet). "
-                        f"Found in line: {line}"
-                    )
-                first_answer_index = i
-                break
-
-        if first_answer_index is None:
-            # No answers found - invalid quiz structure
-            question_text = "\n".join(quiz_lines).strip()
-            log.warning(f"Quiz has no checkbox answers: {question_text[:50]}...")
-            return question_text, [], [], [], len(quiz_lines)
-
-        # Everything before the first answer is the question
-        question_lines = quiz_lines[:first_answer_index]
-        question_text = "\n".join(question_lines).strip()
-
-        # Parse answers starting from first_answer_index
-        all_answers: list[str] = []
-        correct_answers: list[str] = []
-        answer_feedbacks: list[str] = []
-        content_start_index = first_answer_index
-
-        i = first_answer_index
-        length = len(quiz_lines)
-        while i < length:
-            line = quiz_lines[i]
-            checkbox_pattern = CHECKBOX_REGEX.match(line)
-            if checkbox_pattern:
-                checkbox_content = checkbox_pattern.group(1)
-                if checkbox_content not in ["x", "X", " ", ""]:
-                    raise ValueError(
-                        f"Invalid checkbox format: '[{checkbox_content}]'. "
-                        f"Only '[x]', '[X]', '[ ]', or '[]' are allowed (with - or * bullet). "
-                        f"Found in line: {line}"
-                    )
-                is_correct = checkbox_content.lower() == "x"
-                answer_text = checkbox_pattern.group(2)
-                all_answers.append(answer_text)
-                if is_correct:
-                    correct_answers.append(answer_text)
-
-                # Collect optional per-answer feedback lines immediately following the answer.
-                feedback_md, i = collect_feedback(quiz_lines, i + 1)
-                answer_feedbacks.append(feedback_md or "")
-                content_start_index = i
-                continue
-            elif not line.strip():
-                # Empty line, continue
-                i += 1
-                continue
-            elif FEEDBACK_REGEX.match(line):
-                # Feedback line separated from its answer by a blank line.
-                # Check if there are more answers after this line — if so, it's an error.
-                has_more_answers = any(
-                    CHECKBOX_REGEX.match(quiz_lines[k]) for k in range(i + 1, length)
-                )
-                if has_more_answers:
-                    last_answer = all_answers[-1] if all_answers else "unknown"
-                    raise ValueError(
-                        f"Orphaned feedback line found after answer '{last_answer}'. "
-                        f"Feedback blockquotes (> ...) must immediately follow their answer "
-                        f"with no blank lines in between. "
-                        f"Found: {line.strip()}"
-                    )
-                # After the last answer — treat as content section.
-                # Warn because this is likely unintentional feedback formatting.
-                last_answer = all_answers[-1] if all_answers else "unknown"
-                log.warning(
-                    f"Blockquote after last answer '{last_answer}' is separated by a blank line. "
-                    f"It will be treated as content, not per-answer feedback. "
-                    f"Remove the blank line if you intended it as feedback."
-                )
-                break
-            else:
-                # Not a checkbox item and not empty, must be content
-                break
-
-        return question_text, all_answers, correct_answers, answer_feedbacks, content_start_index
+        return parse_quiz_question_and_answers(quiz_lines)
 
     def _is_fill_in_blank_quiz(self, quiz_content: str) -> bool:
         """Check if quiz contains fill-in-the-blank patterns.
@@ -510,6 +754,8 @@ class MkDocsQuizPlugin(BasePlugin):
         question_text = "\n".join(question_lines)
 
         # Replace [[answer]] patterns with input fields
+        templates = self._get_templates()
+        answer_label = t.get("Answer")
         input_counter = 0
 
         def replace_with_input(match: re.Match[str]) -> str:
@@ -520,11 +766,8 @@ class MkDocsQuizPlugin(BasePlugin):
             escaped_answer = html.escape(answer)
             # Calculate input size based on answer length (min 5 chars, add padding for typing)
             input_size = max(5, len(answer) + 2)
-            answer_label = t.get("Answer")
-            input_html = (
-                f'<input type="text" class="quiz-blank-input" '
-                f'id="{input_id}" data-answer="{escaped_answer}" autocomplete="off" '
-                f'size="{input_size}" aria-label="{answer_label}">'
+            input_html = templates["blank"].render(
+                id=input_id, answer=escaped_answer, size=input_size, label=answer_label
             )
             input_counter += 1
             return input_html
@@ -545,31 +788,26 @@ class MkDocsQuizPlugin(BasePlugin):
         # Replace blanks with placeholders before markdown conversion
         question_with_placeholders = re.sub(FILL_BLANK_REGEX, create_placeholder, question_text)
 
-        # Create a single Markdown instance for all fragment conversions in this quiz
-        md_inst = self._create_fragment_markdown(page, config, files)
+        # Bind the pooled Markdown instance to this page for all fragments of this quiz
+        md_inst = self._get_fragment_markdown(page, config, files)
 
-        # Convert markdown to HTML using configured markdown extensions
-        # Convert question markdown to HTML using MkDocs-aware fragment conversion.
-        question_html = self._convert_fragment_markdown(
-            question_with_placeholders, page, config, files, md_inst=md_inst
-        )
+        # Convert the question and content section using MkDocs-aware fragment conversion
+        fragments = [question_with_placeholders]
+        content_lines = lines[content_start_index:]
+        has_content = bool(content_lines) and any(line.strip() for line in content_lines)
+        if has_content:
+            fragments.append("\n".join(content_lines))
+        converted = self._convert_fragments(fragments, page, config, files, md_inst)
+        question_html = converted[0]
+        content_html = converted[1] if has_content else ""
 
         # Now replace placeholders with actual input fields
+        inputs: dict[str, str] = {}
         for placeholder, original in placeholders.items():
             blank_match: re.Match[str] | None = re.match(FILL_BLANK_REGEX, original)
             if blank_match:
-                input_html = replace_with_input(blank_match)
-                question_html = question_html.replace(placeholder, input_html)
-
-        # Get content section
-        content_lines = lines[content_start_index:]
-        content_html = ""
-        if content_lines and any(line.strip() for line in content_lines):
-            content_text = "\n".join(content_lines)
-            # Use configured markdown extensions for content section
-            content_html = self._convert_fragment_markdown(
-                content_text, page, config, files, md_inst=md_inst
-            )
+                inputs[placeholder] = replace_with_input(blank_match)
+        question_html = substitute_placeholders(question_html, BLANK_PLACEHOLDER_REGEX, inputs)
 
         # Build data attributes
         data_attrs = ['data-quiz-type="fill-blank"']
@@ -587,55 +825,40 @@ class MkDocsQuizPlugin(BasePlugin):
         if options["auto_number"]:
             question_number = quiz_id + 1
             question_text = t.get("Question {n}", n=question_number)
-            question_header = f'<h4 class="quiz-number">{question_text}</h4>'
-
-        # Get translated submit button text
-        submit_text = t.get("Submit")
-
-        quiz_html = dedent(f"""
-            <div class="quiz quiz-fill-blank" {attrs} id="{quiz_header_id}">
-                <a href="#{quiz_header_id}" class="quiz-header-link">#</a>
-                {question_header}
-                <div class="quiz-question">
-                    {question_html}
-                </div>
-                <form action="javascript:void(0);" onsubmit="return false;">
-                    <div class="quiz-feedback hidden"></div>
-                    <button type="submit" class="quiz-button">{submit_text}</button>
-                </form>
-                <section class="content hidden">{content_html}</section>
-            </div>
-        """).strip()
-
-        return quiz_html
+            question_header = templates["question_number"].render(text=question_text)
+
+        return templates["fill_blank"].render(
+            attrs=attrs,
+            id=quiz_header_id,
+            question_header=question_header,
+            question=question_html,
+            submit_button=templates["submit_button"].render(text=t.get("Submit")),
+            content=content_html,
+        )
 
     def _generate_answer_html(
         self,
         all_answers: list[str],
         correct_answers: list[str],
-        answer_feedbacks: list[str],
+        answers_html: list[str],
+        feedbacks_html: list[str | None],
         quiz_id: int,
-        page: Page,
-        config: MkDocsConfig,
-        files: Files,
-        md_inst: md.Markdown | None = None,
     ) -> tuple[list[str], bool]:
         """Generate HTML for quiz answers.
 
         Args:
             all_answers: List of all answer texts (raw markdown).
             correct_answers: List of correct answer texts (raw markdown).
+            answers_html: Inline HTML of each answer.
+            feedbacks_html: Inline HTML of each answer's feedback, None if it has none.
             quiz_id: The unique ID for this quiz.
-            page: MkDocs Page object used to resolve relative links.
-            config: MkDocs config used to configure the markdown converter.
-            files: MkDocs Files collection used by MkDocs treeprocessors.
-            md_inst: Pre-created Markdown instance to reuse across fragments.
 
         Returns:
             A tuple of (list of answer HTML strings, whether to use checkboxes).
         """
         # Determine if multiple choice (checkboxes) or single choice (radio)
         as_checkboxes = len(correct_answers) > 1
+        templates = self._get_templates()
 
         # Generate answer HTML
         answer_html_list = []
@@ -648,65 +871,53 @@ class MkDocsQuizPlugin(BasePlugin):
             # Escape the value attribute for defense-in-depth (i is numeric, but escape anyway)
             escaped_value = html.escape(str(i))
 
-            # Convert answer markdown to HTML using MkDocs-aware fragment processors
-            converted = self._convert_fragment_markdown(
-                answer, page, config, files, md_inst=md_inst
-            )
-
-            # Strip enclosing <p> tags added by markdown processor
-            # (we need inline content, not block-level paragraphs)
-            stripped = self._strip_paragraph_wrapper(converted)
-
             # Prepare per-answer feedback HTML if provided
             feedback_html = ""
-            if i < len(answer_feedbacks) and answer_feedbacks[i].strip():
-                feedback_md = answer_feedbacks[i]
-                converted_feedback = self._convert_fragment_markdown(
-                    feedback_md, page, config, files, md_inst=md_inst
-                )
-                converted_feedback = self._strip_paragraph_wrapper(converted_feedback)
-                feedback_html = f'<div class="answer-feedback hidden">{converted_feedback}</div>'
-
-            answer_html = (
-                f'<div><input type="{input_type}" name="answer" value="{escaped_value}" '
-                f'id="{input_id}" {correct_attr}>'
-                f'<label for="{input_id}">{stripped}</label>'
-                f"{feedback_html}</div>"
+            if feedbacks_html[i] is not None:
+                feedback_html = templates["answer_feedback"].render(feedback=feedbacks_html[i])
+
+            answer_html = templates["answer"].render(
+                input_type=input_type,
+                value=escaped_value,
+                id=input_id,
+                correct_attr=correct_attr,
+                label=answers_html[i],
+                feedback=feedback_html,
             )
             answer_html_list.append(answer_html)
 
         return answer_html_list, as_checkboxes
 
-    def _check_for_old_syntax(self, markdown: str, page: Page) -> None:
+    def _check_for_old_syntax(self, scan: MarkdownScan, page: Page) -> None:
         """Check if the page contains old v0.x quiz syntax and fail with helpful error.
 
         Args:
-            markdown: The markdown content to check.
+            scan: The scanned markdown content of the page.
             page: The current page object.
 
         Raises:
             ValueError: If old syntax is detected, with migration instructions.
         """
         # Check for old quiz tags
-        for pattern in OLD_SYNTAX_PATTERNS:
-            if re.search(pattern, markdown):
-                error_msg = dedent(
-                    f"""
-                    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-                    ###########  ERROR: Old mkdocs-quiz syntax detected: {page.file.src_path}
-                    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        if scan.old_syntax:
+            error_msg = dedent(
+                f"""
+                ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+                ###########  ERROR: Old mkdocs-quiz syntax detected: {page.file.src_path}
+                ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-                    Quiz syntax used by mkdocs-quiz changed in the v1 release!
-                    Please use the CLI migration tool to update your quizzes:
+                Quiz syntax used by mkdocs-quiz changed in the v1 release!
+                Please use the CLI migration tool to update your quizzes:
 
-                        mkdocs-quiz migrate docs/
+                    mkdocs-quiz migrate docs/
 
-                    Read more: https://ewels.github.io/mkdocs-quiz/migration/
-                    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-                    """
-                ).strip()
-                raise ValueError(error_msg)
+                Read more: https://ewels.github.io/mkdocs-quiz/migration/
+                ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+                """
+            ).strip()
+            raise ValueError(error_msg)
 
+    @profiled
     def on_page_markdown(
         self, markdown: str, page: Page, config: MkDocsConfig, **kwargs: Any
     ) -> str:
@@ -728,33 +939,42 @@ class MkDocsQuizPlugin(BasePlugin):
         if not self._should_process_page(page):
             return markdown
 
+        # Skip pages without quiz markup. The markdown is checked rather than the
+        # file on disk, since other plugins can supply or change the page source
+        if not has_quiz_markup(markdown):
+            return markdown
+
         # Initialize storage for this page
         page_key = page.file.src_path
         self._quiz_storage[page_key] = {}
 
         # Check for results div comment
-        results_comment = "<!-- mkdocs-quiz results -->"
-        self._has_results_div[page_key] = results_comment in markdown
+        self._has_results_div[page_key] = RESULTS_COMMENT in markdown
 
         # Check for intro comment and mark for later replacement
-        intro_comment = "<!-- mkdocs-quiz intro -->"
-        self._has_intro[page_key] = intro_comment in markdown
-
-        # Mask code blocks to prevent processing quiz tags inside them
-        masked_markdown, placeholders = mask_code_blocks(markdown)
+        self._has_intro[page_key] = INTRO_COMMENT in markdown
 
-        # Check for old v1.x syntax after masking code blocks
+        # Find quizzes and old syntax in one pass, skipping fenced code blocks
         # This prevents false positives from documentation examples in code blocks
-        self._check_for_old_syntax(masked_markdown, page)
-
-        # Find all quiz matches
-        matches = find_quizzes(masked_markdown)
+        scan = scan_markdown(markdown)
+        self._check_for_old_syntax(scan, page)
+
+        if self.config.get("manifest", False):
+            from .manifest import quiz_entries
+
+            self._manifest[page.file.src_uri] = quiz_entries(
+                scan.quizzes,
+                page.url,
+                page.file.src_uri,
+                markdown,
+                self._source_line_offset(page, markdown),
+            )
 
         # Build replacement segments efficiently (O(n) instead of O(n²))
         segments = []
         last_end = 0
 
-        for quiz_id, match in enumerate(matches):
+        for quiz_id, match in enumerate(scan.quizzes):
             # Get the original quiz content (for embed_source)
             original_quiz_content = match.group(0)  # Full <quiz>...</quiz> tag
 
@@ -765,20 +985,59 @@ class MkDocsQuizPlugin(BasePlugin):
             self._quiz_storage[page_key][placeholder] = {"source": original_quiz_content}
 
             # Add the text before this match and the placeholder
-            segments.append(masked_markdown[last_end : match.start()])
+            segments.append(markdown[last_end : match.start()])
             segments.append(placeholder)
             last_end = match.end()
 
         # Add any remaining text after the last match
-        segments.append(masked_markdown[last_end:])
+        segments.append(markdown[last_end:])
 
         # Join all segments at once (single operation)
-        masked_markdown = "".join(segments)
+        return "".join(segments)
+
+    @staticmethod
+    def _source_line_offset(page: Page, markdown: str) -> int:
+        """Return the number of source file lines before the page markdown (front matter).
 
-        # Restore code blocks
-        markdown = unmask_code_blocks(masked_markdown, placeholders)
+        Args:
+            page: The current page object.
+            markdown: The markdown content of the page.
 
-        return markdown
+        Returns:
+            The line offset, or 0 if another plugin changed the markdown.
+        """
+        try:
+            source = page.file.content_string
+        except (OSError, ValueError):
+            return 0
+        if not source.endswith(markdown):
+            return 0
+        return source.count("\n", 0, len(source) - len(markdown))
+
+    def _get_fragment_markdown(self, page: Page, config: MkDocsConfig, files: Files) -> md.Markdown:
+        """Get the pooled fragment Markdown instance, bound to the given page.
+
+        Loading `config.markdown_extensions` is far more expensive than converting a
+        short fragment, so a single instance is built per config and reused for every
+        quiz in the build. Only the page-specific MkDocs treeprocessor state is
+        rebound before each use.
+
+        Args:
+            page: MkDocs Page object used to resolve relative links.
+            config: MkDocs config for markdown extensions.
+            files: MkDocs Files collection for link resolution.
+
+        Returns:
+            A reset Markdown instance ready to convert fragments of this page.
+        """
+        fragment_md = self._fragment_md_pool.get(id(config))
+        if fragment_md is None or fragment_md.config is not config:
+            md_inst = self._create_fragment_markdown(page, config, files)
+            fragment_md = _FragmentMarkdown(config, md_inst)
+            # Memoized fragments were rendered with another config's extensions
+            self._fragment_memo = None
+            self._fragment_md_pool[id(config)] = fragment_md
+        return fragment_md.bind(page, files)
 
     def _create_fragment_markdown(
         self, page: Page, config: MkDocsConfig, files: Files
@@ -787,7 +1046,7 @@ class MkDocsQuizPlugin(BasePlugin):
 
         This uses the same processors that `Page.render()` registers.
         The returned instance can be reused across fragments by calling `.reset()`
-        between conversions.
+        between conversions, and across pages via `_get_fragment_markdown()`.
         """
         # Each quiz part (question, answers, content) is converted as its own
         # mini-document. `pymdownx.snippets`' `auto_append` injects file content
@@ -806,6 +1065,16 @@ class MkDocsQuizPlugin(BasePlugin):
                 },
             }
 
+        # Imported here, MkDocs has loaded them by the time pages are rendered
+        import markdown as md
+        from mkdocs.structure.pages import (
+            _ExtractAnchorsTreeprocessor,
+            _ExtractTitleTreeprocessor,
+            _RawHTMLPreprocessor,
+            _RelativePathTreeprocessor,
+        )
+
+        self._count("markdown_instances")
         md_inst = md.Markdown(
             extensions=config.markdown_extensions,
             extension_configs=extension_configs,
@@ -843,9 +1112,9 @@ class MkDocsQuizPlugin(BasePlugin):
             page: MkDocs Page object for resolving relative links.
             config: MkDocs config for markdown extensions.
             files: MkDocs Files collection for link resolution.
-            md_inst: Optional pre-created Markdown instance to reuse.
+            md_inst: Optional Markdown instance already bound to this page.
                 If provided, it will be reset before use.
-                If not provided, a new instance is created.
+                If not provided, the pooled instance is bound to the page.
 
         Returns:
             The converted HTML string.
@@ -853,10 +1122,142 @@ class MkDocsQuizPlugin(BasePlugin):
         if md_inst is not None:
             md_inst.reset()
         else:
-            md_inst = self._create_fragment_markdown(page, config, files)
+            md_inst = self._get_fragment_markdown(page, config, files)
 
+        self._count("fragment_conversions")
         return md_inst.convert(text)
 
+    def _get_fragment_memo(self) -> FragmentMemo | None:
+        """Get the memo of rendered fragments for this build, or None if disabled."""
+        if self._fragment_memo is None:
+            max_size = self.config.get("fragment_memo_size", 16) * 1024 * 1024
+            if max_size > 0:
+                self._fragment_memo = FragmentMemo(max_size)
+        return self._fragment_memo
+
+    def _memoized(
+        self,
+        kind: str,
+        fragments: list[str],
+        page: Page,
+        render: Callable[[list[str]], Sequence[str | None]],
+    ) -> list[str | None]:
+        """Render fragments, reusing identical fragments rendered earlier in the build.
+
+        Args:
+            kind: How the fragments are rendered, part of the memo key.
+            fragments: The markdown fragments.
+            page: The page the fragments are on.
+            render: Renders a list of fragments that aren't memoized yet.
+
+        Returns:
+            The HTML of each fragment, None where `render` returned None.
+        """
+        memo = self._get_fragment_memo()
+        if memo is None:
+            return list(render(fragments))
+
+        keys = [memo.make_key(kind, text, page.file.src_uri) for text in fragments]
+        rendered = [memo.get(key) if key is not None else None for key in keys]
+        misses = [i for i, fragment_html in enumerate(rendered) if fragment_html is None]
+        self._count("fragment_memo_hits", len(fragments) - len(misses))
+        if misses:
+            with capture_warnings() as warnings:
+                results = render([fragments[i] for i in misses])
+            for i, fragment_html in zip(misses, results):
+                rendered[i] = fragment_html
+                key = keys[i]
+                # Fragments that logged a warning (e.g. a broken link) must warn every time
+                if fragment_html is not None and key is not None and not warnings:
+                    memo.set(key, fragment_html)
+        return rendered
+
+    def _render_inline_fragments(
+        self, fragments: list[str], page: Page, config: MkDocsConfig, md_inst: md.Markdown
+    ) -> list[str | None]:
+        """Render answers and feedback that don't need the full Markdown pipeline.
+
+        Fragments without Markdown syntax are HTML-escaped, and single-line
+        fragments with inline syntax only are rendered without the block parser.
+        Both give the same HTML as `_convert_fragment_markdown()` followed by
+        `_strip_paragraph_wrapper()`.
+
+        Args:
+            fragments: The markdown of answers and feedback.
+            page: MkDocs Page object for resolving relative links.
+            config: MkDocs config for markdown extensions.
+            md_inst: Markdown instance already bound to this page.
+
+        Returns:
+            The inline HTML of each fragment, or None for fragments that need a
+            full conversion.
+        """
+        if not fast_paths_enabled(config.markdown_extensions):
+            self._count("fragments_full_path", len(fragments))
+            return [None] * len(fragments)
+
+        rendered: list[str | None] = [render_plain_text(text) for text in fragments]
+        plain = len(fragments) - rendered.count(None)
+        inline = [
+            i for i, text in enumerate(fragments) if rendered[i] is None and is_inline_only(text)
+        ]
+        if inline:
+            inline_html = self._memoized(
+                "inline",
+                [fragments[i] for i in inline],
+                page,
+                lambda texts: render_inline(md_inst, texts) or [None] * len(texts),
+            )
+            for i, fragment_html in zip(inline, inline_html):
+                rendered[i] = fragment_html
+        self._count("fragments_plain_text", plain)
+        self._count("fragments_inline", len(fragments) - plain - rendered.count(None))
+        self._count("fragments_full_path", rendered.count(None))
+        return rendered
+
+    def _convert_fragments(
+        self,
+        fragments: list[str],
+        page: Page,
+        config: MkDocsConfig,
+        files: Files,
+        md_inst: md.Markdown,
+    ) -> list[str]:
+        """Convert the markdown fragments of a quiz to HTML, in one pass where possible.
+
+        The output is the same as calling `_convert_fragment_markdown()` for each
+        fragment. Fragments already converted earlier in the build are reused, see
+        `fragments.py` for when the others are converted one by one.
+
+        Args:
+            fragments: The markdown fragments to convert.
+            page: MkDocs Page object for resolving relative links.
+            config: MkDocs config for markdown extensions.
+            files: MkDocs Files collection for link resolution.
+            md_inst: Markdown instance already bound to this page.
+
+        Returns:
+            The converted HTML of each fragment.
+        """
+
+        def convert(texts: list[str]) -> list[str]:
+            if can_batch(texts, config.markdown_extensions, config.mdx_configs):
+                md_inst.reset()
+                with held_logs() as records:
+                    converted = split_fragments(md_inst.convert(join_fragments(texts)), len(texts))
+                if converted is not None:
+                    release_logs(records)
+                    self._count("fragment_conversions", len(texts))
+                    self._count("fragment_batches")
+                    return converted
+                self._count("fragment_batch_fallbacks")
+            return [
+                self._convert_fragment_markdown(text, page, config, files, md_inst=md_inst)
+                for text in texts
+            ]
+
+        return cast("list[str]", self._memoized("html", fragments, page, convert))
+
     def _process_quiz(
         self,
         quiz_content: str,
@@ -884,6 +1285,8 @@ class MkDocsQuizPlugin(BasePlugin):
         Raises:
             ValueError: If the quiz format is invalid.
         """
+        self._count("quizzes_rendered")
+
         # Helper to convert markdown fragments using MkDocs' page-aware processors
         # Check if this is a fill-in-the-blank quiz
         if self._is_fill_in_blank_quiz(quiz_content):
@@ -892,18 +1295,7 @@ class MkDocsQuizPlugin(BasePlugin):
             )
 
         # Dedent the quiz content to handle indented quizzes (e.g., in content tabs)
-        quiz_content = dedent(quiz_content)
-
-        quiz_lines = quiz_content.splitlines()
-
-        # Remove empty lines at start and end
-        while quiz_lines and quiz_lines[0] == "":
-            quiz_lines = quiz_lines[1:]
-        while quiz_lines and quiz_lines[-1] == "":
-            quiz_lines = quiz_lines[:-1]
-
-        if not quiz_lines:
-            raise ValueError("Quiz content is empty")
+        quiz_lines = split_quiz_lines(quiz_content)
 
         # Parse question and answers
         # Question is everything up to the first checkbox answer
@@ -912,44 +1304,54 @@ class MkDocsQuizPlugin(BasePlugin):
         )
 
         # Validate quiz structure
-        if not question_text.strip():
-            raise ValueError("Quiz must have a question")
-        if not all_answers:
-            raise ValueError("Quiz must have at least one answer")
-        if not correct_answers:
-            raise ValueError("Quiz must have at least one correct answer")
-
-        # Create a single Markdown instance for all fragment conversions in this quiz
-        md_inst = self._create_fragment_markdown(page, config, files)
-
-        # Convert question markdown to HTML (supports multi-line questions with markdown)
-        question = self._convert_fragment_markdown(
-            question_text, page, config, files, md_inst=md_inst
-        )
+        check_quiz_structure(question_text, all_answers, correct_answers)
+
+        # Bind the pooled Markdown instance to this page for all fragments of this quiz
+        md_inst = self._get_fragment_markdown(page, config, files)
+
+        # Feedback is only converted for answers that have any
+        feedback_indices = [
+            i
+            for i in range(len(all_answers))
+            if i < len(answer_feedbacks) and answer_feedbacks[i].strip()
+        ]
+
+        # Get quiz content (everything after the last answer)
+        content_lines = quiz_lines[content_start_index:]
+
+        # Answers and feedback are inline content: plain text and inline-only Markdown
+        # are rendered directly, the rest is converted with the question (supports
+        # multi-line questions with markdown) and content section
+        inline_fragments = [*all_answers, *(answer_feedbacks[i] for i in feedback_indices)]
+        inline_html = self._render_inline_fragments(inline_fragments, page, config, md_inst)
+        fragments = [question_text]
+        fragments += [
+            text for text, rendered in zip(inline_fragments, inline_html) if rendered is None
+        ]
+        if content_lines:
+            fragments.append("\n".join(content_lines))
+        converted = iter(self._convert_fragments(fragments, page, config, files, md_inst))
+
+        question = next(converted)
+        inline_parts = [
+            self._strip_paragraph_wrapper(next(converted)) if rendered is None else rendered
+            for rendered in inline_html
+        ]
+        content_html = next(converted) if content_lines else ""
 
-        # Generate answer HTML (pass page/config/files so links are resolved)
+        feedbacks_html: list[str | None] = [None] * len(all_answers)
+        for i, feedback_html in zip(feedback_indices, inline_parts[len(all_answers) :]):
+            feedbacks_html[i] = feedback_html
+
+        # Generate answer HTML
         answer_html_list, as_checkboxes = self._generate_answer_html(
             all_answers,
             correct_answers,
-            answer_feedbacks,
+            inline_parts[: len(all_answers)],
+            feedbacks_html,
             quiz_id,
-            page=page,
-            config=config,
-            files=files,
-            md_inst=md_inst,
         )
 
-        # Get quiz content (everything after the last answer)
-        content_lines = quiz_lines[content_start_index:]
-        # Convert content markdown to HTML
-        content_html = ""
-        if content_lines:
-            content_text = "\n".join(content_lines)
-            # Use full markdown conversion for content section
-            content_html = self._convert_fragment_markdown(
-                content_text, page, config, files, md_inst=md_inst
-            )
-
         # Build data attributes for quiz options
         data_attrs = []
         if options["show_correct"]:
@@ -964,15 +1366,14 @@ class MkDocsQuizPlugin(BasePlugin):
 
         # Hide submit button only if auto-submit is enabled AND it's a single-choice quiz
         # For multiple-choice (checkboxes), always show the submit button
-        submit_text = t.get("Submit")
+        templates = self._get_templates()
         submit_button = (
             ""
             if options["auto_submit"] and not as_checkboxes
-            else f'<button type="submit" class="quiz-button">{submit_text}</button>'
+            else templates["submit_button"].render(text=t.get("Submit"))
         )
         # Generate quiz ID for linking
         quiz_header_id = f"quiz-{quiz_id}"
-        answers_html = "".join(answer_html_list)
 
         # If auto_number is enabled, add a header with the question number
         question_header = ""
@@ -980,26 +1381,182 @@ class MkDocsQuizPlugin(BasePlugin):
             # quiz_id is 0-indexed, so add 1 for display
             question_number = quiz_id + 1
             question_text = t.get("Question {n}", n=question_number)
-            question_header = f'<h4 class="quiz-number">{question_text}</h4>'
-
-        quiz_html = dedent(f"""
-            <div class="quiz" {attrs} id="{quiz_header_id}">
-                <a href="#{quiz_header_id}" class="quiz-header-link">#</a>
-                {question_header}
-                <div class="quiz-question" id="{quiz_header_id}-question">
-                    {question}
-                </div>
-                <form action="javascript:void(0);" onsubmit="return false;">
-                    <fieldset aria-labelledby="{quiz_header_id}-question">{answers_html}</fieldset>
-                    <div class="quiz-feedback hidden"></div>
-                    {submit_button}
-                </form>
-                <section class="content hidden">{content_html}</section>
-            </div>
-        """).strip()
+            question_header = templates["question_number"].render(text=question_text)
+
+        return templates["quiz"].render(
+            attrs=attrs,
+            id=quiz_header_id,
+            question_header=question_header,
+            question=question,
+            answers="".join(answer_html_list),
+            submit_button=submit_button,
+            content=content_html,
+        )
+
+    def _quiz_cache_key(
+        self,
+        quiz_content: str,
+        quiz_id: int,
+        options: dict[str, bool],
+        t: TranslationManager,
+        config: MkDocsConfig,
+        page: Page,
+        files: Files,
+    ) -> str | None:
+        """Build the persistent cache key for a quiz, or None if it can't be cached.
+
+        The key covers everything the rendered HTML depends on: the quiz source and
+        position, quiz options, translations, the page location (relative links),
+        the Markdown extension config, the HTML templates and, for quizzes containing
+        links, the set of documentation files that links can resolve to. It also
+        covers the link `validation` levels and `use_directory_urls`: a link only
+        logged at `info` level doesn't prevent caching, so raising it to `warn` must
+        render the quiz again for `--strict` to fail.
+
+        Args:
+            quiz_content: The content inside the quiz tags.
+            quiz_id: The unique ID for this quiz.
+            options: Quiz options for the page.
+            t: Translation manager for the page.
+            config: The MkDocs config object.
+            page: The current page object.
+            files: The files object.
+
+        Returns:
+            The cache key, or None if the quiz must always be rendered.
+        """
+        # Snippets pull in external files whose content isn't part of the key
+        if SNIPPET_MARKER in quiz_content:
+            return None
+
+        if self._markdown_fingerprint is None or self._markdown_fingerprint[0] != id(config):
+            markdown_fp = fingerprint(
+                [
+                    config.markdown_extensions,
+                    config.mdx_configs or {},
+                    {name: dict(levels) for name, levels in config.validation.items()},
+                    config.use_directory_urls,
+                ]
+            )
+            self._markdown_fingerprint = (id(config), markdown_fp)
+
+        self._get_templates()
+        files_fp = ""
+        if LINK_HINT_REGEX.search(quiz_content):
+            if self._files_fingerprint is None or self._files_fingerprint[0] != id(files):
+                files_fp = fingerprint(sorted(f.src_uri for f in files))
+                self._files_fingerprint = (id(files), files_fp)
+            files_fp = self._files_fingerprint[1]
+
+        return QuizCache.make_key(
+            __version__,
+            quiz_content,
+            str(quiz_id),
+            fingerprint(options),
+            t.language,
+            fingerprint(t.translations),
+            page.file.src_uri,
+            page.url,
+            self._markdown_fingerprint[1],
+            files_fp,
+            self._templates_fingerprint,
+        )
+
+    def _render_quiz(
+        self,
+        quiz_content: str,
+        quiz_id: int,
+        options: dict[str, bool],
+        t: TranslationManager,
+        config: MkDocsConfig,
+        page: Page,
+        files: Files,
+    ) -> str:
+        """Render a quiz to HTML, using the persistent quiz cache when enabled.
+
+        Takes the same arguments as `_process_quiz`.
+
+        Returns:
+            The HTML representation of the quiz.
+
+        Raises:
+            ValueError: If the quiz format is invalid.
+        """
+        cache = self._quiz_cache
+        key = (
+            self._quiz_cache_key(quiz_content, quiz_id, options, t, config, page, files)
+            if cache is not None or self._prerendered
+            else None
+        )
+        if key is None:
+            return self._process_quiz(quiz_content, quiz_id, options, t, config, page, files)
+
+        quiz_html = cache.get(key) if cache is not None else None
+        if quiz_html is not None:
+            self._count("quiz_cache_hits")
+            return quiz_html
 
+        quiz_html = self._prerendered.pop(key, None)
+        if quiz_html is not None:
+            self._count("quizzes_prerendered")
+        else:
+            with capture_warnings() as warnings:
+                quiz_html = self._process_quiz(
+                    quiz_content, quiz_id, options, t, config, page, files
+                )
+            # Don't cache output that warned, so the warning is repeated on every build
+            if warnings:
+                return quiz_html
+        if cache is not None:
+            cache.set(key, quiz_html)
         return quiz_html
 
+    def _prerender_page(self, file: File, config: MkDocsConfig, files: Files) -> dict[str, str]:
+        """Render all quizzes of a page ahead of the page build, in a worker process.
+
+        Quizzes that are already in the quiz cache, can't be cached, fail to render
+        or log a warning are skipped and left to `on_page_content`.
+
+        Args:
+            file: The documentation file of the page.
+            config: The MkDocs config object.
+            files: The files object.
+
+        Returns:
+            Mapping of quiz cache key to rendered quiz HTML.
+        """
+        from mkdocs.structure.pages import Page
+
+        page = Page(None, file, config)
+        page.read_source(config)
+        self.on_page_markdown(page.markdown or "", page, config)
+        self._has_results_div.pop(file.src_path, None)
+        self._has_intro.pop(file.src_path, None)
+
+        context = self._get_page_context(page, config)
+        options, t = context.options, context.t
+        rendered: dict[str, str] = {}
+        quizzes = self._quiz_storage.pop(file.src_path, {})
+        for quiz_id, quiz_data in enumerate(quizzes.values()):
+            inner = self._quiz_inner_content(quiz_data.get("source", ""))
+            key = self._quiz_cache_key(inner, quiz_id, options, t, config, page, files)
+            if key is None or (self._quiz_cache is not None and key in self._quiz_cache):
+                continue
+            try:
+                with capture_warnings() as warnings:
+                    quiz_html = self._process_quiz(inner, quiz_id, options, t, config, page, files)
+            except ValueError:
+                continue
+            if not warnings:
+                rendered[key] = quiz_html
+        return rendered
+
+    @staticmethod
+    def _quiz_inner_content(source: str) -> str:
+        """Return the content inside the quiz tags of a stored quiz source."""
+        inner_match = re.search(r"<quiz>(.*?)</quiz>", source, re.DOTALL)
+        return inner_match.group(1) if inner_match else source
+
     def _generate_results_html(self, t: TranslationManager) -> str:
         """Generate HTML for the quiz results end screen.
 
@@ -1009,37 +1566,13 @@ class MkDocsQuizPlugin(BasePlugin):
         Returns:
             The HTML representation of the results div.
         """
-        quiz_progress_text = t.get("Quiz Progress")
-        questions_answered_text = t.get("questions answered")
-        correct_text = t.get("correct")
-        quiz_complete_text = t.get("Quiz Complete!")
-        reset_quiz_text = t.get("Reset quiz")
-
-        results_html = dedent(
-            f"""
-            <div id="quiz-results" class="quiz-results">
-                <div class="quiz-results-progress">
-                    <h3>{quiz_progress_text}</h3>
-                    <p class="quiz-results-stats">
-                        <span class="quiz-results-answered">0</span> / <span class="quiz-results-total">0</span> {questions_answered_text}
-                        (<span class="quiz-results-percentage">0%</span>)
-                    </p>
-                    <p class="quiz-results-correct-stats">
-                        <span class="quiz-results-correct">0</span> {correct_text}
-                    </p>
-                </div>
-                <div class="quiz-results-complete hidden">
-                    <h2 class="quiz-results-title">{quiz_complete_text}</h2>
-                    <div class="quiz-results-score-display">
-                        <span class="quiz-results-score-value">0%</span>
-                    </div>
-                    <p class="quiz-results-message"></p>
-                    <button type="button" class="md-button md-button--primary quiz-results-reset">{reset_quiz_text}</button>
-                </div>
-            </div>
-        """
-        ).strip()
-        return results_html
+        return self._get_templates()["results"].render(
+            quiz_progress=t.get("Quiz Progress"),
+            questions_answered=t.get("questions answered"),
+            correct=t.get("correct"),
+            quiz_complete=t.get("Quiz Complete!"),
+            reset_quiz=t.get("Reset quiz"),
+        )
 
     def _generate_intro_html(self, t: TranslationManager) -> str:
         """Generate HTML for the quiz intro text with reset button.
@@ -1050,21 +1583,96 @@ class MkDocsQuizPlugin(BasePlugin):
         Returns:
             The HTML representation of the intro div.
         """
-        intro_text = t.get(
-            "Quiz results are saved to your browser's local storage and will persist between sessions."
+        return self._get_templates()["intro"].render(
+            intro_text=t.get(
+                "Quiz results are saved to your browser's local storage and will persist between sessions."
+            ),
+            reset_quiz=t.get("Reset quiz"),
         )
-        reset_quiz_text = t.get("Reset quiz")
 
-        intro_html = dedent(
-            f"""
-            <div class="quiz-intro">
-                <p>{intro_text}</p>
-                <button type="button" class="md-button quiz-intro-reset">{reset_quiz_text}</button>
-            </div>
+    def _link_source_file(self, page: Page) -> str:
+        """Store the quiz sources of a page for its sidecar file and link to it.
+
+        The file is written to `site_dir` in `on_post_build`.
+
+        Args:
+            page: The current page object, with its quizzes still in storage.
+
+        Returns:
+            The tag linking the page to its quiz source file.
         """
-        ).strip()
-        return intro_html
+        compress = self.config.get("source_compress", False)
+        path = sidecar_uri(page.file.dest_uri, compress)
+        sources = [
+            quiz_data.get("source", "")
+            for quiz_data in self._quiz_storage[page.file.src_path].values()
+        ]
+        self._source_files[path] = encode_sources(sources, compress)
+        return sidecar_link(get_relative_url(path, page.url))
+
+    def _get_asset_tags(self, page: Page) -> tuple[str, str, str]:
+        """Get the tags that load the quiz CSS, JS and confetti library on a page.
+
+        With `assets: inline` the assets are embedded in the page. With
+        `assets: external` the tags reference the hashed files written to
+        `site_dir` in `on_post_build`, so browsers download them once per site.
+        Either way, the CSS and JS are minified when `minify_assets` is enabled.
 
+        Args:
+            page: The current page object.
+
+        Returns:
+            A tuple of (style tag, quiz script tag, confetti script tag).
+        """
+        if not self._asset_files:
+            return _inline_asset_tags(self.config.get("minify_assets", False))
+
+        urls = {
+            kind: get_relative_url(asset_path, page.url)
+            for kind, (asset_path, _content) in self._asset_files.items()
+        }
+        confetti_tag = (
+            f'<script type="text/javascript" src="{urls["confetti"]}"></script>'
+            if "confetti" in urls
+            else ""
+        )
+        return (
+            f'<link rel="stylesheet" href="{urls["style"]}">',
+            f'<script type="text/javascript" src="{urls["js"]}" defer></script>',
+            confetti_tag,
+        )
+
+    def _get_translations_tag(self, t: TranslationManager, page: Page) -> str:
+        """Get the tag that provides the quiz translations of a page to its JavaScript.
+
+        Translations are serialized once per build for each language and custom
+        translation file. With `assets: external` the tag references a hashed
+        `quiz-i18n.<language>.<hash>.js` file written to `site_dir` in
+        `on_post_build`, so browsers download the strings of a language once per site.
+
+        Args:
+            t: Translation manager for the page.
+            page: The current page object.
+
+        Returns:
+            The script tag setting `window.mkdocsQuizTranslations`.
+        """
+        key = (t.language, str(t.custom_path) if t.custom_path else None)
+        asset = self._translation_assets.get(key)
+        if asset is None:
+            translations_json = json.dumps(t.to_dict(), ensure_ascii=False)
+            script = f"window.mkdocsQuizTranslations = {translations_json};"
+            filename = "quiz-i18n." + re.sub(r"[^\w-]", "_", t.language) + ".js"
+            asset = (_hashed_asset_path(filename, script), script)
+            self._translation_assets[key] = asset
+
+        asset_path, script = asset
+        if not self._asset_files:
+            return f'<script type="text/javascript">\n{script}\n</script>'
+        url = get_relative_url(asset_path, page.url)
+        return f'<script type="text/javascript" src="{url}"></script>'
+
+    @profiled
     def on_page_content(
         self, html: str, *, page: Page, config: MkDocsConfig, files: Files
     ) -> str | None:
@@ -1083,28 +1691,43 @@ class MkDocsQuizPlugin(BasePlugin):
         if not self._should_process_page(page):
             return html
 
-        # Replace placeholders with actual quiz HTML
         page_key = page.file.src_path
+        original_size = len(html)
+
+        # Pages without quizzes, results or intro markers get nothing injected
+        quiz_count = len(self._quiz_storage.get(page_key, {}))
+        has_quizzes = quiz_count > 0
+        has_results = self._has_results_div.pop(page_key, False)
+        has_intro = self._has_intro.pop(page_key, False)
+        if not (has_quizzes or has_results or has_intro):
+            self._quiz_storage.pop(page_key, None)
+            return html
+
+        # Quiz options and translations, shared by every quiz and fragment below
+        context = self._get_page_context(page, config)
+        options = context.options
+        translation_manager = context.t
+
+        # Replace placeholders with actual quiz HTML
         embed_source = self.config.get("embed_source", True)
+        sidecar = embed_source and self.config.get("source_storage", "inline") == "sidecar"
 
         if page_key in self._quiz_storage:
-            for placeholder, quiz_data in self._quiz_storage[page_key].items():
+            rendered: dict[str, str] = {}
+            # Placeholders are stored in quiz id order
+            for quiz_id, (placeholder, quiz_data) in enumerate(
+                self._quiz_storage[page_key].items()
+            ):
                 source = quiz_data.get("source", "")
-                # Extract inner quiz content
-                inner_match = re.search(r"<quiz>(.*?)</quiz>", source, re.DOTALL)
-                inner = inner_match.group(1) if inner_match else source
-
-                # Determine quiz id from placeholder
-                id_match = re.search(r"MKDOCS_QUIZ_PLACEHOLDER_(\d+)", placeholder)
-                quiz_id = int(id_match.group(1)) if id_match else 0
+                inner = self._quiz_inner_content(source)
 
                 try:
                     # Generate the quiz HTML now that we have `files` available
-                    quiz_html = self._process_quiz(
+                    quiz_html = self._render_quiz(
                         inner,
                         quiz_id,
-                        self._get_quiz_options(page),
-                        self._get_translation_manager(page, config),
+                        options,
+                        translation_manager,
                         config,
                         page,
                         files,
@@ -1126,34 +1749,30 @@ class MkDocsQuizPlugin(BasePlugin):
                     raise ValueError(error_msg) from e
 
                 # Optionally embed the original quiz source as an HTML comment
-                if embed_source:
+                if embed_source and not sidecar:
                     source_comment = f"<!-- mkdocs-quiz-source\n{source}\n-->\n"
                     quiz_html = source_comment + quiz_html
 
-                html = html.replace(placeholder, quiz_html)
+                rendered[placeholder] = quiz_html
 
-            # Clean up storage for this page
-            del self._quiz_storage[page_key]
+            html = substitute_placeholders(html, QUIZ_PLACEHOLDER_REGEX, rendered)
 
-        # Get quiz options to check settings
-        options = self._get_quiz_options(page)
+            # Or write the sources to a file next to the page and link to it
+            if sidecar:
+                html = self._link_source_file(page) + "\n" + html
 
-        # Get translation manager for this page
-        translation_manager = self._get_translation_manager(page, config)
+            # Clean up storage for this page
+            del self._quiz_storage[page_key]
 
         # Handle results div if present
-        if self._has_results_div.get(page_key, False):
+        if has_results:
             results_html = self._generate_results_html(translation_manager)
-            html = html.replace("<!-- mkdocs-quiz results -->", results_html)
-            # Clean up
-            del self._has_results_div[page_key]
+            html = html.replace(RESULTS_COMMENT, results_html)
 
         # Handle intro if present
-        if self._has_intro.get(page_key, False):
+        if has_intro:
             intro_html = self._generate_intro_html(translation_manager)
-            html = html.replace("<!-- mkdocs-quiz intro -->", intro_html)
-            # Clean up
-            del self._has_intro[page_key]
+            html = html.replace(INTRO_COMMENT, intro_html)
 
         # Inject quiz progress sidebar for Material theme (will be positioned by JavaScript)
         # This is injected directly into the HTML instead of using template overrides
@@ -1176,22 +1795,17 @@ class MkDocsQuizPlugin(BasePlugin):
             """
             ).strip()
 
+        style_tag, js_tag, confetti_tag = self._get_asset_tags(page)
+
         # Add confetti library if enabled
         confetti_enabled = self.config.get("confetti", True)
         confetti_script: str = ""
         if confetti_enabled:
             # Use bundled confetti library (v0.12.0) instead of external CDN
-            confetti_script = confetti_lib_script
+            confetti_script = confetti_tag
 
         # Inject translations as JavaScript object
-        translations_json = json.dumps(translation_manager.to_dict(), ensure_ascii=False)
-        translations_script: str = dedent(
-            f"""
-            <script type="text/javascript">
-            window.mkdocsQuizTranslations = {translations_json};
-            </script>
-        """
-        ).strip()
+        translations_script = self._get_translations_tag(translation_manager, page)
 
         # Add configuration object for JavaScript
         show_progress = options.get("show_progress", True)
@@ -1208,12 +1822,16 @@ class MkDocsQuizPlugin(BasePlugin):
         """
         ).strip()
 
-        return (
+        html = (
             html
-            + style
+            + style_tag
             + confetti_script
             + translations_script
             + config_script
-            + js_script
+            + js_tag
             + auto_number_script
         )
+        if self._profile is not None and self._profile.current is not None:
+            self._profile.current.quizzes = quiz_count
+            self._profile.current.bytes_injected = len(html) - original_size
+        return html
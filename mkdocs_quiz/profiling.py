@@ -0,0 +1,141 @@
+"""Build-time profiling of the quiz plugin.
+
+Enabled with the `profile` option or the `MKDOCS_QUIZ_PROFILE` environment
+variable. Records the time spent in the page hooks for every page, together with
+counters for the expensive operations behind it, and writes them to a JSON
+report at the end of the build.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from mkdocs.structure.pages import Page
+
+PROFILE_ENV_VAR = "MKDOCS_QUIZ_PROFILE"
+
+# Number of slowest pages listed in the build log
+TOP_PAGES = 10
+
+_HookT = TypeVar("_HookT", bound=Callable[..., Any])
+
+
+def profile_enabled_by_env() -> bool:
+    """Check whether profiling was requested with the environment variable."""
+    return os.environ.get(PROFILE_ENV_VAR, "").strip().lower() not in ("", "0", "false", "no")
+
+
+@dataclass
+class PageProfile:
+    """Time spent and work done by the plugin for a single page."""
+
+    src_uri: str
+    on_page_markdown: float = 0.0
+    on_page_content: float = 0.0
+    quizzes: int = 0
+    bytes_injected: int = 0
+    counters: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def total(self) -> float:
+        """Total time in the page hooks, in seconds."""
+        return self.on_page_markdown + self.on_page_content
+
+
+class BuildProfile:
+    """Collects per-page timings and operation counters for one build."""
+
+    def __init__(self) -> None:
+        """Initialize an empty profile."""
+        self.pages: dict[str, PageProfile] = {}
+        self.counters: Counter[str] = Counter()
+        self.current: PageProfile | None = None
+
+    def page(self, page: Page) -> PageProfile:
+        """Return the profile of a page, creating it on first use."""
+        src_uri = page.file.src_uri
+        if src_uri not in self.pages:
+            self.pages[src_uri] = PageProfile(src_uri)
+        return self.pages[src_uri]
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Increment a counter, for the build and for the page being processed."""
+        self.counters[name] += n
+        if self.current is not None:
+            self.current.counters[name] += n
+
+    def report(self) -> dict[str, Any]:
+        """Return the profile as JSON-serializable data, slowest pages first."""
+        pages = sorted(self.pages.values(), key=lambda p: p.total, reverse=True)
+        return {
+            "total_seconds": round(sum(p.total for p in pages), 6),
+            "pages_with_quizzes": sum(1 for p in pages if p.quizzes),
+            "quizzes": sum(p.quizzes for p in pages),
+            "bytes_injected": sum(p.bytes_injected for p in pages),
+            "counters": dict(sorted(self.counters.items())),
+            "pages": [{**asdict(p), "counters": dict(sorted(p.counters.items()))} for p in pages],
+        }
+
+    def write(self, path: Path) -> dict[str, Any]:
+        """Write the JSON report.
+
+        Args:
+            path: Destination of the report. Parent directories are created.
+
+        Returns:
+            The report data.
+        """
+        report = self.report()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        return report
+
+    def summary(self, top: int = TOP_PAGES) -> str:
+        """Return a human-readable summary with the slowest pages."""
+        report = self.report()
+        lines = [
+            f"Quiz plugin profile: {report['total_seconds']:.2f}s in page hooks, "
+            f"{report['quizzes']} quizzes on {report['pages_with_quizzes']} pages, "
+            f"{report['bytes_injected']:,} bytes injected",
+            "  " + ", ".join(f"{name}: {n}" for name, n in report["counters"].items()),
+            "  Slowest pages:",
+        ]
+        for page in report["pages"][:top]:
+            total = page["on_page_markdown"] + page["on_page_content"]
+            lines.append(f"    {total:8.3f}s  {page['src_uri']} ({page['quizzes']} quizzes)")
+        return "\n".join(lines)
+
+
+def profiled(hook: _HookT) -> _HookT:
+    """Record the time spent in a page hook when the plugin's profile is active.
+
+    The wrapped hook must take the page as second argument or `page` keyword,
+    like `on_page_markdown` and `on_page_content`.
+    """
+
+    @functools.wraps(hook)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        profile: BuildProfile | None = self._profile
+        if profile is None:
+            return hook(self, *args, **kwargs)
+
+        page_profile = profile.page(kwargs["page"] if "page" in kwargs else args[1])
+        profile.current = page_profile
+        start = time.perf_counter()
+        try:
+            return hook(self, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            setattr(page_profile, hook.__name__, getattr(page_profile, hook.__name__) + elapsed)
+            profile.current = None
+
+    return wrapper  # type: ignore[return-value]
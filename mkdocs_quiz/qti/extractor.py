@@ -14,7 +14,6 @@ from ..parsing import (
     FILL_BLANK_REGEX,
     collect_feedback,
     find_quizzes,
-    mask_code_blocks,
     parse_answer,
 )
 from .models import Answer, Blank, Quiz, QuizCollection
@@ -194,7 +193,7 @@ def _parse_multiple_choice_quiz(
     )
 
 
-def _parse_quiz_content(
+def parse_quiz_content(
     content: str,
     source_file: Path | None = None,
     source_line: int | None = None,
@@ -232,16 +231,17 @@ def extract_quizzes_from_file(file_path: Path) -> list[Quiz]:
     except (OSError, UnicodeDecodeError) as e:
         raise ValueError(f"Failed to read file {file_path}: {e}") from e
 
-    # Mask code blocks to avoid false positives
-    masked_content, _ = mask_code_blocks(content)
-
     quizzes: list[Quiz] = []
 
-    for match in find_quizzes(masked_content):
-        # Calculate line number
-        line_number = content[: match.start()].count("\n") + 1
+    # Quiz tags inside code blocks are skipped by the scanner
+    line_number = 1
+    last_start = 0
+    for match in find_quizzes(content):
+        # Calculate line number, counting only the text since the previous quiz
+        line_number += content.count("\n", last_start, match.start())
+        last_start = match.start()
 
-        quiz = _parse_quiz_content(
+        quiz = parse_quiz_content(
             match.group(1),
             source_file=file_path,
             source_line=line_number,
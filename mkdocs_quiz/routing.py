@@ -0,0 +1,133 @@
+"""Resolution of the quiz language of pages from the site configuration.
+
+The language of a page comes from `theme.language`, the `extra.alternate`
+link whose URL prefix matches the page, the plugin `language` option and the
+first matching `language_patterns` glob. These are compiled once per build into
+a `LanguageRoutes` table: the alternate links into a prefix trie walked along
+the page URL, and the patterns into a single regular expression matched against
+the source path. Resolving a page then costs the same however many alternates
+and patterns a site has.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import logging
+import os
+import re
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+log = logging.getLogger("mkdocs.plugins.mkdocs_quiz")
+
+# Trie node key of the (prefix, language) of the alternate link ending at a node
+_END = ""
+
+
+class LanguageRoutes:
+    """Language resolution rules of a site, compiled for matching many pages."""
+
+    def __init__(
+        self,
+        default: str,
+        alternates: Sequence[Mapping[str, Any]] = (),
+        language: str | None = None,
+        patterns: Sequence[Mapping[str, Any]] = (),
+    ) -> None:
+        """Compile the language rules of a site.
+
+        Args:
+            default: Language of pages no rule applies to (`theme.language` or "en").
+            alternates: The `extra.alternate` entries, with `link` and `lang` keys.
+            language: The plugin `language` option, which overrides alternates.
+            patterns: The `language_patterns` entries, with `pattern` and
+                `language` keys. The first matching pattern wins.
+        """
+        self.default = default
+        self.language = language
+
+        # Nested dicts keyed by character. Root links ("/") would match every
+        # page and are skipped. For duplicate links the first one wins.
+        self._trie: dict[str, Any] = {}
+        for alt in alternates:
+            link, lang = alt.get("link", ""), alt.get("lang")
+            prefix = link.lstrip("/") if link else ""
+            if prefix and lang:
+                node = self._trie
+                for char in prefix:
+                    node = node.setdefault(char, {})
+                node.setdefault(_END, (prefix, lang))
+
+        # One named group per pattern. Alternatives are tried in order, so the
+        # group that matched is the first matching pattern.
+        self._patterns: list[tuple[str, Any]] = []
+        alternatives = []
+        for pattern_config in patterns:
+            pattern = pattern_config.get("pattern", "")
+            if pattern:
+                regex = fnmatch.translate(os.path.normcase(pattern))
+                alternatives.append(f"(?P<p{len(self._patterns)}>{regex})")
+                self._patterns.append((pattern, pattern_config.get("language")))
+        self._pattern_regex = re.compile("|".join(alternatives)) if alternatives else None
+
+    def match_alternate(self, url: str) -> tuple[str, str] | None:
+        """Find the alternate link with the longest prefix of a page URL.
+
+        Args:
+            url: The page URL, relative to the site root.
+
+        Returns:
+            The (prefix, language) of the matching link, or None.
+        """
+        node = self._trie
+        match = None
+        for char in url:
+            if char not in node:
+                break
+            node = node[char]
+            match = node.get(_END, match)
+        return match
+
+    def match_pattern(self, src_path: str) -> tuple[str, Any] | None:
+        """Find the first language pattern matching a page source path.
+
+        Args:
+            src_path: The page source path, relative to `docs_dir`.
+
+        Returns:
+            The (pattern, language) of the matching pattern, or None.
+        """
+        if self._pattern_regex is None:
+            return None
+        match = self._pattern_regex.match(os.path.normcase(src_path))
+        if match is None or match.lastgroup is None:
+            return None
+        return self._patterns[int(match.lastgroup[1:])]
+
+    def resolve(self, src_path: str, url: str) -> str:
+        """Resolve the language of a page, before any frontmatter override.
+
+        Args:
+            src_path: The page source path, relative to `docs_dir`.
+            url: The page URL, relative to the site root.
+
+        Returns:
+            The page language.
+        """
+        language = self.default
+
+        alternate = self.match_alternate(url)
+        if alternate is not None:
+            language = alternate[1]
+            log.debug(f"Matched extra.alternate '{alternate[0]}' for {url}: {language}")
+
+        if self.language is not None:
+            language = self.language
+            log.debug(f"Using mkdocs_quiz.language config: {language}")
+
+        pattern = self.match_pattern(src_path)
+        if pattern is not None:
+            language = pattern[1]
+            log.debug(f"Matched pattern '{pattern[0]}' for {src_path}, using language: {language}")
+
+        return language
@@ -0,0 +1,90 @@
+"""Quiz source sidecar files (`source_storage: sidecar`).
+
+By default `embed_source` puts the source of every quiz into the page HTML as
+a comment, which visitors download without ever seeing. In sidecar mode, the
+sources of a page are written to a JSON file next to the page, optionally
+gzip-compressed, and the page only links to it:
+
+    <link rel="mkdocs-quiz-source" href="index.quiz-sources.json">
+
+The CLI fetcher follows the link, so running quizzes from a URL keeps working.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import posixpath
+import re
+
+SIDECAR_VERSION = 1
+
+SIDECAR_SUFFIX = ".quiz-sources.json"
+
+SIDECAR_LINK_REGEX = re.compile(r'<link rel="mkdocs-quiz-source" href="([^"]+)">')
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def sidecar_uri(dest_uri: str, compress: bool) -> str:
+    """Return the site path of the sidecar file of a page.
+
+    Args:
+        dest_uri: Path of the page's HTML file in the site, e.g. `guide/index.html`.
+        compress: Whether the sidecar is gzip-compressed.
+
+    Returns:
+        The sidecar path, e.g. `guide/index.quiz-sources.json.gz`.
+    """
+    return posixpath.splitext(dest_uri)[0] + SIDECAR_SUFFIX + (".gz" if compress else "")
+
+
+def sidecar_link(href: str) -> str:
+    """Return the tag linking a page to its sidecar file."""
+    return f'<link rel="mkdocs-quiz-source" href="{href}">'
+
+
+def encode_sources(sources: list[str], compress: bool) -> bytes:
+    """Encode the quiz sources of a page as sidecar file content.
+
+    Args:
+        sources: Full `<quiz>...</quiz>` source of each quiz, in page order.
+        compress: Whether to gzip-compress the content.
+
+    Returns:
+        The file content. Compressed content doesn't depend on the build time.
+    """
+    data = json.dumps(
+        {"version": SIDECAR_VERSION, "sources": sources},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return gzip.compress(data, mtime=0) if compress else data
+
+
+def decode_sources(content: bytes) -> list[str]:
+    """Decode the quiz sources of a sidecar file, compressed or not.
+
+    Args:
+        content: The sidecar file content.
+
+    Returns:
+        The quiz sources, in page order.
+
+    Raises:
+        ValueError: If the content isn't a sidecar file this version can read.
+    """
+    if content.startswith(_GZIP_MAGIC):
+        try:
+            content = gzip.decompress(content)
+        except (OSError, EOFError) as e:
+            raise ValueError(f"Invalid compressed quiz source file: {e}") from e
+    data = json.loads(content)
+    if not isinstance(data, dict) or not isinstance(data.get("sources"), list):
+        raise ValueError("Not a mkdocs-quiz source file")
+    if data.get("version", 0) > SIDECAR_VERSION:
+        raise ValueError(
+            f"Unsupported quiz source file version {data['version']}, try upgrading mkdocs-quiz"
+        )
+    sources: list[str] = data["sources"]
+    return sources
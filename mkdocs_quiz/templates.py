@@ -0,0 +1,246 @@
+"""HTML templates for the quiz markup generated by the plugin.
+
+Every piece of markup the plugin generates (quiz containers, answers, blanks,
+the results screen, the intro and the progress sidebar) comes from a template
+with `{{ name }}` placeholders. Templates are compiled once per build into a
+plain `str.format` call, so rendering a quiz doesn't rebuild or dedent large
+strings.
+
+Any template can be replaced through the `templates` option with an HTML file,
+e.g. to change the markup for a custom theme. Values are inserted as they are:
+translations and rendered Markdown are already HTML.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from pathlib import Path
+from textwrap import dedent
+
+from mkdocs.exceptions import PluginError
+
+_PLACEHOLDER_REGEX = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+QUIZ_TEMPLATE = """
+    <div class="quiz" {{ attrs }} id="{{ id }}">
+        <a href="#{{ id }}" class="quiz-header-link">#</a>
+        {{ question_header }}
+        <div class="quiz-question" id="{{ id }}-question">
+            {{ question }}
+        </div>
+        <form action="javascript:void(0);" onsubmit="return false;">
+            <fieldset aria-labelledby="{{ id }}-question">{{ answers }}</fieldset>
+            <div class="quiz-feedback hidden"></div>
+            {{ submit_button }}
+        </form>
+        <section class="content hidden">{{ content }}</section>
+    </div>
+"""
+
+FILL_BLANK_TEMPLATE = """
+    <div class="quiz quiz-fill-blank" {{ attrs }} id="{{ id }}">
+        <a href="#{{ id }}" class="quiz-header-link">#</a>
+        {{ question_header }}
+        <div class="quiz-question">
+            {{ question }}
+        </div>
+        <form action="javascript:void(0);" onsubmit="return false;">
+            <div class="quiz-feedback hidden"></div>
+            {{ submit_button }}
+        </form>
+        <section class="content hidden">{{ content }}</section>
+    </div>
+"""
+
+QUESTION_NUMBER_TEMPLATE = '<h4 class="quiz-number">{{ text }}</h4>'
+
+SUBMIT_BUTTON_TEMPLATE = '<button type="submit" class="quiz-button">{{ text }}</button>'
+
+ANSWER_TEMPLATE = (
+    '<div><input type="{{ input_type }}" name="answer" value="{{ value }}" '
+    'id="{{ id }}" {{ correct_attr }}><label for="{{ id }}">{{ label }}</label>'
+    "{{ feedback }}</div>"
+)
+
+ANSWER_FEEDBACK_TEMPLATE = '<div class="answer-feedback hidden">{{ feedback }}</div>'
+
+BLANK_TEMPLATE = (
+    '<input type="text" class="quiz-blank-input" id="{{ id }}" data-answer="{{ answer }}" '
+    'autocomplete="off" size="{{ size }}" aria-label="{{ label }}">'
+)
+
+RESULTS_TEMPLATE = """
+    <div id="quiz-results" class="quiz-results">
+        <div class="quiz-results-progress">
+            <h3>{{ quiz_progress }}</h3>
+            <p class="quiz-results-stats">
+                <span class="quiz-results-answered">0</span> / <span class="quiz-results-total">0</span> {{ questions_answered }}
+                (<span class="quiz-results-percentage">0%</span>)
+            </p>
+            <p class="quiz-results-correct-stats">
+                <span class="quiz-results-correct">0</span> {{ correct }}
+            </p>
+        </div>
+        <div class="quiz-results-complete hidden">
+            <h2 class="quiz-results-title">{{ quiz_complete }}</h2>
+            <div class="quiz-results-score-display">
+                <span class="quiz-results-score-value">0%</span>
+            </div>
+            <p class="quiz-results-message"></p>
+            <button type="button" class="md-button md-button--primary quiz-results-reset">{{ reset_quiz }}</button>
+        </div>
+    </div>
+"""
+
+INTRO_TEMPLATE = """
+    <div class="quiz-intro">
+        <p>{{ intro_text }}</p>
+        <button type="button" class="md-button quiz-intro-reset">{{ reset_quiz }}</button>
+    </div>
+"""
+
+SIDEBAR_TEMPLATE = """
+    <div id="quiz-progress-sidebar" aria-label="{{ quiz_progress }}" style="display: none;">
+      <!-- mkdocs-quiz progress sidebar (desktop) -->
+      <label class="md-nav__title">
+        <span class="md-nav__icon md-icon"></span>
+        {{ quiz_progress }}
+      </label>
+      <ul class="md-nav__list" data-md-component="quiz-progress">
+        <li class="md-nav__item">
+          <div class="md-nav__link">
+            <span class="md-ellipsis">
+              {{ answered }} <span class="quiz-progress-answered">0</span> / <span class="quiz-progress-total">0</span> (<span class="quiz-progress-answered-percentage">0%</span>)
+            </span>
+          </div>
+        </li>
+        <li class="md-nav__item">
+          <div class="md-nav__link">
+            <div class="quiz-progress-bar">
+              <div class="quiz-progress-bar-incorrect" style="width: 0%"></div>
+              <div class="quiz-progress-bar-correct" style="width: 0%"></div>
+            </div>
+          </div>
+        </li>
+        <li class="md-nav__item">
+          <div class="md-nav__link quiz-correct-reset">
+            <span class="md-ellipsis">
+              {{ correct }} <span class="quiz-progress-score">0</span> / <span class="quiz-progress-score-total">0</span> (<span class="quiz-progress-score-percentage">0%</span>)
+            </span>
+            <a href="#" class="quiz-reset-all-link" style="color: var(--md-primary-fg-color); text-decoration: none;">
+              {{ reset }}
+            </a>
+          </div>
+        </li>
+      </ul>
+    </div>
+    <nav id="quiz-progress-mobile" class="quiz-progress-mobile md-nav" aria-label="{{ quiz_progress }}" style="display: none;">
+      <!-- mkdocs-quiz progress sidebar (mobile) -->
+      <div class="quiz-progress-bar">
+        <div class="quiz-progress-bar-incorrect" style="width: 0%"></div>
+        <div class="quiz-progress-bar-correct" style="width: 0%"></div>
+      </div>
+      <div data-md-component="quiz-progress">
+        <div class="quiz-correct-reset">
+          <span class="md-ellipsis">
+            {{ answered }} <span class="quiz-progress-answered">0</span> / <span class="quiz-progress-total">0</span>
+          </span>
+          <span class="md-ellipsis">
+            {{ correct }} <span class="quiz-progress-score">0</span> / <span class="quiz-progress-score-total">0</span>
+          </span>
+          <a href="#" class="quiz-reset-all-link" style="color: var(--md-primary-fg-color); text-decoration: none;">
+            {{ reset }}
+          </a>
+        </div>
+      </div>
+    </nav>
+"""
+
+DEFAULT_TEMPLATES = {
+    "quiz": QUIZ_TEMPLATE,
+    "fill_blank": FILL_BLANK_TEMPLATE,
+    "question_number": QUESTION_NUMBER_TEMPLATE,
+    "submit_button": SUBMIT_BUTTON_TEMPLATE,
+    "answer": ANSWER_TEMPLATE,
+    "answer_feedback": ANSWER_FEEDBACK_TEMPLATE,
+    "blank": BLANK_TEMPLATE,
+    "results": RESULTS_TEMPLATE,
+    "intro": INTRO_TEMPLATE,
+    "sidebar": SIDEBAR_TEMPLATE,
+}
+
+
+class QuizTemplate:
+    """An HTML template compiled into a single `str.format` call."""
+
+    def __init__(self, name: str, source: str) -> None:
+        """Compile a template.
+
+        Args:
+            name: Name of the template, used in error messages.
+            source: The template HTML with `{{ name }}` placeholders. It is
+                dedented and stripped once here.
+        """
+        self.name = name
+        self.source = dedent(source).strip()
+        parts = _PLACEHOLDER_REGEX.split(self.source)
+        # Literal text and placeholder names alternate, starting with literal text
+        self.fields = frozenset(parts[1::2])
+        self._format = "".join(
+            part.replace("{", "{{").replace("}", "}}") if i % 2 == 0 else "{" + part + "}"
+            for i, part in enumerate(parts)
+        ).format
+
+    def render(self, **values: object) -> str:
+        """Render the template.
+
+        Args:
+            **values: The value of each placeholder, inserted without escaping.
+
+        Returns:
+            The rendered HTML.
+        """
+        return self._format(**values)
+
+
+def compile_templates(
+    overrides: Mapping[str, str] | None = None, base_dir: Path | None = None
+) -> dict[str, QuizTemplate]:
+    """Compile the default templates together with user overrides.
+
+    Args:
+        overrides: Template name to HTML file path, from the `templates` option.
+        base_dir: Directory that override paths are relative to (the directory
+            of `mkdocs.yml`).
+
+    Returns:
+        The compiled template for every name in `DEFAULT_TEMPLATES`.
+
+    Raises:
+        PluginError: If an override names an unknown template, can't be read, or
+            uses a placeholder the default template doesn't have.
+    """
+    templates = {name: QuizTemplate(name, source) for name, source in DEFAULT_TEMPLATES.items()}
+    for name, path in (overrides or {}).items():
+        if name not in templates:
+            raise PluginError(
+                f"Unknown quiz template '{name}' in the 'templates' option, "
+                f"expected one of: {', '.join(DEFAULT_TEMPLATES)}"
+            )
+        template_path = (base_dir or Path(".")) / path
+        try:
+            source = template_path.read_text(encoding="utf-8")
+        except OSError as e:
+            raise PluginError(
+                f"Could not read quiz template '{name}' from {template_path}: {e}"
+            ) from e
+        template = QuizTemplate(name, source)
+        if unknown := template.fields - templates[name].fields:
+            raise PluginError(
+                f"Quiz template {template_path} uses unknown placeholders: "
+                f"{', '.join(sorted(unknown))} (available: "
+                f"{', '.join(sorted(templates[name].fields))})"
+            )
+        templates[name] = template
+    return templates
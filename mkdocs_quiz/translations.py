@@ -2,14 +2,134 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 from pathlib import Path
-from typing import Any
-
-import polib
+from typing import Any, Optional
 
 log = logging.getLogger("mkdocs.plugins.mkdocs_quiz")
 
+# Built-in catalogs. `<language>.po` is the source of truth; `<language>.json` is
+# compiled from it with `mkdocs-quiz translations compile` and loaded at runtime,
+# so that building a site doesn't need to parse .po files with polib.
+LOCALES_DIR = Path(__file__).parent / "locales"
+
+COMPILED_CATALOG_VERSION = 1
+
+# Parsed catalogs shared by every TranslationManager in this process, keyed by
+# (language, custom path), with the (built-in .po mtime, custom .po mtime) they
+# were read at. An edited .po file is picked up on the next `mkdocs serve`
+# rebuild, and its catalog replaces the old one, so the cache doesn't grow.
+_CatalogKey = tuple[str, Optional[str]]
+_CatalogMtimes = tuple[Optional[int], Optional[int]]
+_catalog_cache: dict[_CatalogKey, tuple[_CatalogMtimes, dict[str, str]]] = {}
+
+
+def _mtime_ns(path: Path) -> int | None:
+    """Return the modification time of a file in nanoseconds, or None if it is missing."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def clear_translation_cache() -> None:
+    """Drop all cached translation catalogs so they are re-read on next use."""
+    _catalog_cache.clear()
+
+
+def parse_po_file(po_path: Path) -> dict[str, str]:
+    """Parse a .po file into a dictionary.
+
+    Args:
+        po_path: Path to the .po file.
+
+    Returns:
+        Dictionary mapping msgid (English source) to msgstr (translation).
+        Only includes entries that have translations.
+    """
+    # polib is slow to import and only needed for custom or uncompiled catalogs
+    import polib
+
+    po = polib.pofile(str(po_path))
+    translations = {}
+
+    for entry in po:
+        # Only include translated entries
+        # If msgstr is empty, we'll fall back to the English key in get()
+        if entry.msgstr:
+            translations[entry.msgid] = entry.msgstr
+
+    return translations
+
+
+def compiled_catalog_path(po_path: Path) -> Path:
+    """Return the path of the compiled catalog of a .po file."""
+    return po_path.with_suffix(".json")
+
+
+def _source_hash(po_path: Path) -> str:
+    # Hash the text with normalized line endings, which git may change on checkout
+    text = po_path.read_text(encoding="utf-8").replace("\r\n", "\n")
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def compile_catalog(po_path: Path) -> dict[str, Any]:
+    """Compile a .po file into the catalog data loaded at runtime.
+
+    Args:
+        po_path: Path to the .po file.
+
+    Returns:
+        The compiled catalog: the format version, a hash of the .po file it was
+        compiled from and the translated messages.
+    """
+    return {
+        "version": COMPILED_CATALOG_VERSION,
+        "source": _source_hash(po_path),
+        "messages": parse_po_file(po_path),
+    }
+
+
+def write_compiled_catalog(po_path: Path) -> Path:
+    """Compile a .po file and write the catalog next to it.
+
+    Args:
+        po_path: Path to the .po file.
+
+    Returns:
+        Path of the written catalog.
+    """
+    path = compiled_catalog_path(po_path)
+    data = json.dumps(compile_catalog(po_path), ensure_ascii=False, indent=2)
+    path.write_text(data + "\n", encoding="utf-8")
+    return path
+
+
+def load_compiled_catalog(po_path: Path) -> dict[str, str] | None:
+    """Load the compiled catalog of a .po file.
+
+    Args:
+        po_path: Path to the .po file.
+
+    Returns:
+        The translated messages, or None if the catalog is missing, unreadable
+        or was compiled from a different version of the .po file.
+    """
+    try:
+        data = json.loads(compiled_catalog_path(po_path).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != COMPILED_CATALOG_VERSION
+        or data.get("source") != _source_hash(po_path)
+    ):
+        return None
+    messages: dict[str, str] = data["messages"]
+    return messages
+
 
 class TranslationManager:
     """Manage translations for mkdocs-quiz plugin.
@@ -19,7 +139,7 @@ class TranslationManager:
     is missing, the English key is used as-is.
 
     Loading order:
-    1. Built-in .po files from plugin's locales/ directory
+    1. Built-in catalogs from plugin's locales/ directory, compiled from .po files
     2. User's custom .po files from their project (if configured)
     3. Falls back to English key if translation not found
     """
@@ -38,14 +158,51 @@ class TranslationManager:
         self.language = language
         self.custom_path = custom_path
         self.translations: dict[str, str] = {}
+        # Whether the catalogs were read from disk rather than the process-wide cache
+        self.catalog_loaded = False
         self._load_translations()
 
     def _load_translations(self) -> None:
-        """Load translations from .po files."""
+        """Load translations from .po files, reusing catalogs already parsed in this process."""
+        builtin_po = LOCALES_DIR / f"{self.language}.po"
+        builtin_mtime = _mtime_ns(builtin_po)
+        custom_mtime = _mtime_ns(self.custom_path) if self.custom_path else None
+        key = (self.language, str(self.custom_path) if self.custom_path else None)
+        mtimes = (builtin_mtime, custom_mtime)
+
+        cached = _catalog_cache.get(key)
+        if cached is not None and cached[0] == mtimes:
+            catalog = cached[1]
+        else:
+            catalog = self._read_catalogs(builtin_po, builtin_mtime, custom_mtime)
+            _catalog_cache[key] = (mtimes, catalog)
+            self.catalog_loaded = True
+
+        # Copy so that callers mutating `translations` can't corrupt the shared cache
+        self.translations = dict(catalog)
+
+    def _read_catalogs(
+        self, builtin_po: Path, builtin_mtime: int | None, custom_mtime: int | None
+    ) -> dict[str, str]:
+        """Load and merge the built-in and custom catalogs for this language.
+
+        Args:
+            builtin_po: Path to the built-in .po file for this language.
+            builtin_mtime: Modification time of the built-in file, or None if missing.
+            custom_mtime: Modification time of the custom file, or None if missing.
+
+        Returns:
+            Dictionary mapping msgid to translated msgstr.
+        """
+        translations: dict[str, str] = {}
+
         # 1. Load built-in translation from plugin's locales/ directory
-        builtin_po = Path(__file__).parent / "locales" / f"{self.language}.po"
-        if builtin_po.exists():
-            self.translations = self._parse_po_file(builtin_po)
+        if builtin_mtime is not None:
+            compiled = load_compiled_catalog(builtin_po)
+            if compiled is None:
+                log.debug(f"Compiled catalog for '{self.language}' is out of date, parsing .po")
+                compiled = self._parse_po_file(builtin_po)
+            translations = compiled
             log.debug(f"Loaded built-in translation: {self.language}")
         elif self.language != "en":
             log.warning(
@@ -56,34 +213,19 @@ class TranslationManager:
 
         # 2. Merge custom translations from user's project (if provided)
         if self.custom_path:
-            if self.custom_path.exists():
+            if custom_mtime is not None:
                 custom_trans = self._parse_po_file(self.custom_path)
-                self.translations.update(custom_trans)
+                translations.update(custom_trans)
                 log.debug(f"Loaded custom translations from {self.custom_path}")
             else:
                 log.warning(f"Custom translation file not found: {self.custom_path}")
 
-    def _parse_po_file(self, po_path: Path) -> dict[str, str]:
-        """Parse a .po file into a dictionary.
-
-        Args:
-            po_path: Path to the .po file.
-
-        Returns:
-            Dictionary mapping msgid (English source) to msgstr (translation).
-            Only includes entries that have translations.
-        """
-        po = polib.pofile(str(po_path))
-        translations = {}
-
-        for entry in po:
-            # Only include translated entries
-            # If msgstr is empty, we'll fall back to the English key in get()
-            if entry.msgstr:
-                translations[entry.msgid] = entry.msgstr
-
         return translations
 
+    def _parse_po_file(self, po_path: Path) -> dict[str, str]:
+        """Parse a .po file into a dictionary, see `parse_po_file()`."""
+        return parse_po_file(po_path)
+
     def get(self, key: str, **kwargs: Any) -> str:
         """Get translated string with optional formatting.
 
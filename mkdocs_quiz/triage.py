@@ -0,0 +1,113 @@
+"""Site-wide index of which documentation pages contain quiz markup.
+
+Most pages of a documentation site have no quizzes. With `parallel` rendering,
+every source file is read once at the start of a build, with a thread pool for
+the I/O, to find the pages to pre-render quizzes for before any page is built.
+Pages themselves are checked with `has_quiz_markup` on the markdown they are
+built from, since other plugins can supply or change the page source. The index
+lives for the whole process and is keyed by file path, size and modification
+time, so `mkdocs serve` rebuilds only re-read files that changed.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from mkdocs.structure.files import Files
+
+from .parsing import INTRO_COMMENT, OLD_SYNTAX_TAGS, QUIZ_START_TAG, RESULTS_COMMENT
+
+log = logging.getLogger("mkdocs.plugins.mkdocs_quiz")
+
+# Anything that makes the plugin do work on a page, including old syntax (an error)
+_TEXT_MARKERS = (QUIZ_START_TAG, RESULTS_COMMENT, INTRO_COMMENT, *OLD_SYNTAX_TAGS)
+_MARKERS = tuple(marker.encode("utf-8") for marker in _TEXT_MARKERS)
+
+
+@dataclass(frozen=True)
+class _IndexEntry:
+    mtime_ns: int
+    size: int
+    has_quiz_markup: bool
+
+
+# Process-wide, so the index survives the plugin being recreated on each rebuild
+_index: dict[str, _IndexEntry] = {}
+_index_lock = threading.Lock()
+
+
+def _scan_file(path: str, mtime_ns: int, size: int) -> _IndexEntry | None:
+    """Read a source file and check it for quiz markup."""
+    try:
+        with open(path, "rb") as f:
+            content = f.read()
+    except OSError:
+        return None
+    return _IndexEntry(mtime_ns, size, any(marker in content for marker in _MARKERS))
+
+
+def has_quiz_markup(markdown: str) -> bool:
+    """Check whether page markdown contains anything the plugin processes.
+
+    Args:
+        markdown: The page markdown.
+
+    Returns:
+        True if the markdown contains quiz tags, page markers or old quiz syntax.
+    """
+    return any(marker in markdown for marker in _TEXT_MARKERS)
+
+
+def triage_pages(files: Files) -> dict[str, bool]:
+    """Find out which documentation pages contain quiz markup.
+
+    Only files that are new, or whose size or modification time changed since
+    they were last indexed in this process, are read.
+
+    Args:
+        files: The files of this build.
+
+    Returns:
+        Mapping of `src_uri` to whether the page contains quiz markup. Pages
+        without a source file on disk (e.g. generated by a plugin) are omitted.
+    """
+    result: dict[str, bool] = {}
+    to_scan: list[tuple[str, str, int, int]] = []
+    for file in files.documentation_pages():
+        path = file.abs_src_path
+        if not path:
+            continue
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entry = _index.get(path)
+        if entry is not None and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+            result[file.src_uri] = entry.has_quiz_markup
+        else:
+            to_scan.append((file.src_uri, path, stat.st_mtime_ns, stat.st_size))
+
+    if to_scan:
+        with ThreadPoolExecutor() as executor:
+            entries = list(executor.map(lambda args: _scan_file(*args[1:]), to_scan))
+        with _index_lock:
+            for (src_uri, path, _mtime_ns, _size), new_entry in zip(to_scan, entries):
+                if new_entry is not None:
+                    _index[path] = new_entry
+                    result[src_uri] = new_entry.has_quiz_markup
+
+    log.debug(
+        f"Quiz triage: {sum(result.values())} of {len(result)} pages contain quiz markup "
+        f"({len(to_scan)} files read)"
+    )
+    return result
+
+
+def clear_triage_index() -> None:
+    """Forget all indexed files, e.g. between tests."""
+    with _index_lock:
+        _index.clear()
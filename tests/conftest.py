@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import re
+from pathlib import Path
 
 import pytest
-from mkdocs.structure.files import Files
+from mkdocs.config import load_config
+from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.structure.files import Files, get_files
 
 
 def strip_injected_assets(html: str) -> str:
@@ -20,6 +23,19 @@ def strip_source_comments(html: str) -> str:
     return re.sub(r"<!-- mkdocs-quiz-source\n.*?\n-->", "", html, flags=re.DOTALL)
 
 
+def make_site(
+    tmp_path: Path, pages: dict[str, str], mkdocs_yml: str = "site_name: Test\n"
+) -> tuple[MkDocsConfig, Files]:
+    """Write documentation pages to disk and return a loaded config and file collection."""
+    docs_dir = tmp_path / "docs"
+    for path, content in pages.items():
+        (docs_dir / path).parent.mkdir(parents=True, exist_ok=True)
+        (docs_dir / path).write_text(content, encoding="utf-8")
+    (tmp_path / "mkdocs.yml").write_text(mkdocs_yml, encoding="utf-8")
+    config = load_config(str(tmp_path / "mkdocs.yml"))
+    return config, get_files(config)
+
+
 @pytest.fixture
 def mock_files() -> Files:
     """Create a mock Files object for testing."""
@@ -0,0 +1,193 @@
+"""Tests for the persistent quiz HTML cache."""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+
+import pytest
+from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.structure.files import File, Files
+from mkdocs.structure.pages import Page
+
+from mkdocs_quiz.cache import QuizCache, capture_warnings, fingerprint
+from mkdocs_quiz.plugin import MkDocsQuizPlugin
+
+from .conftest import make_site
+
+QUIZ_MARKDOWN = """
+<quiz>
+What is 2+2?
+- [x] 4
+- [ ] 5
+
+Because **maths**.
+</quiz>
+"""
+
+
+def make_plugin(cache_dir: Path, **options: object) -> MkDocsQuizPlugin:
+    """Create a plugin with the quiz cache pointed at a temporary directory."""
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {"cache": True, "cache_dir": str(cache_dir), "cache_max_size": 1, **options}
+    return plugin
+
+
+def make_page(config: MkDocsConfig, path: str = "test.md") -> Page:
+    """Create a page for the given source path."""
+    file = File(path=path, src_dir="docs", dest_dir="site", use_directory_urls=True)
+    page = Page(None, file, config)
+    page.meta = {}
+    return page
+
+
+def build_page(plugin: MkDocsQuizPlugin, page: Page, config: MkDocsConfig, markdown: str) -> str:
+    """Run the plugin hooks for one page and return the resulting HTML."""
+    plugin.on_config(config)
+    result = plugin.on_page_markdown(markdown, page, config)
+    html = plugin.on_page_content(result, page=page, config=config, files=Files([page.file]))
+    assert html is not None
+    return html
+
+
+def test_cache_get_set_roundtrip(tmp_path: Path) -> None:
+    """Test that stored HTML is returned on the next lookup and counted."""
+    cache = QuizCache(tmp_path, max_size=1024)
+    key = QuizCache.make_key("source", "options")
+
+    assert cache.get(key) is None
+    cache.set(key, "<div>quiz</div>")
+    assert cache.get(key) == "<div>quiz</div>"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_keys_depend_on_every_part() -> None:
+    """Test that changing any key part produces a different key."""
+    base = QuizCache.make_key("a", "b")
+    assert QuizCache.make_key("a", "b") == base
+    assert QuizCache.make_key("a", "c") != base
+    assert QuizCache.make_key("ab", "") != base
+
+
+def test_cache_prune_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Test that pruning removes the oldest entries until under the size cap."""
+    cache = QuizCache(tmp_path, max_size=250)
+    keys = [QuizCache.make_key(str(i)) for i in range(3)]
+    for age, key in enumerate(keys):
+        cache.set(key, "x" * 100)
+        path = cache._entry_path(key)
+        os.utime(path, (1_000_000 + age, 1_000_000 + age))
+
+    # Reading the oldest entry marks it as recently used
+    assert cache.get(keys[0]) is not None
+
+    assert cache.prune() == 1
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+
+
+def test_fingerprint_is_stable_for_callables() -> None:
+    """Test that callables in mdx_configs are fingerprinted by name, not address."""
+    config = {"pymdownx.emoji": {"emoji_index": fingerprint}}
+    assert fingerprint(config) == fingerprint({"pymdownx.emoji": {"emoji_index": fingerprint}})
+    assert fingerprint(config) != fingerprint({"pymdownx.emoji": {"emoji_index": make_page}})
+
+
+def test_capture_warnings_collects_mkdocs_warnings() -> None:
+    """Test that warnings from MkDocs loggers are captured inside the block only."""
+    with capture_warnings() as warnings:
+        logging.getLogger("mkdocs.structure.pages").warning("broken link")
+        logging.getLogger("mkdocs.structure.pages").info("not a warning")
+    logging.getLogger("mkdocs.structure.pages").warning("outside")
+
+    assert [r.getMessage() for r in warnings] == ["broken link"]
+
+
+def test_plugin_reuses_cached_quiz_html(tmp_path: Path) -> None:
+    """Test that a second build is served from the cache with identical output."""
+    config = MkDocsConfig()
+
+    first = make_plugin(tmp_path)
+    html_first = build_page(first, make_page(config), config, QUIZ_MARKDOWN)
+    assert (first._quiz_cache.hits, first._quiz_cache.misses) == (0, 1)  # type: ignore[union-attr]
+
+    second = make_plugin(tmp_path)
+    html_second = build_page(second, make_page(config), config, QUIZ_MARKDOWN)
+    assert (second._quiz_cache.hits, second._quiz_cache.misses) == (1, 0)  # type: ignore[union-attr]
+    assert html_second == html_first
+
+
+@pytest.mark.parametrize(
+    ("options", "path"),
+    [
+        ({"show_correct": False}, "test.md"),
+        ({"language": "fr"}, "test.md"),
+        ({}, "other/page.md"),
+    ],
+)
+def test_plugin_cache_misses_when_inputs_change(
+    tmp_path: Path, options: dict[str, object], path: str
+) -> None:
+    """Test that options, language and page location are part of the cache key."""
+    config = MkDocsConfig()
+    build_page(make_plugin(tmp_path), make_page(config), config, QUIZ_MARKDOWN)
+
+    plugin = make_plugin(tmp_path, **options)
+    build_page(plugin, make_page(config, path), config, QUIZ_MARKDOWN)
+    assert plugin._quiz_cache.misses == 1  # type: ignore[union-attr]
+
+
+def test_plugin_does_not_cache_quizzes_that_warn(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that quizzes whose rendering logged a warning are rendered on every build."""
+    config = MkDocsConfig()
+    plugin = make_plugin(tmp_path)
+    original = plugin._process_quiz
+
+    def warning_process_quiz(*args: object, **kwargs: object) -> str:
+        logging.getLogger("mkdocs.structure.pages").warning("contains a broken link")
+        return original(*args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(plugin, "_process_quiz", warning_process_quiz)
+    build_page(plugin, make_page(config), config, QUIZ_MARKDOWN)
+
+    second = make_plugin(tmp_path)
+    build_page(second, make_page(config), config, QUIZ_MARKDOWN)
+    assert second._quiz_cache.misses == 1  # type: ignore[union-attr]
+
+
+@pytest.mark.parametrize(("first", "second"), [("info", "warn"), ("warn", "info")])
+def test_plugin_cache_misses_when_link_validation_changes(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture, first: str, second: str
+) -> None:
+    """Test that a warm cache doesn't hide a broken link whose level was raised to warn."""
+    markdown = "<quiz>\nWhere?\n- [x] [Here](missing.md)\n- [ ] There\n</quiz>\n"
+    cache_dir = tmp_path / "cache"
+    for level in (first, second, "warn"):
+        mkdocs_yml = f"site_name: Test\nvalidation:\n  links:\n    not_found: {level}\n"
+        config, files = make_site(tmp_path, {"index.md": markdown}, mkdocs_yml)
+        page = Page(None, files.documentation_pages()[0], config)
+        page.meta = {}
+        plugin = make_plugin(cache_dir)
+        plugin.on_config(config)
+        caplog.clear()
+        with caplog.at_level(logging.INFO, logger="mkdocs"):
+            result = plugin.on_page_markdown(markdown, page, config)
+            plugin.on_page_content(result, page=page, config=config, files=files)
+
+        assert plugin._quiz_cache.hits == 0  # type: ignore[union-attr]
+        [record] = [r for r in caplog.records if "missing.md" in r.getMessage()]
+        assert record.levelno == (logging.WARNING if level == "warn" else logging.INFO)
+
+
+def test_plugin_cache_disabled(tmp_path: Path) -> None:
+    """Test that nothing is written when the cache is disabled."""
+    config = MkDocsConfig()
+    plugin = make_plugin(tmp_path / "cache", cache=False)
+    build_page(plugin, make_page(config), config, QUIZ_MARKDOWN)
+
+    assert plugin._quiz_cache is None
+    assert not (tmp_path / "cache").exists()
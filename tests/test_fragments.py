@@ -0,0 +1,331 @@
+"""Tests for batched conversion of quiz fragments."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import pytest
+from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.structure.files import Files
+from mkdocs.structure.pages import Page
+
+from mkdocs_quiz import plugin as plugin_module
+from mkdocs_quiz.fragments import (
+    FragmentMemo,
+    can_batch,
+    fast_paths_enabled,
+    is_inline_only,
+    join_fragments,
+    render_inline,
+    render_plain_text,
+    split_fragments,
+)
+from mkdocs_quiz.plugin import MkDocsQuizPlugin
+from mkdocs_quiz.profiling import BuildProfile
+
+from .conftest import make_site
+
+MKDOCS_YML = """site_name: Test
+markdown_extensions:
+  - admonition
+  - attr_list
+  - def_list
+  - footnotes
+  - md_in_html
+  - tables
+  - toc
+  - pymdownx.superfences
+  - pymdownx.highlight
+  - pymdownx.inlinehilite
+  - pymdownx.emoji
+  - pymdownx.keys
+  - pymdownx.mark
+"""
+
+FRAGMENTS = [
+    "What does `print(1)` **print**?",
+    "`1`",
+    "An answer with a [link](other.md) and *emphasis*",
+    "- a list\n- at the end",
+    "    indented code",
+    "> A quote\n> on two lines",
+    "Term\n:   Definition",
+    "| a | b |\n| - | - |\n| 1 | 2 |",
+    "!!! note\n    Admonition content",
+    "Content with a fence:\n\n```python\nprint(1)\n```",
+    "Inline <b>HTML</b> and an image ![alt](img.png){ width=10 }",
+    "",
+    "Last paragraph\nwith a lazy line",
+]
+
+
+def make_plugin(tmp_path: Path) -> tuple[MkDocsQuizPlugin, Page, MkDocsConfig, Files]:
+    """Create a plugin and a page of a site with common Markdown extensions."""
+    config, files = make_site(tmp_path, {"index.md": "", "other.md": ""}, MKDOCS_YML)
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {"cache": False}
+    page = Page(None, files.documentation_pages()[0], config)
+    return plugin, page, config, files
+
+
+def convert_separately(
+    plugin: MkDocsQuizPlugin, fragments: list[str], page: Page, config: MkDocsConfig, files: Files
+) -> list[str]:
+    """Convert each fragment on its own, like before batching."""
+    md_inst = plugin._get_fragment_markdown(page, config, files)
+    return [
+        plugin._convert_fragment_markdown(text, page, config, files, md_inst=md_inst)
+        for text in fragments
+    ]
+
+
+def test_batched_output_matches_separate_conversion(tmp_path: Path) -> None:
+    """Test that a batch of fragments converts exactly like each fragment on its own."""
+    plugin, page, config, files = make_plugin(tmp_path)
+    assert can_batch(FRAGMENTS, config.markdown_extensions)
+
+    plugin._profile = BuildProfile()
+    md_inst = plugin._get_fragment_markdown(page, config, files)
+    batched = plugin._convert_fragments(FRAGMENTS, page, config, files, md_inst)
+    assert plugin._profile.counters["fragment_batches"] == 1
+
+    assert batched == convert_separately(plugin, FRAGMENTS, page, config, files)
+    assert plugin._strip_paragraph_wrapper(batched[1]) == "<code>1</code>"
+
+
+@pytest.mark.parametrize(
+    "fragment",
+    [
+        "# Heading",
+        "Setext heading\n---",
+        "Text with a footnote[^1]",
+        "[ref]: https://example.com",
+        "*[HTML]: Hyper Text Markup Language",
+        "<div>\nraw HTML block",
+        "/// details\nBlock",
+        "--8<-- 'snippet.md'",
+        "<!-- mkdocs-quiz-fragment-0 -->",
+        "```python\nunclosed",
+        '=== "Tab"\n\n    Content',
+        "~~~~\ncode\n~~~",
+        "- item\n\n    ```\n    code\n    ```",
+    ],
+)
+def test_unbatchable_fragments(fragment: str) -> None:
+    """Test that fragments using document-wide or block-level state are not batched."""
+    assert can_batch(["Question", "Answer"], [])
+    assert not can_batch(["Question", fragment], [])
+
+
+def test_unclosed_fence_not_batched(tmp_path: Path) -> None:
+    """Test that an unclosed fence doesn't pair with the fence of a later fragment."""
+    plugin, page, config, files = make_plugin(tmp_path)
+    fragments = ["Question?\n\n```python\nunclosed", "Answer", "~~~\ncode\n~~~"]
+    assert not can_batch(fragments, config.markdown_extensions)
+    assert can_batch(["````\n```\n````", "Use ```a``` here", "~~~\ncode\n~~~"], [])
+
+    md_inst = plugin._get_fragment_markdown(page, config, files)
+    converted = plugin._convert_fragments(fragments, page, config, files, md_inst)
+    assert converted == convert_separately(plugin, fragments, page, config, files)
+    assert "<code>code\n</code>" in converted[2]
+
+
+def test_numbered_ids_match_separate_conversion(tmp_path: Path) -> None:
+    """Test that content tabs and numbered code lines get the ids they get on their own."""
+    mkdocs_yml = (MKDOCS_YML + "  - pymdownx.tabbed:\n      alternate_style: true\n").replace(
+        "  - pymdownx.highlight\n", "  - pymdownx.highlight:\n      anchor_linenums: true\n"
+    )
+    config, files = make_site(tmp_path, {"index.md": ""}, mkdocs_yml)
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {"cache": False}
+    page = Page(None, files.documentation_pages()[0], config)
+    fragments = [
+        "Question?",
+        '=== "First"\n\n    One\n\n=== "Second"\n\n    Two',
+        "```python\nx = 1\n```",
+        "```python\ny = 2\n```",
+    ]
+    assert can_batch(fragments[2:], config.markdown_extensions)
+    assert not can_batch(fragments[2:], config.markdown_extensions, config.mdx_configs)
+
+    md_inst = plugin._get_fragment_markdown(page, config, files)
+    converted = plugin._convert_fragments(fragments, page, config, files, md_inst)
+    assert converted == convert_separately(plugin, fragments, page, config, files)
+    assert 'id="__tabbed_1_1"' in converted[1]
+    assert 'id="__codelineno-0-1"' in converted[3]
+
+
+def test_unbatchable_extensions() -> None:
+    """Test that extensions treating the start of the document specially disable batching."""
+    assert not can_batch(["Question", "Answer"], ["meta"])
+    assert not can_batch(["Question"], [])
+
+
+def test_split_rejects_swallowed_sentinels() -> None:
+    """Test that output without every sentinel in order is not split."""
+    joined = join_fragments(["a", "b", "c"])
+    assert split_fragments(joined, 3) == ["a", "b", "c"]
+    assert split_fragments(joined.replace("-0 ", "-1 "), 3) is None
+    assert split_fragments("<pre>" + joined.replace("<", "&lt;") + "</pre>", 3) is None
+
+
+def test_fallback_logs_warnings_once(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a batch that can't be split is converted separately, warning only once."""
+    plugin, page, config, files = make_plugin(tmp_path)
+    # The unclosed fence swallows the sentinels up to the fence in the last fragment.
+    # `can_batch` rejects it, so force a batch to exercise the fallback.
+    fragments = ["```python\nunclosed", "See [missing](missing.md)", "```\nclosed\n```"]
+    monkeypatch.setattr(plugin_module, "can_batch", lambda *args: True)
+
+    expected = convert_separately(plugin, fragments, page, config, files)
+    caplog.clear()
+    plugin._profile = BuildProfile()
+
+    md_inst = plugin._get_fragment_markdown(page, config, files)
+    with caplog.at_level(logging.INFO, logger="mkdocs"):
+        converted = plugin._convert_fragments(fragments, page, config, files, md_inst)
+
+    assert converted == expected
+    assert caplog.text.count("missing.md") == 1
+    assert plugin._profile.counters["fragment_batch_fallbacks"] == 1
+
+
+@pytest.mark.parametrize(
+    ("fragment", "fast_path"),
+    [
+        ("True", "plain"),
+        ("O(n log n)", "plain"),
+        ("Paris, France.", "plain"),
+        ("Tom & Jerry > Itchy", "plain"),
+        ('It\'s "quoted" - 50%', "plain"),
+        ("`list.sort()`", "inline"),
+        ("**Bold** and _emphasis_", "inline"),
+        ("A [link](other.md) and an ![image](img.png)", "inline"),
+        ("Inline <b>HTML</b> & more", "inline"),
+        ("An &amp; entity", None),
+        ("Press ++ctrl+c++ to ==copy== :smile:", "inline"),
+        ("`#!python print(1)` { .class }", "inline"),
+        ("Markdown\\*escapes\\*", "inline"),
+        ("- A list item", None),
+        ("1. Ordered", None),
+        ("# Heading", None),
+        ("> Quote", None),
+        ("    Indented code", None),
+        ("Two\nlines", None),
+        ("Trailing space ", None),
+        ("Footnote[^1]", None),
+    ],
+)
+def test_inline_fast_paths_match_full_conversion(
+    tmp_path: Path, fragment: str, fast_path: str | None
+) -> None:
+    """Test that plain text and inline-only fragments render like the full pipeline."""
+    plugin, page, config, files = make_plugin(tmp_path)
+    assert fast_paths_enabled(config.markdown_extensions)
+    md_inst = plugin._get_fragment_markdown(page, config, files)
+    expected = plugin._strip_paragraph_wrapper(
+        plugin._convert_fragment_markdown(fragment, page, config, files, md_inst=md_inst)
+    )
+
+    plain = render_plain_text(fragment)
+    assert (plain is not None) == (fast_path == "plain")
+    assert is_inline_only(fragment) == (fast_path is not None)
+    if plain is not None:
+        assert plain == expected
+    if fast_path is not None:
+        # Rendered together with other fragments, like the answers of a quiz
+        assert render_inline(md_inst, ["`a`", fragment, "*b*"]) == [
+            "<code>a</code>",
+            expected,
+            "<em>b</em>",
+        ]
+
+
+def test_inline_fast_paths_need_known_extensions() -> None:
+    """Test that extensions that may change plain text disable the fast paths."""
+    assert fast_paths_enabled(["toc", "markdown.extensions.tables", "pymdownx.superfences"])
+    assert not fast_paths_enabled(["toc", "smarty"])
+    assert not fast_paths_enabled(["toc", "pymdownx.magiclink"])
+    assert not fast_paths_enabled([object()])
+
+
+def test_inline_fast_path_rejects_replaced_paragraphs(tmp_path: Path) -> None:
+    """Test that fragments whose paragraph is replaced by a tree processor aren't rendered."""
+    plugin, page, config, files = make_plugin(tmp_path)
+    md_inst = plugin._get_fragment_markdown(page, config, files)
+
+    assert is_inline_only("[TOC]")
+    assert render_inline(md_inst, ["Answer", "[TOC]"]) is None
+
+
+def test_fragment_memo_evicts_least_recently_used() -> None:
+    """Test that the memo stays within its memory budget, dropping old fragments first."""
+    memo = FragmentMemo(max_size=1200)
+    keys = [("html", f"Fragment {i}", "") for i in range(3)]
+    for key in keys:
+        memo.set(key, "<p>" + "x" * 200 + "</p>")
+        memo.get(keys[0])
+
+    assert memo.size <= 1200
+    assert memo.get(keys[0]) is not None
+    assert memo.get(keys[1]) is None
+    assert memo.get(keys[2]) is not None
+    assert (memo.hits, memo.misses) == (5, 1)
+
+
+def test_fragment_memo_key_includes_page_for_links() -> None:
+    """Test that only fragments with links or images are memoized per page."""
+    assert FragmentMemo.make_key("html", "`True`", "a.md") == ("html", "`True`", "")
+    assert FragmentMemo.make_key("html", "[x](b.md)", "a.md") == ("html", "[x](b.md)", "a.md")
+    assert FragmentMemo.make_key("html", "![x](b.png)", "a.md") == ("html", "![x](b.png)", "a.md")
+    assert FragmentMemo.make_key("html", "--8<-- 'b.md'", "a.md") is None
+
+
+def test_memoized_fragments_are_shared_across_pages(tmp_path: Path) -> None:
+    """Test that fragments are reused on other pages, except links that render differently."""
+    config, files = make_site(
+        tmp_path, {"index.md": "", "sub/page.md": "", "other.md": ""}, MKDOCS_YML
+    )
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {"cache": False}
+    plugin._profile = BuildProfile()
+    fragments = ["Some *feedback*", "See [other](other.md)", "An answer\n\nwith paragraphs"]
+
+    rendered = {}
+    for src_uri in ("index.md", "sub/page.md"):
+        file = files.get_file_from_path(src_uri)
+        assert file is not None
+        page = Page(None, file, config)
+        md_inst = plugin._get_fragment_markdown(page, config, files)
+        rendered[src_uri] = plugin._convert_fragments(fragments, page, config, files, md_inst)
+        assert rendered[src_uri] == convert_separately(plugin, fragments, page, config, files)
+
+    assert rendered["index.md"][1] != rendered["sub/page.md"][1]
+    assert plugin._profile.counters["fragment_memo_hits"] == 2
+
+
+def test_fragments_that_warn_are_not_memoized(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that a fragment with a broken link warns every time it's rendered."""
+    plugin, page, config, files = make_plugin(tmp_path)
+    md_inst = plugin._get_fragment_markdown(page, config, files)
+
+    with caplog.at_level(logging.WARNING, logger="mkdocs"):
+        for _ in range(2):
+            plugin._convert_fragments(["See [missing](missing.md)"], page, config, files, md_inst)
+
+    assert caplog.text.count("missing.md") == 2
+
+
+def test_fragment_memo_can_be_disabled(tmp_path: Path) -> None:
+    """Test that a zero memo size disables memoization."""
+    plugin, page, config, files = make_plugin(tmp_path)
+    plugin.config = {"cache": False, "fragment_memo_size": 0}
+    md_inst = plugin._get_fragment_markdown(page, config, files)
+
+    plugin._convert_fragments(["*Answer*"], page, config, files, md_inst)
+    assert plugin._fragment_memo is None
@@ -0,0 +1,164 @@
+"""Tests for the start-up time and imports of the command-line interface and the plugin."""
+
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+import pytest
+from click.testing import CliRunner
+
+# Import time budget of a CLI command, in milliseconds. The CLI takes about 100 ms
+# to import on a laptop, a quarter of the time it took with every command loaded.
+# The budget leaves room for slow and busy CI machines.
+CLI_IMPORT_BUDGET_MS = 500
+
+# Import time budget of the plugin module once MkDocs is loaded, in milliseconds.
+# It takes about 15 ms; reading the assets and loading every feature took about 27 ms.
+PLUGIN_IMPORT_BUDGET_MS = 100
+
+# Runs whose median import time is compared with the budgets
+IMPORT_TIMING_RUNS = 5
+
+# Code timed against the budgets
+CLI_IMPORT_CODE = (
+    "import sys; sys.argv = ['quiz', '--version']; from mkdocs_quiz.cli import main; main()"
+)
+PLUGIN_IMPORT_CODE = (
+    "import mkdocs.config.defaults, mkdocs.plugins; "
+    "import mkdocs_quiz.plugin as plugin; "
+    "assert plugin._read_assets.cache_info().currsize == 0"
+)
+
+# Modules that commands which don't need them must not import
+CLI_HEAVY_MODULES = (
+    "markdown",
+    "mkdocs",
+    "mkdocs_quiz.cli.fetcher",
+    "mkdocs_quiz.cli.runner",
+    "mkdocs_quiz.plugin",
+    "mkdocs_quiz.qti",
+    "polib",
+    "questionary",
+    "requests",
+    "rich.markdown",
+)
+
+# Modules of optional plugin features, imported when a build uses them
+PLUGIN_HEAVY_MODULES = (
+    "concurrent.futures.process",
+    "mkdocs_quiz.manifest",
+    "mkdocs_quiz.minify",
+    "mkdocs_quiz.parallel",
+    "mkdocs_quiz.qti",
+    "multiprocessing",
+    "polib",
+)
+
+
+def import_times(code: str, tmp_path: Path) -> dict[str, int]:
+    """Run Python code with `-X importtime` and return the import time of each module.
+
+    The first run in `tmp_path` compiles the modules the code imports, so that
+    imports are timed from bytecode, like installed packages.
+
+    Args:
+        code: The code to run.
+        tmp_path: Directory used as home, data and bytecode cache directory.
+
+    Returns:
+        Cumulative import time in microseconds, by module name, in import order.
+        Only modules imported directly by the code are timed, nested imports are
+        included in them and listed with a time of 0.
+    """
+    pycache = tmp_path / "pycache"
+    env = {
+        **os.environ,
+        "HOME": str(tmp_path),
+        "XDG_DATA_HOME": str(tmp_path),
+        "PYTHONPYCACHEPREFIX": str(pycache),
+    }
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    if not pycache.exists():
+        subprocess.run([sys.executable, "-c", code], capture_output=True, check=True, env=env)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    times = {}
+    started = False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self_us, cumulative, name = line.removeprefix("import time:").split("|")
+        module = name.strip()
+        # Skip the modules imported at interpreter start-up
+        started = started or module.startswith("mkdocs_quiz")
+        if started and cumulative.strip().isdigit():
+            top_level = not name[1:].startswith(" ")
+            times[module] = int(cumulative) if top_level else 0
+    return times
+
+
+def median_import_ms(code: str, tmp_path: Path) -> float:
+    """Return the median total import time of the code over several runs, in milliseconds."""
+    totals = [sum(import_times(code, tmp_path).values()) for _ in range(IMPORT_TIMING_RUNS)]
+    return statistics.median(totals) / 1000
+
+
+def heavy_modules(modules: list[str], heavy: tuple[str, ...]) -> list[str]:
+    """Return the imported modules that are, or are part of, one of the heavy modules."""
+    return [
+        module
+        for module in modules
+        if any(module == name or module.startswith(name + ".") for name in heavy)
+    ]
+
+
+@pytest.mark.parametrize(
+    "args",
+    [["--version"], ["history", "--json"], ["lint", "--no-cache", str(Path(__file__).parent)]],
+)
+def test_cli_commands_import_only_what_they_need(tmp_path: Path, args: list[str]) -> None:
+    """Test that quick commands don't load the plugin, the quiz runner or other commands."""
+    code = f"import sys; sys.argv = ['quiz', *{args!r}]; from mkdocs_quiz.cli import main; main()"
+    modules = list(import_times(code, tmp_path))
+    assert "mkdocs_quiz.cli.main" in modules
+    assert heavy_modules(modules, CLI_HEAVY_MODULES) == []
+
+
+def test_lazy_commands_are_loaded_when_used() -> None:
+    """Test that commands defined in their own modules are listed and can be run."""
+    from mkdocs_quiz.cli.main import cli
+
+    result = CliRunner().invoke(cli, ["export", "--help"])
+    assert result.exit_code == 0
+    assert "qti" in result.output
+    commands = cli.list_commands(click.Context(cli))
+    assert commands == ["export", "history", "lint", "migrate", "run", "translations"]
+
+
+def test_plugin_import_defers_assets_and_optional_features(tmp_path: Path) -> None:
+    """Test that importing the plugin reads no assets and loads no optional features."""
+    modules = list(import_times(PLUGIN_IMPORT_CODE, tmp_path))
+    assert "mkdocs_quiz.plugin" in modules
+    assert heavy_modules(modules, PLUGIN_HEAVY_MODULES) == []
+
+
+def test_cli_import_time_within_budget(tmp_path: Path) -> None:
+    """Test that the CLI starts quickly, as a guard against import-time regressions."""
+    total_ms = median_import_ms(CLI_IMPORT_CODE, tmp_path)
+    assert total_ms < CLI_IMPORT_BUDGET_MS, f"CLI imports took {total_ms:.0f} ms"
+
+
+def test_plugin_import_time_within_budget(tmp_path: Path) -> None:
+    """Test that the plugin module imports quickly once MkDocs is loaded."""
+    total_ms = median_import_ms(PLUGIN_IMPORT_CODE, tmp_path)
+    assert total_ms < PLUGIN_IMPORT_BUDGET_MS, f"Plugin imports took {total_ms:.0f} ms"
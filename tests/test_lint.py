@@ -0,0 +1,226 @@
+"""Tests for checking quizzes without building the site."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+from mkdocs.structure.pages import Page
+
+from mkdocs_quiz import lint as lint_module
+from mkdocs_quiz.cli.lint import lint
+from mkdocs_quiz.lint import LintIssue, lint_files, lint_markdown
+from mkdocs_quiz.plugin import MkDocsQuizPlugin
+
+from .conftest import make_site
+
+VALID = "<quiz>\nQuestion?\n- [x] Yes\n- [ ] No\n</quiz>\n"
+
+INVALID_QUIZZES = {
+    "checkbox": "<quiz>\nQuestion?\n- [y] Yes\n- [ ] No\n</quiz>\n",
+    "no_correct": "<quiz>\nQuestion?\n- [ ] Yes\n- [ ] No\n</quiz>\n",
+    "no_question": "<quiz>\n- [x] Yes\n</quiz>\n",
+    "no_answers": "<quiz>\nQuestion?\n</quiz>\n",
+    "orphaned_feedback": "<quiz>\nQuestion?\n- [x] Yes\n\n> Right!\n- [ ] No\n</quiz>\n",
+}
+
+
+def test_lint_reports_every_issue_with_line() -> None:
+    """Test that all invalid quizzes of a page are reported, not just the first."""
+    markdown = (
+        "---\ntitle: Page\n---\n\n"
+        + VALID
+        + "\n```markdown\n"
+        + INVALID_QUIZZES["checkbox"]
+        + "```\n\n"
+        + INVALID_QUIZZES["no_correct"]
+        + "\n"
+        + "<quiz>\nQuestion?\n- [x] Yes\n\n> Separated\n</quiz>\n"
+        + "\n<?quiz?>\nquestion: Old\n<?/quiz?>\n"
+    )
+
+    assert lint_markdown(markdown) == [
+        LintIssue(19, "Quiz #2: Quiz must have at least one correct answer"),
+        LintIssue(
+            25,
+            "Quiz #3: Blockquote after last answer 'Yes' is separated by a blank line. "
+            "It will be treated as content, not per-answer feedback. "
+            "Remove the blank line if you intended it as feedback.",
+            error=False,
+        ),
+        LintIssue(32, "Old mkdocs-quiz syntax, run 'mkdocs-quiz migrate' to update it"),
+    ]
+    assert lint_markdown(VALID) == []
+    assert lint_markdown("# No quizzes\n") == []
+
+
+@pytest.mark.parametrize("name", sorted(INVALID_QUIZZES))
+def test_lint_errors_match_build_errors(tmp_path: Path, name: str) -> None:
+    """Test that lint fails on the quizzes a build fails on, with the same message."""
+    markdown = INVALID_QUIZZES[name]
+    config, files = make_site(tmp_path, {"index.md": markdown})
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {"cache": False}
+    plugin.on_config(config)
+    page = Page(None, files.documentation_pages()[0], config)
+    page.read_source(config)
+    result = plugin.on_page_markdown(page.markdown or "", page, config)
+    with pytest.raises(ValueError) as build_error:
+        plugin.on_page_content(result, page=page, config=config, files=files)
+
+    [issue] = lint_markdown(markdown)
+    assert issue.error
+    assert issue.message.removeprefix("Quiz #1: ") in str(build_error.value)
+
+
+@pytest.mark.parametrize(
+    ("front_matter", "enabled_by_default", "checked"),
+    [
+        ("", True, True),
+        ("", False, False),
+        ("---\ntitle: Page\n---\n", False, False),
+        ("---\nquiz:\n  enabled: false\n---\n", True, False),
+        ("---\nquiz:\n  enabled: true\n---\n", False, True),
+        ("---\nquiz:\n  language: fr\n---\n", False, False),
+        ("---\nquiz: [invalid\n---\n", True, True),
+    ],
+)
+def test_lint_skips_pages_with_quizzes_disabled(
+    tmp_path: Path, front_matter: str, enabled_by_default: bool, checked: bool
+) -> None:
+    """Test that lint skips the pages a build doesn't process quizzes on."""
+    markdown = front_matter + INVALID_QUIZZES["no_correct"]
+    assert bool(lint_markdown(markdown, enabled_by_default)) == checked
+
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {"cache": False, "enabled_by_default": enabled_by_default}
+    config, files = make_site(tmp_path, {"index.md": markdown})
+    page = Page(None, files.documentation_pages()[0], config)
+    page.read_source(config)
+    assert plugin._should_process_page(page) == checked
+
+
+def test_lint_results_cached_by_mtime(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that unchanged files are not checked again, and changed ones are."""
+    good, bad = tmp_path / "good.md", tmp_path / "bad.md"
+    good.write_text(VALID, encoding="utf-8")
+    bad.write_text(INVALID_QUIZZES["no_correct"], encoding="utf-8")
+    cache_file = tmp_path / "cache" / "lint.json"
+    checked: list[Path] = []
+    original = lint_module.lint_file
+
+    def counting_lint_file(path: Path, enabled_by_default: bool = True) -> list[LintIssue]:
+        checked.append(path)
+        return original(path, enabled_by_default)
+
+    monkeypatch.setattr(lint_module, "lint_file", counting_lint_file)
+
+    first = lint_files([bad, good], cache_file)
+    assert list(first) == [bad]
+    assert sorted(checked) == [bad, good]
+
+    checked.clear()
+    assert lint_files([bad, good], cache_file) == first
+    assert checked == []
+
+    bad.write_text(VALID + "\n", encoding="utf-8")
+    assert lint_files([bad, good], cache_file) == {}
+    assert checked == [bad]
+
+    # Results of another version are discarded
+    data = json.loads(cache_file.read_text(encoding="utf-8"))
+    cache_file.write_text(json.dumps({**data, "version": "0.0.0"}), encoding="utf-8")
+    checked.clear()
+    lint_files([bad, good], cache_file)
+    assert sorted(checked) == [bad, good]
+
+    # And so are results checked with other settings
+    checked.clear()
+    lint_files([bad, good], cache_file, enabled_by_default=False)
+    assert sorted(checked) == [bad, good]
+
+
+def test_lint_files_in_worker_processes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that checking files in worker processes gives the same results."""
+    files = []
+    for i in range(6):
+        path = tmp_path / f"page{i}.md"
+        path.write_text(VALID + INVALID_QUIZZES["no_correct"] * (i % 2), encoding="utf-8")
+        files.append(path)
+    serial = lint_files(files)
+
+    monkeypatch.setattr(lint_module, "_FILES_PER_WORKER", 2)
+    monkeypatch.setattr(lint_module.os, "cpu_count", lambda: 3)
+    assert lint_files(files) == serial
+    assert list(serial) == files[1::2]
+
+
+def test_lint_command(tmp_path: Path) -> None:
+    """Test the exit status and report of the lint command."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "good.md").write_text(VALID, encoding="utf-8")
+    warning = docs / "warning.md"
+    warning.write_text("<quiz>\nQuestion?\n- [x] Yes\n\n> Separated\n</quiz>\n")
+    runner = CliRunner()
+
+    result = runner.invoke(lint, [str(docs), "--no-cache"])
+    assert result.exit_code == 0, result.output
+    assert f"{warning}:1: warning: Quiz #1: Blockquote after last answer" in result.output
+    assert "2 file(s) checked, 0 error(s), 1 warning(s)" in result.output
+
+    result = runner.invoke(lint, [str(docs), "--no-cache", "--strict"])
+    assert result.exit_code == 1
+
+    bad = docs / "sub" / "bad.md"
+    bad.parent.mkdir()
+    bad.write_text("Intro\n\n" + INVALID_QUIZZES["checkbox"], encoding="utf-8")
+    cache_file = tmp_path / "lint.json"
+    result = runner.invoke(lint, [str(docs), "--cache-file", str(cache_file)])
+    assert result.exit_code == 1
+    assert f"{bad}:3: error: Quiz #1: Invalid checkbox format: '[y]'" in result.output
+    assert cache_file.exists()
+
+
+def test_lint_command_reads_mkdocs_yml(tmp_path: Path) -> None:
+    """Test that lint checks the configured docs_dir, with the plugin's enabled_by_default."""
+    docs = tmp_path / "content"
+    docs.mkdir()
+    bad = docs / "bad.md"
+    bad.write_text(INVALID_QUIZZES["no_correct"], encoding="utf-8")
+    (docs / "disabled.md").write_text(
+        "---\nquiz:\n  enabled: false\n---\n" + INVALID_QUIZZES["checkbox"], encoding="utf-8"
+    )
+    config_file = tmp_path / "mkdocs.yml"
+    config_file.write_text(
+        "site_name: Test\n"
+        "docs_dir: content\n"
+        "markdown_extensions:\n"
+        "  - pymdownx.emoji:\n"
+        "      emoji_index: !!python/name:material.extensions.emoji.twemoji\n"
+        "plugins:\n"
+        "  - search\n"
+        "  - mkdocs_quiz\n",
+        encoding="utf-8",
+    )
+    runner = CliRunner()
+
+    result = runner.invoke(lint, ["-f", str(config_file), "--no-cache"])
+    assert result.exit_code == 1, result.output
+    assert f"{bad}:1: error: Quiz #1: Quiz must have at least one correct answer" in result.output
+    assert "2 file(s) checked, 1 error(s), 0 warning(s)" in result.output
+
+    config_file.write_text(
+        "docs_dir: content\nplugins:\n  - mkdocs_quiz:\n      enabled_by_default: false\n",
+        encoding="utf-8",
+    )
+    result = runner.invoke(lint, ["-f", str(config_file), "--no-cache"])
+    assert result.exit_code == 0, result.output
+    assert "2 file(s) checked, 0 error(s), 0 warning(s)" in result.output
+
+    # The default docs directory next to a missing config file
+    result = runner.invoke(lint, ["-f", str(tmp_path / "missing.yml"), "--no-cache"])
+    assert result.exit_code == 1
+    assert "not a directory" in result.output
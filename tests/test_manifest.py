@@ -0,0 +1,235 @@
+"""Tests for the site-wide quiz manifest."""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from jinja2 import Environment
+from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.structure.files import Files
+from mkdocs.structure.pages import Page
+
+from mkdocs_quiz.cli.fetcher import fetch_quizzes
+from mkdocs_quiz.manifest import MANIFEST_VERSION, read_manifest_quizzes
+from mkdocs_quiz.plugin import MkDocsQuizPlugin
+
+from .conftest import make_site
+
+PAGES = {
+    "index.md": """# Home
+
+<quiz>
+What is 2+2?
+- [x] 4
+  > Correct!
+- [ ] 5
+
+See [the guide](guide/page.md).
+</quiz>
+""",
+    "guide/page.md": """---
+title: Guide
+---
+
+```markdown
+<quiz>
+Not a quiz
+- [x] Example
+</quiz>
+```
+
+<quiz>
+The capital of France is [[Paris]].
+</quiz>
+
+<quiz>
+Pick the even numbers
+- [x] 2
+- [ ] 3
+- [x] 4
+</quiz>
+""",
+    "no-quiz.md": "# Nothing here\n",
+}
+
+
+def build_site(tmp_path: Path, **options: object) -> Path:
+    """Run the plugin hooks for every page like `mkdocs build` and return the site dir."""
+    config, files = make_site(tmp_path, PAGES)
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {"cache": False, "manifest": True, **options}
+    run_hooks(plugin, config, files)
+    return Path(config.site_dir)
+
+
+def run_hooks(plugin: MkDocsQuizPlugin, config: MkDocsConfig, files: Files) -> None:
+    """Run the plugin's build hooks over every documentation page."""
+    plugin.on_config(config)
+    plugin.on_files(files, config=config)
+    plugin.on_env(Environment(), config=config, files=files)
+    for file in files.documentation_pages():
+        page = Page(None, file, config)
+        page.read_source(config)
+        markdown = plugin.on_page_markdown(page.markdown or "", page, config)
+        plugin.on_page_content(markdown, page=page, config=config, files=files)
+    plugin.on_post_build(config)
+
+
+def read_json(path: Path) -> Any:
+    """Read a JSON file."""
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_manifest_describes_every_quiz(tmp_path: Path) -> None:
+    """Test that the manifest holds the page, anchor, type, answers and source line of quizzes."""
+    site_dir = build_site(tmp_path)
+    manifest = read_json(site_dir / "quizzes.json")
+
+    assert manifest["version"] == MANIFEST_VERSION
+    assert manifest["generator"].startswith("mkdocs-quiz ")
+    ids = [quiz.pop("id") for quiz in manifest["quizzes"]]
+    assert all(re.fullmatch(r"[0-9a-f]{12}", quiz_id) for quiz_id in ids)
+    assert len(set(ids)) == 3
+    assert manifest["quizzes"] == [
+        {
+            "page": "",
+            "anchor": "quiz-0",
+            "src": "index.md",
+            "line": 3,
+            "type": "single",
+            "question": "What is 2+2?",
+            "answers": [
+                {"text": "4", "correct": True, "feedback": "Correct!"},
+                {"text": "5", "correct": False},
+            ],
+            "content": "See [the guide](guide/page.md).",
+        },
+        {
+            "page": "guide/page/",
+            "anchor": "quiz-0",
+            "src": "guide/page.md",
+            "line": 12,
+            "type": "fill-blank",
+            "question": "The capital of France is {{BLANK_0}}.",
+            "blanks": ["Paris"],
+        },
+        {
+            "page": "guide/page/",
+            "anchor": "quiz-1",
+            "src": "guide/page.md",
+            "line": 16,
+            "type": "multiple",
+            "question": "Pick the even numbers",
+            "answers": [
+                {"text": "2", "correct": True},
+                {"text": "3", "correct": False},
+                {"text": "4", "correct": True},
+            ],
+        },
+    ]
+    assert not (site_dir / "quizzes").exists()
+
+
+def test_manifest_can_be_split_by_page(tmp_path: Path) -> None:
+    """Test that a split manifest indexes per-page files holding each page's quizzes."""
+    site_dir = build_site(tmp_path, manifest_split=True)
+    index = read_json(site_dir / "quizzes.json")
+
+    assert "quizzes" not in index
+    assert index["pages"] == [
+        {"page": "", "src": "index.md", "quizzes": 1, "manifest": "quizzes/index.json"},
+        {
+            "page": "guide/page/",
+            "src": "guide/page.md",
+            "quizzes": 2,
+            "manifest": "quizzes/guide/page.json",
+        },
+    ]
+    page_manifest = read_json(site_dir / "quizzes" / "guide" / "page.json")
+    assert page_manifest["version"] == MANIFEST_VERSION
+    assert [quiz["anchor"] for quiz in page_manifest["quizzes"]] == ["quiz-0", "quiz-1"]
+
+
+def test_manifest_ids_are_stable(tmp_path: Path) -> None:
+    """Test that quiz ids don't change when quizzes are added above, unlike anchors."""
+    before = read_json(build_site(tmp_path / "before") / "quizzes.json")["quizzes"]
+
+    page = PAGES["guide/page.md"]
+    new_quiz = "<quiz>\nNew question?\n- [x] Yes\n- [ ] No\n</quiz>\n\n"
+    page = page.replace("<quiz>\nThe capital", new_quiz + "<quiz>\nThe capital")
+    with patch.dict(PAGES, {"guide/page.md": page}):
+        after = read_json(build_site(tmp_path / "after") / "quizzes.json")["quizzes"]
+
+    assert [quiz["anchor"] for quiz in before] == ["quiz-0", "quiz-0", "quiz-1"]
+    assert [quiz["anchor"] for quiz in after] == ["quiz-0", "quiz-0", "quiz-1", "quiz-2"]
+    assert [after[0]["id"], *(quiz["id"] for quiz in after[2:])] == [quiz["id"] for quiz in before]
+
+
+def test_manifest_ids_of_identical_quizzes(tmp_path: Path) -> None:
+    """Test that identical quizzes on a page get distinct ids, and those on other pages too."""
+    quiz = "<quiz>\nSame?\n- [x] Yes\n</quiz>\n\n"
+    with patch.dict(PAGES, {"index.md": quiz * 2, "guide/page.md": quiz}, clear=True):
+        quizzes = read_json(build_site(tmp_path) / "quizzes.json")["quizzes"]
+
+    first, second, other = (quiz["id"] for quiz in quizzes)
+    assert second == f"{first}-2"
+    assert other != first
+
+
+def test_manifest_is_off_by_default(tmp_path: Path) -> None:
+    """Test that no manifest is written unless enabled."""
+    site_dir = build_site(tmp_path, manifest=False)
+    assert not (site_dir / "quizzes.json").exists()
+
+
+@pytest.mark.parametrize("split", [False, True])
+def test_fetch_quizzes_from_local_manifest(tmp_path: Path, split: bool) -> None:
+    """Test that the CLI loads all quizzes of a site from a manifest on disk."""
+    site_dir = build_site(tmp_path, manifest_split=split)
+    quizzes = fetch_quizzes(str(site_dir / "quizzes.json"))
+
+    assert [quiz.identifier for quiz in quizzes] == [
+        "#quiz-0",
+        "guide/page/#quiz-0",
+        "guide/page/#quiz-1",
+    ]
+    assert quizzes[0].answers[0].feedback == "Correct!"
+    assert (str(quizzes[0].source_file), quizzes[0].source_line) == ("index.md", 3)
+    assert quizzes[1].is_fill_in_blank
+    assert quizzes[1].blanks[0].correct_answer == "Paris"
+    assert quizzes[2].is_multiple_choice
+
+
+def test_fetch_quizzes_from_manifest_url(tmp_path: Path) -> None:
+    """Test that a manifest URL and its per-page manifests are fetched instead of pages."""
+    site_dir = build_site(tmp_path, manifest_split=True)
+    requested = []
+
+    def get(url: str, timeout: int) -> MagicMock:
+        requested.append(url)
+        response = MagicMock()
+        response.json.return_value = read_json(site_dir / url.removeprefix("https://example.com/"))
+        return response
+
+    with patch("mkdocs_quiz.cli.fetcher.requests.get", side_effect=get):
+        quizzes = fetch_quizzes("https://example.com/quizzes.json")
+
+    assert len(quizzes) == 3
+    assert requested == [
+        "https://example.com/quizzes.json",
+        "https://example.com/quizzes/index.json",
+        "https://example.com/quizzes/guide/page.json",
+    ]
+
+
+def test_newer_manifest_versions_are_rejected() -> None:
+    """Test that manifests from a newer, incompatible format are reported."""
+    with pytest.raises(ValueError, match="Unsupported quiz manifest version"):
+        read_manifest_quizzes({"version": MANIFEST_VERSION + 1, "quizzes": []}, lambda path: {})
+    with pytest.raises(ValueError, match="Not a mkdocs-quiz manifest"):
+        read_manifest_quizzes([], lambda path: {})
@@ -0,0 +1,97 @@
+"""Tests for the minified quiz assets."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+from mkdocs.structure.pages import Page
+
+from mkdocs_quiz.minify import js_tokens, minify_css, minify_js
+from mkdocs_quiz.plugin import MkDocsQuizPlugin, js_content, style_content
+
+from .conftest import make_site
+
+
+def significant_tokens(source: str) -> list[tuple[str, str]]:
+    """Return the tokens of a script other than whitespace and comments."""
+    return [token for token in js_tokens(source) if token[0] not in ("space", "comment")]
+
+
+def test_minify_css() -> None:
+    """Test that comments and whitespace go, but not where they change the meaning."""
+    source = """
+    /* Quiz */
+    .quiz > .answer :hover {
+      color : red ;
+      content: "  /* kept */  ";
+    }
+    @media screen and (min-width: 60em) { .quiz { margin: 1rem 0; } }
+    """
+    assert minify_css(source) == (
+        '.quiz>.answer :hover{color :red;content:"  /* kept */  "}'
+        "@media screen and (min-width:60em){.quiz{margin:1rem 0}}"
+    )
+    assert len(minify_css(style_content)) < len(style_content) * 0.8
+
+
+@pytest.mark.parametrize(
+    ("source", "expected"),
+    [
+        ("const a = 1 ; // one\nlet b = a", "const a=1;let b=a"),
+        ("return\nx", "return\nx"),
+        ("a\n++b", "a\n++b"),
+        ("if (a) {\n  b()\n}\n", "if(a){b()}"),
+        ("x = a + +b - -c / /re/g.source", "x=a+ +b- -c/ /re/g.source"),
+        (
+            "s = `  ${ {a: '}'}.a }  ` /* c */ + 1 .toString()",
+            "s=`  ${ {a: '}'}.a }  `+1 .toString()",
+        ),
+        ("t = '  //  '.replace(/[/]\\//, \"/*\")", "t='  //  '.replace(/[/]\\//,\"/*\")"),
+    ],
+)
+def test_minify_js(source: str, expected: str) -> None:
+    """Test that only whitespace and comments the code doesn't depend on are removed."""
+    assert minify_js(source) == expected
+
+
+def test_minified_quiz_js_keeps_every_token() -> None:
+    """Test that minifying quiz.js changes nothing but whitespace and comments."""
+    minified = minify_js(js_content)
+    assert len(minified) < len(js_content) * 0.7
+    assert significant_tokens(minified) == significant_tokens(js_content)
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="Node.js is not installed")
+def test_minified_quiz_js_is_valid(tmp_path: Path) -> None:
+    """Test that Node.js can parse the minified quiz.js."""
+    script = tmp_path / "quiz.min.js"
+    script.write_text(minify_js(js_content), encoding="utf-8")
+    subprocess.run(["node", "--check", str(script)], check=True, capture_output=True)
+
+
+@pytest.mark.parametrize("minify", [True, False, None])
+def test_pages_embed_minified_assets(tmp_path: Path, minify: bool | None) -> None:
+    """Test that pages embed minified assets only when `minify_assets` is enabled."""
+    config, files = make_site(tmp_path, {"index.md": "<quiz>\nQuestion?\n- [x] Yes\n</quiz>\n"})
+    plugin = MkDocsQuizPlugin()
+    if minify is None:
+        # Readable files by default
+        plugin.load_config({})
+        plugin.config["cache"] = False
+        minify = False
+    else:
+        plugin.config = {"cache": False, "minify_assets": minify}
+    plugin.on_config(config)
+    page = Page(None, files.documentation_pages()[0], config)
+    page.read_source(config)
+    markdown = plugin.on_page_markdown(page.markdown or "", page, config)
+    html = plugin.on_page_content(markdown, page=page, config=config, files=files)
+    assert html is not None
+
+    assert (minify_css(style_content) in html) == minify
+    assert (minify_js(js_content) in html) == minify
+    assert (style_content in html) != minify
+    assert (js_content in html) != minify
@@ -0,0 +1,127 @@
+"""Tests for parallel quiz pre-rendering."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from jinja2 import Environment
+from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.structure.files import Files
+from mkdocs.structure.pages import Page
+
+from mkdocs_quiz import parallel
+from mkdocs_quiz.plugin import MkDocsQuizPlugin
+
+from .conftest import make_site
+
+PAGES = {
+    "index.md": """
+# Home
+
+<quiz>
+What is 2+2?
+- [x] 4
+- [ ] 5
+
+See [the guide](guide/page.md).
+</quiz>
+""",
+    "guide/page.md": """---
+quiz:
+  show_correct: false
+---
+
+<quiz>
+The capital of France is [[Paris]].
+</quiz>
+
+<quiz>
+Pick the even numbers
+- [x] 2
+- [ ] 3
+- [x] 4
+</quiz>
+""",
+}
+
+
+def build_site(plugin: MkDocsQuizPlugin, config: MkDocsConfig, files: Files) -> dict[str, str]:
+    """Run the plugin hooks for every page like `mkdocs build` and return the page HTML."""
+    plugin.on_config(config)
+    plugin.on_env(Environment(), config=config, files=files)
+    output = {}
+    for file in files.documentation_pages():
+        page = Page(None, file, config)
+        page.read_source(config)
+        markdown = plugin.on_page_markdown(page.markdown or "", page, config)
+        html = plugin.on_page_content(markdown, page=page, config=config, files=files)
+        assert html is not None
+        output[file.src_uri] = html
+    plugin.on_post_build(config)
+    return output
+
+
+def make_plugin(**options: object) -> MkDocsQuizPlugin:
+    """Create a plugin without the persistent quiz cache."""
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {"cache": False, **options}
+    return plugin
+
+
+@pytest.mark.skipif(
+    parallel.parallel_unavailable_reason() is not None, reason="requires fork-based workers"
+)
+def test_parallel_output_matches_serial(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that pre-rendered quizzes are used and identical to serial rendering."""
+    config, files = make_site(tmp_path, PAGES)
+    serial = build_site(make_plugin(), config, files)
+
+    plugin = make_plugin(parallel=True, parallel_workers=2)
+    calls: list[int] = []
+    original = plugin._process_quiz
+
+    def counting_process_quiz(*args: object, **kwargs: object) -> str:
+        calls.append(1)
+        return original(*args, **kwargs)  # type: ignore[arg-type]
+
+    # Only the main process sees this patch: workers are forked before pages are built
+    def on_env_then_patch(*args: object, **kwargs: object) -> None:
+        MkDocsQuizPlugin.on_env(plugin, *args, **kwargs)  # type: ignore[arg-type]
+        monkeypatch.setattr(plugin, "_process_quiz", counting_process_quiz)
+
+    monkeypatch.setattr(plugin, "on_env", on_env_then_patch)
+    assert build_site(plugin, config, files) == serial
+    assert calls == []
+
+
+@pytest.mark.skipif(
+    parallel.parallel_unavailable_reason() is not None, reason="requires fork-based workers"
+)
+def test_parallel_errors_match_serial(tmp_path: Path) -> None:
+    """Test that invalid quizzes are reported by the main process with page context."""
+    pages = {**PAGES, "broken.md": "Intro\n\n<quiz>\n- [x] No question\n</quiz>\n"}
+    config, files = make_site(tmp_path, pages)
+
+    with pytest.raises(ValueError) as serial_error:
+        build_site(make_plugin(), config, files)
+    with pytest.raises(ValueError) as parallel_error:
+        build_site(make_plugin(parallel=True, parallel_workers=2), config, files)
+
+    assert "in broken.md (line 3)" in str(serial_error.value)
+    assert str(parallel_error.value) == str(serial_error.value)
+
+
+def test_parallel_falls_back_without_fork(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that quizzes are rendered serially when workers can't be forked."""
+    monkeypatch.setattr(parallel.multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+    config, files = make_site(tmp_path, PAGES)
+
+    plugin = make_plugin(parallel=True)
+    with caplog.at_level("INFO", logger="mkdocs.plugins.mkdocs_quiz"):
+        output = build_site(plugin, config, files)
+
+    assert "Rendering quizzes serially" in caplog.text
+    assert output == build_site(make_plugin(), config, files)
@@ -0,0 +1,93 @@
+"""Tests for the shared markdown scanner in parsing.py."""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+import pytest
+
+from mkdocs_quiz import parsing
+from mkdocs_quiz.parsing import (
+    find_quizzes,
+    mask_code_blocks,
+    scan_markdown,
+    unmask_code_blocks,
+)
+
+QUIZ = "<quiz>\nQuestion?\n- [x] Yes\n</quiz>"
+
+
+def test_scan_finds_quizzes_and_fences_in_order() -> None:
+    """Test that quizzes and code blocks outside quizzes are reported with their offsets."""
+    fence = "```python\nprint(1)\n```"
+    markdown = f"Intro\n\n{QUIZ}\n\n{fence}\n\n~~~\nmore\n~~~\n\n{QUIZ}\n"
+    scan = scan_markdown(markdown)
+
+    assert [m.group(0) for m in scan.quizzes] == [QUIZ, QUIZ]
+    assert [markdown[start:end] for start, end in scan.fences] == [fence, "~~~\nmore\n~~~"]
+    assert scan.old_syntax == []
+
+
+def test_scan_ignores_quiz_tags_in_code_blocks() -> None:
+    """Test that example quizzes, and unclosed quiz tags, inside code blocks are skipped."""
+    markdown = f"```markdown\n{QUIZ}\n```\n\n```html\n<quiz> opening tag only\n```\n\n{QUIZ}\n"
+    quizzes = find_quizzes(markdown)
+
+    assert len(quizzes) == 1
+    assert quizzes[0].start() == markdown.rindex("<quiz>")
+
+
+def test_scan_keeps_code_blocks_inside_quizzes() -> None:
+    """Test that code blocks in a quiz's content are part of the quiz, not masked."""
+    quiz = "<quiz>\nWhat does this print?\n- [x] 1\n\n```python\nprint(1)\n```\n</quiz>"
+    scan = scan_markdown(f"{quiz}\n")
+
+    assert [m.group(0) for m in scan.quizzes] == [quiz]
+    assert scan.fences == []
+
+
+def test_scan_reports_old_syntax_outside_code_blocks() -> None:
+    """Test that v0.x tags are found in text and quizzes but not in code examples."""
+    assert scan_markdown("```\n<?quiz?>\n```\n").old_syntax == []
+    assert scan_markdown("Text\n<?quiz?>\nquestion\n<?/quiz?>\n").old_syntax == [5, 23]
+    assert scan_markdown(f"{QUIZ[:-7]}<?/quiz?>\n</quiz>").old_syntax == [len(QUIZ) - 7]
+
+
+def test_scan_unclosed_blocks() -> None:
+    """Test that unclosed fences and quiz tags are not treated as blocks."""
+    scan = scan_markdown(f"```\nnever closed\n\n{QUIZ}\n<quiz>\nno end")
+
+    assert scan.fences == []
+    assert [m.group(0) for m in scan.quizzes] == [QUIZ]
+
+
+def test_scan_many_unclosed_quiz_tags_is_linear(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the closing tag is searched for once, not again for every later opening tag."""
+    searches: list[int] = []
+    pattern = parsing._QUIZ_PATTERN
+
+    class CountingPattern:
+        def match(self, string: str, pos: int) -> re.Match[str] | None:
+            searches.append(pos)
+            return pattern.match(string, pos)
+
+        def __getattr__(self, name: str) -> Any:
+            return getattr(pattern, name)
+
+    monkeypatch.setattr(parsing, "_QUIZ_PATTERN", CountingPattern())
+    markdown = f"{QUIZ}\n" + "<quiz>\nNo end\n\n<?quiz?>\n" * 1000
+    scan = scan_markdown(markdown)
+
+    assert [m.group(0) for m in scan.quizzes] == [QUIZ]
+    assert len(scan.old_syntax) == 1000
+    assert len(searches) == 2
+
+
+def test_mask_code_blocks_roundtrip() -> None:
+    """Test that masked code blocks are restored exactly."""
+    markdown = f"```\n{QUIZ}\n```\n\n{QUIZ}\n\n  ~~~~\n  code\n  ~~~~\n"
+    masked, placeholders = mask_code_blocks(markdown)
+
+    assert masked == f"__CODEBLOCK_0__\n\n{QUIZ}\n\n__CODEBLOCK_1__\n"
+    assert unmask_code_blocks(masked, placeholders) == markdown
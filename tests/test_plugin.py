@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import gzip
+import re
+from pathlib import Path
+from typing import Any
+
 import pytest
 from mkdocs.config.defaults import MkDocsConfig
 from mkdocs.structure.files import Files
@@ -625,6 +630,48 @@ Question 1?
     assert "local storage" in html_result.lower()
 
 
+def test_no_assets_on_pages_without_quizzes(
+    plugin: MkDocsQuizPlugin, mock_page: Page, mock_config: MkDocsConfig, mock_files: Files
+) -> None:
+    """Test that pages without quizzes or quiz markers are left untouched."""
+    from unittest.mock import MagicMock
+
+    mock_theme = MagicMock(spec=dict)
+    mock_theme.name = "material"
+    mock_config["theme"] = mock_theme
+    markdown = """
+# Plain page
+
+```markdown
+<quiz>
+Not a real quiz
+- [x] Yes
+</quiz>
+```
+"""
+    result = plugin.on_page_markdown(markdown, mock_page, mock_config)
+    html = "<h1>Plain page</h1>"
+    assert (
+        plugin.on_page_content(html, page=mock_page, config=mock_config, files=mock_files) == html
+    )
+    assert mock_page.file.src_path not in plugin._quiz_storage
+    assert mock_page.file.src_path not in plugin._has_results_div
+    assert result is not None
+
+
+def test_assets_on_pages_with_only_results_div(
+    plugin: MkDocsQuizPlugin, mock_page: Page, mock_config: MkDocsConfig, mock_files: Files
+) -> None:
+    """Test that a results div without quizzes on the page still gets the quiz assets."""
+    result = plugin.on_page_markdown("<!-- mkdocs-quiz results -->", mock_page, mock_config)
+    html_result = plugin.on_page_content(
+        result, page=mock_page, config=mock_config, files=mock_files
+    )
+    assert html_result is not None
+    assert 'id="quiz-results"' in html_result
+    assert "window.mkdocsQuizTranslations" in html_result
+
+
 def test_confetti_config_injection(
     plugin: MkDocsQuizPlugin, mock_page: Page, mock_config: MkDocsConfig, mock_files: Files
 ) -> None:
@@ -673,6 +720,113 @@ Question?
     # when confetti config is false
 
 
+def test_page_options_and_language_resolved_once_per_page(
+    plugin: MkDocsQuizPlugin,
+    mock_page: Page,
+    mock_config: MkDocsConfig,
+    mock_files: Files,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that all quizzes and the results screen of a page share one render context."""
+    calls: list[str] = []
+    get_options = plugin._get_quiz_options
+    get_translations = plugin._get_translation_manager
+    monkeypatch.setattr(
+        plugin, "_get_quiz_options", lambda page: calls.append("options") or get_options(page)
+    )
+    monkeypatch.setattr(
+        plugin,
+        "_get_translation_manager",
+        lambda page, config: calls.append("translations") or get_translations(page, config),
+    )
+    markdown = "\n\n".join(["<quiz>\nQuestion?\n- [x] Yes\n- [ ] No\n</quiz>"] * 20)
+    markdown += "\n\n<!-- mkdocs-quiz results -->\n"
+
+    result = plugin.on_page_markdown(markdown, mock_page, mock_config)
+    html_result = plugin.on_page_content(
+        result, page=mock_page, config=mock_config, files=mock_files
+    )
+
+    assert html_result is not None
+    assert html_result.count('class="quiz"') == 20
+    assert calls == ["options", "translations"]
+
+
+def test_external_assets_mode(
+    plugin: MkDocsQuizPlugin, mock_config: MkDocsConfig, mock_files: Files, tmp_path: Path
+) -> None:
+    """Test that `assets: external` links hashed asset files instead of inlining them."""
+    from mkdocs.structure.files import File
+
+    from mkdocs_quiz.plugin import js_content, style_content
+
+    plugin.config["assets"] = "external"
+    mock_config["site_dir"] = str(tmp_path)
+    plugin.on_config(mock_config)
+
+    file = File(path="guide/page.md", src_dir="docs", dest_dir="site", use_directory_urls=True)
+    page = Page(None, file, mock_config)
+    page.meta = {}
+    markdown = """
+<quiz>
+Question?
+- [x] Yes
+</quiz>
+"""
+    result = plugin.on_page_markdown(markdown, page, mock_config)
+    html_result = plugin.on_page_content(result, page=page, config=mock_config, files=mock_files)
+    assert html_result is not None
+
+    # No inline CSS/JS, only references relative to the page
+    assert "<style" not in html_result
+    assert "JSConfetti" not in html_result
+    assert re.search(
+        r'<link rel="stylesheet" href="\.\./\.\./assets/mkdocs-quiz/quiz\.[0-9a-f]{10}\.css">',
+        html_result,
+    )
+    assert re.search(
+        r'src="\.\./\.\./assets/mkdocs-quiz/quiz\.[0-9a-f]{10}\.js" defer', html_result
+    )
+    assert "js-confetti.browser." in html_result
+    assert re.search(
+        r'src="\.\./\.\./assets/mkdocs-quiz/quiz-i18n\.en\.[0-9a-f]{10}\.js"', html_result
+    )
+    # Config is still inlined per page
+    assert "window.mkdocsQuizConfig" in html_result
+    assert "window.mkdocsQuizTranslations" not in html_result
+
+    plugin.on_post_build(mock_config)
+    written = {p.name: p.read_bytes() for p in (tmp_path / "assets").rglob("*.*")}
+    assert len(written) == 8
+    css_name = next(name for name in written if name.endswith(".css"))
+    # The readable files, unless `minify_assets` is enabled
+    assert written[css_name].decode("utf-8") == style_content
+    assert css_name in html_result
+    quiz_js = next(name for name in written if name.startswith("quiz.") and name.endswith(".js"))
+    assert written[quiz_js].decode("utf-8") == js_content
+    # Every asset has a precompressed copy for static hosting
+    for name, content in written.items():
+        if not name.endswith(".gz"):
+            assert gzip.decompress(written[name + ".gz"]) == content
+
+
+def test_external_assets_skip_confetti_when_disabled(
+    plugin: MkDocsQuizPlugin, mock_page: Page, mock_config: MkDocsConfig, tmp_path: Path
+) -> None:
+    """Test that the confetti library is not written or linked when confetti is off."""
+    plugin.config["assets"] = "external"
+    plugin.config["confetti"] = False
+    mock_config["site_dir"] = str(tmp_path)
+    plugin.on_config(mock_config)
+    plugin.on_post_build(mock_config)
+
+    written = sorted(p.name for p in (tmp_path / "assets").rglob("*.*"))
+    assert [name.split(".")[0] for name in written if not name.endswith(".gz")] == [
+        "quiz",
+        "quiz",
+    ]
+
+
 def test_material_theme_integration(
     plugin: MkDocsQuizPlugin, mock_page: Page, mock_config: MkDocsConfig, mock_files: Files
 ) -> None:
@@ -870,6 +1024,31 @@ Same question?
     assert 'id="quiz-1-0"' in html_result  # First answer of second quiz
 
 
+def test_many_quizzes_and_code_blocks_substituted_in_order(
+    plugin: MkDocsQuizPlugin, mock_page: Page, mock_config: MkDocsConfig, mock_files: Files
+) -> None:
+    """Test that placeholders for many quizzes and code blocks are each restored once."""
+    sections = [
+        f"<quiz>\nQuestion {i}?\n- [x] Yes\n</quiz>\n\n```text\n__CODEBLOCK_{11 - i}__ block {i}\n```\n"
+        for i in range(12)
+    ]
+    markdown = "\n".join(sections)
+
+    result = plugin.on_page_markdown(markdown, mock_page, mock_config)
+    # Code blocks are restored verbatim, including text that looks like a placeholder
+    for i in range(12):
+        assert f"__CODEBLOCK_{11 - i}__ block {i}" in result
+
+    html_result = plugin.on_page_content(
+        result, page=mock_page, config=mock_config, files=mock_files
+    )
+    assert html_result is not None
+    assert "MKDOCS_QUIZ_PLACEHOLDER" not in html_result
+    positions = [html_result.index(f"Question {i}?") for i in range(12)]
+    assert positions == sorted(positions)
+    assert 'id="quiz-11"' in html_result
+
+
 def test_quiz_with_only_answers_no_question(
     plugin: MkDocsQuizPlugin, mock_page: Page, mock_config: MkDocsConfig, mock_files: Files
 ) -> None:
@@ -1938,3 +2117,49 @@ Question?
         match=r"Invalid checkbox format.*\[y\]",
     ):
         plugin.on_page_content(result, page=mock_page, config=mock_config, files=mock_files)
+
+
+def test_fragment_markdown_reused_across_quizzes_and_pages(
+    plugin: MkDocsQuizPlugin, mock_config: MkDocsConfig, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that one Markdown instance is built per config and rebound per page."""
+    from mkdocs.structure.files import File
+
+    def make_page(path: str) -> Page:
+        file = File(path=path, src_dir="docs", dest_dir="site", use_directory_urls=True)
+        page = Page(None, file, mock_config)
+        page.meta = {}
+        return page
+
+    target = File(path="target.md", src_dir="docs", dest_dir="site", use_directory_urls=True)
+    page_a = make_page("a.md")
+    page_b = make_page("sub/b.md")
+    files = Files([target, page_a.file, page_b.file])
+
+    created = []
+    original = plugin._create_fragment_markdown
+
+    def counting_create(*args: Any, **kwargs: Any) -> Any:
+        md_inst = original(*args, **kwargs)
+        created.append(md_inst)
+        return md_inst
+
+    monkeypatch.setattr(plugin, "_create_fragment_markdown", counting_create)
+
+    quiz = """
+<quiz>
+Where is the [target](LINK)?
+- [x] Here
+- [ ] There
+</quiz>
+"""
+    results = {}
+    for page, link in ((page_a, "target.md"), (page_b, "../target.md")):
+        markdown = plugin.on_page_markdown(quiz.replace("LINK", link) * 2, page, mock_config)
+        results[page.file.src_path] = plugin.on_page_content(
+            markdown, page=page, config=mock_config, files=files
+        )
+
+    assert len(created) == 1
+    assert 'href="../target/"' in results["a.md"]
+    assert 'href="../../target/"' in results["sub/b.md"]
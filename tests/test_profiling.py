@@ -0,0 +1,85 @@
+"""Tests for the build profiling report."""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+
+import pytest
+from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.structure.files import Files
+from mkdocs.structure.pages import Page
+
+from mkdocs_quiz.plugin import MkDocsQuizPlugin
+from mkdocs_quiz.translations import clear_translation_cache
+
+from .conftest import make_site
+
+PAGES = {
+    "index.md": "# Home\n",
+    "quiz.md": "<quiz>\nQuestion?\n- [x] Yes\n- [ ] No\n\nSome **explanation**.\n</quiz>\n",
+}
+
+
+def build_site(plugin: MkDocsQuizPlugin, config: MkDocsConfig, files: Files) -> None:
+    """Run the plugin hooks for every page like `mkdocs build`."""
+    plugin.on_config(config)
+    for file in files.documentation_pages():
+        page = Page(None, file, config)
+        page.read_source(config)
+        markdown = plugin.on_page_markdown(page.markdown or "", page, config)
+        plugin.on_page_content(markdown, page=page, config=config, files=files)
+    plugin.on_post_build(config)
+
+
+def test_profile_report(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Test that per-page timings and counters are written and summarized."""
+    config, files = make_site(tmp_path, PAGES)
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {"cache": False, "profile": True, "profile_report": "profile.json"}
+    clear_translation_cache()
+
+    with caplog.at_level(logging.INFO, logger="mkdocs.plugins.mkdocs_quiz"):
+        build_site(plugin, config, files)
+
+    report = json.loads((tmp_path / "profile.json").read_text(encoding="utf-8"))
+    assert report["quizzes"] == 1
+    assert report["pages_with_quizzes"] == 1
+    assert report["counters"]["quizzes_rendered"] == 1
+    # The question and content section are converted, the plain text answers escaped
+    assert report["counters"]["fragment_conversions"] == 2
+    assert report["counters"]["fragments_plain_text"] == 2
+    # Catalogs are read from disk once per language, not once per page
+    assert report["counters"]["translation_catalog_loads"] == 1
+
+    # Slowest pages first, with both hooks timed
+    pages = {page["src_uri"]: page for page in report["pages"]}
+    assert set(pages) == {"index.md", "quiz.md"}
+    assert pages["quiz.md"]["on_page_content"] > 0
+    assert pages["quiz.md"]["bytes_injected"] > 1000
+    assert pages["index.md"]["bytes_injected"] == 0
+    assert report["pages"][0]["src_uri"] == "quiz.md"
+
+    assert "Quiz plugin profile" in caplog.text
+    assert "quiz.md (1 quizzes)" in caplog.text
+
+    # A rebuild in the same process (`mkdocs serve`) reuses the loaded catalogs
+    build_site(plugin, config, files)
+    report = json.loads((tmp_path / "profile.json").read_text(encoding="utf-8"))
+    assert "translation_catalog_loads" not in report["counters"]
+
+
+def test_profile_enabled_by_environment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the environment variable enables profiling without config changes."""
+    config, files = make_site(tmp_path, PAGES)
+
+    monkeypatch.setenv("MKDOCS_QUIZ_PROFILE", "0")
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {"cache": False, "profile_report": "profile.json"}
+    build_site(plugin, config, files)
+    assert not (tmp_path / "profile.json").exists()
+
+    monkeypatch.setenv("MKDOCS_QUIZ_PROFILE", "1")
+    build_site(plugin, config, files)
+    assert (tmp_path / "profile.json").exists()
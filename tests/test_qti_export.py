@@ -266,6 +266,8 @@ Real question?
         quizzes = extract_quizzes_from_file(md_file)
         assert len(quizzes) == 1
         assert "Real question?" in quizzes[0].question
+        # Line numbers refer to the original file, not the text with code blocks masked
+        assert quizzes[0].source_line == 11
 
 
 class TestQTIVersion:
@@ -0,0 +1,104 @@
+"""Tests for the compiled page language resolution rules."""
+
+from __future__ import annotations
+
+import fnmatch
+from typing import Any
+
+import pytest
+from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.structure.files import File
+from mkdocs.structure.pages import Page
+
+from mkdocs_quiz.plugin import MkDocsQuizPlugin
+from mkdocs_quiz.routing import LanguageRoutes
+
+ALTERNATES: list[dict[str, Any]] = [
+    {"link": "/", "lang": "en"},
+    {"link": "/fr/", "lang": "fr"},
+    {"link": "/fr/ca/", "lang": "fr-CA"},
+    {"link": "/fr/", "lang": "ignored"},
+    {"link": "/de", "lang": "de"},
+    {"link": "/pt/", "lang": None},
+]
+
+PATTERNS: list[dict[str, Any]] = [
+    {"pattern": "", "language": "ignored"},
+    {"pattern": "es/**/*.md", "language": "es"},
+    {"pattern": "es/*", "language": "ignored"},
+    {"pattern": "*/ja-*/*.md", "language": "ja"},
+    {"pattern": "[kK]o/?.md", "language": "ko"},
+]
+
+
+def resolve_linearly(src_path: str, url: str, language: str | None = None) -> str:
+    """Resolve a page language by scanning every alternate and pattern."""
+    result = "en"
+    best = ""
+    for alt in ALTERNATES:
+        prefix = (alt.get("link") or "").lstrip("/")
+        if prefix and alt.get("lang") and url.startswith(prefix) and len(prefix) > len(best):
+            best, result = prefix, alt["lang"]
+    if language is not None:
+        result = language
+    for pattern_config in PATTERNS:
+        pattern = pattern_config["pattern"]
+        if pattern and fnmatch.fnmatch(src_path, pattern):
+            return str(pattern_config["language"])
+    return result
+
+
+@pytest.mark.parametrize(
+    ("src_path", "url"),
+    [
+        ("index.md", ""),
+        ("fr/index.md", "fr/"),
+        ("fr/ca/page.md", "fr/ca/page/"),
+        ("fr/cat.md", "fr/cat/"),
+        ("deutsch.md", "deutsch/"),
+        ("pt/page.md", "pt/page/"),
+        ("es/a/b/page.md", "es/a/b/page/"),
+        ("es/page.md", "es/page/"),
+        ("docs/ja-jp/page.md", "docs/ja-jp/page/"),
+        ("ko/a.md", "ko/a/"),
+        ("Ko/ab.md", "Ko/ab/"),
+    ],
+)
+@pytest.mark.parametrize("language", [None, "sv"])
+def test_routes_match_linear_resolution(src_path: str, url: str, language: str | None) -> None:
+    """Test that the trie and combined pattern give the same result as a linear scan."""
+    routes = LanguageRoutes("en", ALTERNATES, language, PATTERNS)
+    assert routes.resolve(src_path, url) == resolve_linearly(src_path, url, language)
+
+
+def test_routes_without_rules() -> None:
+    """Test that pages get the default language when no rules are configured."""
+    routes = LanguageRoutes("it")
+    assert routes.match_alternate("fr/") is None
+    assert routes.match_pattern("fr/index.md") is None
+    assert routes.resolve("fr/index.md", "fr/") == "it"
+
+
+def test_page_language_resolved_once_per_build(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the plugin compiles the rules once and remembers each page's language."""
+    config = MkDocsConfig()
+    config.extra = {"alternate": ALTERNATES}  # type: ignore[assignment]
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {"language_patterns": PATTERNS, "custom_translations": {}}
+
+    resolved: list[str] = []
+    original = LanguageRoutes.resolve
+
+    def counting_resolve(self: LanguageRoutes, src_path: str, url: str) -> Any:
+        resolved.append(src_path)
+        return original(self, src_path, url)
+
+    monkeypatch.setattr(LanguageRoutes, "resolve", counting_resolve)
+
+    file = File(path="fr/page.md", src_dir="docs", dest_dir="site", use_directory_urls=True)
+    page = Page(None, file, config)
+    page.meta = {}
+    assert plugin._get_translation_manager(page, config).language == "fr"
+    page.meta = {"quiz": {"language": "de"}}
+    assert plugin._get_translation_manager(page, config).language == "de"
+    assert resolved == ["fr/page.md"]
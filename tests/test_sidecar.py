@@ -0,0 +1,102 @@
+"""Tests for quiz source sidecar files."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from mkdocs.structure.pages import Page
+
+from mkdocs_quiz.cli.fetcher import fetch_quizzes
+from mkdocs_quiz.plugin import MkDocsQuizPlugin
+from mkdocs_quiz.sidecar import SIDECAR_LINK_REGEX, decode_sources, encode_sources
+
+from .conftest import make_site
+
+QUIZZES = """<quiz>
+What is 2+2?
+- [x] 4
+- [ ] 5
+</quiz>
+
+<quiz>
+The capital of France is [[Paris]].
+</quiz>"""
+
+
+def build_page(tmp_path: Path, **options: object) -> tuple[str, Path]:
+    """Build a page with two quizzes and return its HTML and the site directory."""
+    config, files = make_site(tmp_path, {"guide/page.md": QUIZZES})
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {"cache": False, **options}
+    plugin.on_config(config)
+    page = Page(None, files.documentation_pages()[0], config)
+    page.read_source(config)
+    markdown = plugin.on_page_markdown(page.markdown or "", page, config)
+    html = plugin.on_page_content(markdown, page=page, config=config, files=files)
+    assert html is not None
+    plugin.on_post_build(config)
+    return html, Path(config.site_dir)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_sources_are_written_to_sidecar_file(tmp_path: Path, compress: bool) -> None:
+    """Test that sidecar mode links a source file instead of embedding comments."""
+    html, site_dir = build_page(tmp_path, source_storage="sidecar", source_compress=compress)
+
+    assert "mkdocs-quiz-source\n" not in html
+    link = SIDECAR_LINK_REGEX.search(html)
+    assert link is not None
+    assert link.group(1) == "index.quiz-sources.json" + (".gz" if compress else "")
+
+    content = (site_dir / "guide" / "page" / link.group(1)).read_bytes()
+    assert content.startswith(b"\x1f\x8b") == compress
+    assert decode_sources(content) == QUIZZES.split("\n\n")
+
+
+def test_sidecar_needs_embed_source(tmp_path: Path) -> None:
+    """Test that nothing is published when embed_source is disabled."""
+    html, site_dir = build_page(tmp_path, embed_source=False, source_storage="sidecar")
+
+    assert SIDECAR_LINK_REGEX.search(html) is None
+    assert not list(site_dir.rglob("*.quiz-sources.json"))
+
+
+def test_compressed_sidecar_is_reproducible() -> None:
+    """Test that compressed source files don't change between builds."""
+    assert encode_sources(["<quiz>a</quiz>"], compress=True) == encode_sources(
+        ["<quiz>a</quiz>"], compress=True
+    )
+    with pytest.raises(ValueError, match="Unsupported quiz source file version"):
+        decode_sources(b'{"version": 99, "sources": []}')
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_fetcher_follows_sidecar_link(tmp_path: Path, compress: bool) -> None:
+    """Test that the CLI fetches quizzes from the source file a page links to."""
+    html, site_dir = build_page(tmp_path, source_storage="sidecar", source_compress=compress)
+    requested = []
+
+    def get(url: str, timeout: int) -> MagicMock:
+        requested.append(url)
+        response = MagicMock()
+        if url.endswith("/"):
+            response.text = html
+        else:
+            path = url.removeprefix("https://example.com/")
+            response.content = (site_dir / path).read_bytes()
+        return response
+
+    with patch("mkdocs_quiz.cli.fetcher.requests.get", side_effect=get):
+        quizzes = fetch_quizzes("https://example.com/guide/page/")
+
+    suffix = ".gz" if compress else ""
+    assert requested == [
+        "https://example.com/guide/page/",
+        f"https://example.com/guide/page/index.quiz-sources.json{suffix}",
+    ]
+    assert [quiz.question for quiz in quizzes] == [
+        "What is 2+2?",
+        "The capital of France is [[Paris]].",
+    ]
@@ -0,0 +1,129 @@
+"""Tests for the compiled HTML templates of quiz markup."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from mkdocs.exceptions import PluginError
+from mkdocs.structure.pages import Page
+
+from mkdocs_quiz.plugin import MkDocsQuizPlugin
+from mkdocs_quiz.templates import DEFAULT_TEMPLATES, QuizTemplate, compile_templates
+from mkdocs_quiz.translations import TranslationManager
+
+from .conftest import make_site
+
+QUIZ = """
+<quiz>
+What is 2+2?
+- [x] 4
+- [ ] 5
+</quiz>
+"""
+
+
+def test_template_compiles_placeholders() -> None:
+    """Test that placeholders are replaced and other braces are kept as they are."""
+    template = QuizTemplate(
+        "answer",
+        """
+        <div style="--x: {{ a }}">
+            {{a}} {b} {{ c }}
+        </div>
+        """,
+    )
+    assert template.fields == {"a", "c"}
+    assert template.render(a="A", c="{c}") == '<div style="--x: A">\n    A {b} {c}\n</div>'
+
+
+def test_default_templates_render_quiz_markup(tmp_path: Path) -> None:
+    """Test that quizzes, results, intro and sidebar are rendered from the default templates."""
+    config, files = make_site(tmp_path, {"index.md": QUIZ})
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {"cache": False}
+    page = Page(None, files.documentation_pages()[0], config)
+    t = TranslationManager("en")
+
+    quiz_html = plugin._process_quiz(
+        QUIZ, 0, plugin._get_quiz_options(page), t, config, page, files
+    )
+    assert quiz_html.startswith('<div class="quiz" data-show-correct="true"')
+    assert '<label for="quiz-0-0">4</label>' in quiz_html
+    assert '<input type="radio" name="answer" value="1" id="quiz-0-1" >' in quiz_html
+
+    blank_html = plugin._process_quiz(
+        "The capital of France is [[Paris]].",
+        1,
+        plugin._get_quiz_options(page),
+        t,
+        config,
+        page,
+        files,
+    )
+    assert 'data-answer="Paris" autocomplete="off" size="7" aria-label="Answer"' in blank_html
+    assert '<button type="submit" class="quiz-button">Submit</button>' in blank_html
+
+    assert plugin._generate_results_html(t).startswith('<div id="quiz-results"')
+    assert plugin._generate_intro_html(t).startswith('<div class="quiz-intro">')
+    assert plugin._get_quiz_progress_sidebar_html(t).endswith("</nav>")
+
+
+def test_templates_can_be_overridden(tmp_path: Path) -> None:
+    """Test that a template file from the `templates` option replaces the default markup."""
+    config, files = make_site(tmp_path, {"index.md": QUIZ})
+    (tmp_path / "overrides").mkdir()
+    (tmp_path / "overrides" / "answer.html").write_text(
+        '<p class="my-answer"><input type="{{ input_type }}" id="{{ id }}" {{ correct_attr }}>'
+        '<label for="{{ id }}">{{ label }}</label></p>\n',
+        encoding="utf-8",
+    )
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {"cache": False, "templates": {"answer": "overrides/answer.html"}}
+    plugin.on_config(config)
+    page = Page(None, files.documentation_pages()[0], config)
+    t = TranslationManager("en")
+
+    quiz_html = plugin._process_quiz(
+        QUIZ, 0, plugin._get_quiz_options(page), t, config, page, files
+    )
+    assert (
+        '<p class="my-answer"><input type="radio" id="quiz-0-0" data-correct="true">' in quiz_html
+    )
+    assert '<div class="quiz"' in quiz_html
+
+
+def test_overridden_templates_change_cache_keys(tmp_path: Path) -> None:
+    """Test that cached quizzes aren't reused after a template changes."""
+    config, files = make_site(tmp_path, {"index.md": QUIZ})
+    (tmp_path / "intro.html").write_text("<p>{{ intro_text }}</p>", encoding="utf-8")
+    page = Page(None, files.documentation_pages()[0], config)
+    t = TranslationManager("en")
+
+    keys = []
+    for templates in ({}, {"intro": "intro.html"}):
+        plugin = MkDocsQuizPlugin()
+        plugin.config = {"cache": False, "templates": templates}
+        plugin.on_config(config)
+        options = plugin._get_quiz_options(page)
+        keys.append(plugin._quiz_cache_key(QUIZ, 0, options, t, config, page, files))
+    assert keys[0] != keys[1]
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"quizz": "quiz.html"}, "Unknown quiz template 'quizz'"),
+        ({"quiz": "missing.html"}, "Could not read quiz template 'quiz'"),
+        ({"intro": "intro.html"}, "uses unknown placeholders: reset"),
+    ],
+)
+def test_invalid_template_overrides(
+    tmp_path: Path, overrides: dict[str, str], message: str
+) -> None:
+    """Test that unknown templates, missing files and unknown placeholders are reported."""
+    (tmp_path / "intro.html").write_text("<p>{{ intro_text }} {{ reset }}</p>", encoding="utf-8")
+    assert set(DEFAULT_TEMPLATES) == set(compile_templates())
+
+    with pytest.raises(PluginError, match=message):
+        compile_templates(overrides, tmp_path)
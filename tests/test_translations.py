@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import json
+import os
+import re
+import shutil
+import sys
 import tempfile
 from collections.abc import Generator
 from pathlib import Path
@@ -11,8 +16,17 @@ from mkdocs.config.defaults import MkDocsConfig
 from mkdocs.structure.files import File, Files
 from mkdocs.structure.pages import Page
 
+from mkdocs_quiz import translations as translations_module
 from mkdocs_quiz.plugin import MkDocsQuizPlugin
-from mkdocs_quiz.translations import TranslationManager
+from mkdocs_quiz.translations import (
+    LOCALES_DIR,
+    TranslationManager,
+    clear_translation_cache,
+    compile_catalog,
+    compiled_catalog_path,
+    load_compiled_catalog,
+    write_compiled_catalog,
+)
 
 
 @pytest.fixture
@@ -125,6 +139,85 @@ def test_translation_manager_to_dict() -> None:
     assert t_en.to_dict() == {}
 
 
+def test_translation_catalogs_parsed_once_per_process(
+    temp_po_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that repeated managers reuse cached catalogs instead of reparsing .po files."""
+    clear_translation_cache()
+    parsed: list[Path] = []
+    original = TranslationManager._parse_po_file
+
+    def counting_parse(self: TranslationManager, po_path: Path) -> dict[str, str]:
+        parsed.append(po_path)
+        return original(self, po_path)
+
+    monkeypatch.setattr(TranslationManager, "_parse_po_file", counting_parse)
+
+    for _ in range(5):
+        t = TranslationManager(language="fr", custom_path=temp_po_file)
+        assert t.get("Submit") == "Soumettre"
+
+    # The built-in French catalog is precompiled, only the custom file is parsed
+    assert parsed == [temp_po_file]
+
+
+@pytest.mark.parametrize("po_file", sorted(LOCALES_DIR.glob("*.po")), ids=lambda path: path.stem)
+def test_compiled_catalogs_are_up_to_date(po_file: Path) -> None:
+    """Test that each built-in .po file has a compiled catalog matching it."""
+    catalog_file = compiled_catalog_path(po_file)
+    assert catalog_file.exists(), "Run 'mkdocs-quiz translations compile'"
+    assert json.loads(catalog_file.read_text(encoding="utf-8")) == compile_catalog(po_file), (
+        "Run 'mkdocs-quiz translations compile'"
+    )
+
+
+def test_builtin_translations_load_without_polib(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that built-in languages don't need the .po parser."""
+    clear_translation_cache()
+    monkeypatch.setitem(sys.modules, "polib", None)
+    t = TranslationManager(language="fr")
+    assert t.get("Submit") == "Soumettre"
+    clear_translation_cache()
+
+
+def test_stale_compiled_catalog_is_ignored(tmp_path: Path, temp_po_file: Path) -> None:
+    """Test that a compiled catalog no longer matching its .po file isn't used."""
+    po_file = tmp_path / "fr.po"
+    shutil.copy(temp_po_file, po_file)
+    assert load_compiled_catalog(po_file) is None
+
+    write_compiled_catalog(po_file)
+    assert load_compiled_catalog(po_file) == {
+        "Submit": "Soumettre",
+        "Correct answer!": "Bonne réponse!",
+        "Question {n}": "Question {n}",
+    }
+
+    po_file.write_text(
+        po_file.read_text(encoding="utf-8").replace("Soumettre", "Envoyer"), encoding="utf-8"
+    )
+    assert load_compiled_catalog(po_file) is None
+
+
+def test_translation_cache_invalidated_when_file_changes(temp_po_file: Path) -> None:
+    """Test that editing a custom .po file is picked up by the next manager."""
+    clear_translation_cache()
+    assert TranslationManager(language="en", custom_path=temp_po_file).get("Submit") == (
+        "Soumettre"
+    )
+
+    temp_po_file.write_text(
+        temp_po_file.read_text(encoding="utf-8").replace("Soumettre", "Envoyer"),
+        encoding="utf-8",
+    )
+    stat = temp_po_file.stat()
+    os.utime(temp_po_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert TranslationManager(language="en", custom_path=temp_po_file).get("Submit") == "Envoyer"
+    # The edited catalog replaces the old one instead of adding an entry
+    assert len(translations_module._catalog_cache) == 1
+
+
 def test_plugin_translation_injection(mock_config: MkDocsConfig, mock_files: Files) -> None:
     """Test that translations are injected into HTML."""
     plugin = MkDocsQuizPlugin()
@@ -170,6 +263,43 @@ What is 2+2?
     assert "Soumettre" in html_result
 
 
+def test_external_translations_written_once_per_language(
+    mock_config: MkDocsConfig, mock_files: Files, tmp_path: Path
+) -> None:
+    """Test that `assets: external` links one translation file per language."""
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {
+        "cache": False,
+        "assets": "external",
+        "language_patterns": [{"pattern": "fr/*", "language": "fr"}],
+    }
+    mock_config["site_dir"] = str(tmp_path)
+    plugin.on_config(mock_config)
+
+    scripts = {}
+    for path in ("fr/a.md", "fr/b.md", "en.md"):
+        file = File(path=path, src_dir="docs", dest_dir="site", use_directory_urls=True)
+        page = Page(None, file, mock_config)
+        page.meta = {}
+        markdown = plugin.on_page_markdown("<quiz>\nQ?\n- [x] Yes\n</quiz>", page, mock_config)
+        html = plugin.on_page_content(markdown, page=page, config=mock_config, files=mock_files)
+        assert html is not None
+        assert "mkdocsQuizTranslations" not in html
+        match = re.search(r'src="[./]*(assets/mkdocs-quiz/quiz-i18n\.[^"]+)"', html)
+        assert match is not None
+        scripts[path] = match.group(1)
+
+    assert scripts["fr/a.md"] == scripts["fr/b.md"]
+    assert scripts["fr/a.md"].startswith("assets/mkdocs-quiz/quiz-i18n.fr.")
+    assert scripts["en.md"].startswith("assets/mkdocs-quiz/quiz-i18n.en.")
+
+    plugin.on_post_build(mock_config)
+    fr_script = (tmp_path / scripts["fr/a.md"]).read_text(encoding="utf-8")
+    assert fr_script.startswith("window.mkdocsQuizTranslations = {")
+    assert '"Submit": "Soumettre"' in fr_script
+    assert len(list((tmp_path / "assets").rglob("quiz-i18n.*.js"))) == 2
+
+
 def test_plugin_per_page_language(mock_config: MkDocsConfig) -> None:
     """Test per-page language override."""
     plugin = MkDocsQuizPlugin()
@@ -0,0 +1,134 @@
+"""Tests for the site-wide quiz triage index."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.plugins import BasePlugin
+from mkdocs.structure.pages import Page
+
+from mkdocs_quiz import plugin as plugin_module
+from mkdocs_quiz import triage
+from mkdocs_quiz.plugin import MkDocsQuizPlugin
+
+from .conftest import make_site
+
+PAGES = {
+    "index.md": "# Home\n\nNo quizzes here.\n",
+    "quiz.md": "<quiz>\nQuestion?\n- [x] Yes\n</quiz>\n",
+    "results.md": "<!-- mkdocs-quiz results -->\n",
+    "legacy.md": "<?quiz?>\nquestion: Old?\n<?/quiz?>\n",
+}
+
+
+@pytest.fixture(autouse=True)
+def clean_index() -> Iterator[None]:
+    """Start every test with an empty process-wide index."""
+    triage.clear_triage_index()
+    yield
+    triage.clear_triage_index()
+
+
+def test_triage_detects_quiz_markup(tmp_path: Path) -> None:
+    """Test that pages are classified by quizzes, markers and old syntax."""
+    _config, files = make_site(tmp_path, PAGES)
+    assert triage.triage_pages(files) == {
+        "index.md": False,
+        "quiz.md": True,
+        "results.md": True,
+        "legacy.md": True,
+    }
+
+
+def test_triage_rereads_only_changed_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that unchanged files are served from the index on the next build."""
+    _config, files = make_site(tmp_path, PAGES)
+    triage.triage_pages(files)
+
+    scanned: list[str] = []
+    original = triage._scan_file
+
+    def counting_scan_file(path: str, mtime_ns: int, size: int) -> triage._IndexEntry | None:
+        scanned.append(Path(path).name)
+        return original(path, mtime_ns, size)
+
+    monkeypatch.setattr(triage, "_scan_file", counting_scan_file)
+    assert triage.triage_pages(files)["index.md"] is False
+    assert scanned == []
+
+    index_md = tmp_path / "docs" / "index.md"
+    index_md.write_text("# Home\n\n<quiz>\nNew?\n- [x] Yes\n</quiz>\n", encoding="utf-8")
+    os.utime(index_md, ns=(1, 1))
+    assert triage.triage_pages(files)["index.md"] is True
+    assert scanned == ["index.md"]
+
+
+class SourcePlugin(BasePlugin):  # type: ignore[type-arg]
+    """A plugin supplying page sources that aren't on disk."""
+
+    def on_page_read_source(self, *, page: Page, config: MkDocsConfig) -> str | None:
+        if page.file.src_uri == "index.md":
+            return "# Home\n\n<quiz>\nFrom a plugin?\n- [x] Yes\n</quiz>\n"
+        return None
+
+
+def test_plugin_skips_pages_without_quiz_markup(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that quiz-free pages are not scanned, judging by the markdown they're built from."""
+    config, files = make_site(tmp_path, PAGES)
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {"cache": False}
+    plugin.on_config(config)
+    plugin.on_files(files, config=config)
+    assert plugin._triage == {}
+
+    scanned: list[str] = []
+    original = plugin_module.scan_markdown
+
+    def counting_scan_markdown(markdown: str) -> plugin_module.MarkdownScan:
+        scanned.append(markdown)
+        return original(markdown)
+
+    monkeypatch.setattr(plugin_module, "scan_markdown", counting_scan_markdown)
+
+    file = files.get_file_from_path("index.md")
+    assert file is not None
+    page = Page(None, file, config)
+    page.read_source(config)
+    assert page.markdown is not None
+    assert plugin.on_page_markdown(page.markdown, page, config) is page.markdown
+    assert scanned == []
+
+    # Markdown rewritten by an earlier plugin is processed
+    changed = page.markdown + "\n<quiz>\nAdded?\n- [x] Yes\n</quiz>\n"
+    assert "MKDOCS_QUIZ_PLACEHOLDER_0" in plugin.on_page_markdown(changed, page, config)
+    assert scanned == [changed]
+
+
+def test_plugin_processes_sources_supplied_by_other_plugins(tmp_path: Path) -> None:
+    """Test that quizzes only in a source supplied by another plugin are rendered."""
+    config, files = make_site(tmp_path, PAGES)
+    config.plugins["source"] = SourcePlugin()
+    plugin = MkDocsQuizPlugin()
+    plugin.config = {"cache": False, "parallel": True}
+    plugin.on_config(config)
+    plugin.on_files(files, config=config)
+    # The file on disk has no quizzes
+    assert plugin._triage["index.md"] is False
+
+    file = files.get_file_from_path("index.md")
+    assert file is not None
+    page = Page(None, file, config)
+    page.read_source(config)
+    assert page.markdown is not None
+    markdown = plugin.on_page_markdown(page.markdown, page, config)
+    assert "MKDOCS_QUIZ_PLACEHOLDER_0" in markdown
+    html = plugin.on_page_content(markdown, page=page, config=config, files=files)
+    assert html is not None
+    assert "From a plugin?" in html
+    assert "MKDOCS_QUIZ_PLACEHOLDER" not in html